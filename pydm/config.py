@@ -16,6 +16,32 @@ STYLESHEET_INCLUDE_DEFAULT = os.getenv("PYDM_STYLESHEET_INCLUDE_DEFAULT", False)
 
 CONFIRM_QUIT = os.getenv("PYDM_CONFIRM_QUIT", "n").lower() in ("y", "t", "1", "true")
 
+# Whether an alarm severity change re-polishes the style of every descendant of the widget, instead of only the
+# widget itself and the children it styles. Only needed for stylesheets whose selectors style descendants on the
+# alarm properties of an ancestor.
+ALARM_STYLE_RECURSIVE = os.getenv("PYDM_ALARM_STYLE_RECURSIVE", "n").lower() in ("y", "t", "1", "true")
+
+# Maximum rate (in Hz) at which new values of a channel are delivered to its widgets. Faster updates are
+# coalesced so that only the latest value is delivered. Unset or 0 delivers every update as it arrives.
+MAX_UPDATE_RATE = float(os.getenv("PYDM_MAX_UPDATE_RATE", 0) or 0)
+
+# Directory in which data retrieved from the archiver appliance is cached. Unset disables the cache.
+ARCHIVER_CACHE_DIR = os.getenv("PYDM_ARCHIVER_CACHE_DIR")
+
+# Maximum size (in MB) of the archiver data cache, the least recently used data is removed past it
+ARCHIVER_CACHE_SIZE = float(os.getenv("PYDM_ARCHIVER_CACHE_SIZE", 512) or 512)
+
+# Maximum size (in MB) of the images cached for, and shared between, the widgets displaying image files
+IMAGE_CACHE_SIZE = float(os.getenv("PYDM_IMAGE_CACHE_SIZE", 128) or 128)
+
+# How EPICS plugins decide whether a value received from a monitor differs from the previous one: "always",
+# "timestamp", "hash" or "exact". Unset compares arrays by timestamp and scalars exactly.
+CHANGE_DETECTION = os.getenv("PYDM_CHANGE_DETECTION", "").lower() or None
+
+# Number of threads decoding compressed NTNDArray frames received over PVAccess, each frame being split over
+# several threads by the codecs supporting it
+PVA_DECODE_THREADS = max(int(os.getenv("PYDM_PVA_DECODE_THREADS", 0) or 0), 0) or min(os.cpu_count() or 1, 4)
+
 # Environment variable pointing to a pydm display to return to when the home button is clicked
 HOME_FILE = os.getenv("PYDM_HOME_FILE")
 
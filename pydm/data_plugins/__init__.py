@@ -7,6 +7,7 @@ classes that inherits from the pydm.data_plugins.PyDMPlugin class.
 import inspect
 import logging
 import os
+import time
 from collections import deque
 from contextlib import contextmanager
 from typing import Any, Dict, Generator, List, Optional, Type
@@ -27,6 +28,11 @@ global __DEFER_CONNECTIONS__
 __DEFER_CONNECTIONS__ = False
 __plugins_initialized = False
 
+# Number of queued channels handed to a plugin at once by establish_queued_connections
+CONNECTION_BATCH_SIZE = 250
+# Maximum time, in seconds, establish_queued_connections runs before processing pending GUI events
+CONNECTION_EVENT_INTERVAL = 0.05
+
 
 @contextmanager
 def connection_queue(defer_connections=False):
@@ -47,10 +53,28 @@ def establish_queued_connections():
     if __CONNECTION_QUEUE__ is None:
         return
     try:
+        last_events = time.monotonic()
         while __CONNECTION_QUEUE__ is not None and len(__CONNECTION_QUEUE__) > 0:
-            channel = __CONNECTION_QUEUE__.popleft()
-            establish_connection_immediately(channel)
+            # Group the queued channels by plugin so that each plugin can connect them in bulk
+            channels_by_plugin = {}
+            while len(__CONNECTION_QUEUE__) > 0:
+                channel = __CONNECTION_QUEUE__.popleft()
+                plugin = plugin_for_address(channel.address)
+                if plugin is None:
+                    logger.error("No data plugin found for channel %r, it will not be connected", channel)
+                    continue
+                channels_by_plugin.setdefault(plugin, []).append(channel)
+
+            for plugin, channels in channels_by_plugin.items():
+                for start in range(0, len(channels), CONNECTION_BATCH_SIZE):
+                    plugin.add_connections(channels[start : start + CONNECTION_BATCH_SIZE])
+                    # Keep the GUI responsive without paying for an event loop pass after every channel
+                    if time.monotonic() - last_events >= CONNECTION_EVENT_INTERVAL:
+                        QApplication.instance().processEvents()
+                        last_events = time.monotonic()
+            # Run the event loop at least once per batch, which may also queue up more channels
             QApplication.instance().processEvents()
+            last_events = time.monotonic()
     except IndexError:
         pass
     finally:
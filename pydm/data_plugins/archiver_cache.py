@@ -0,0 +1,279 @@
+"""
+Persistent on-disk cache of data retrieved from the Archiver Appliance.
+
+Retrievals are split into fixed-size time tiles, stored per PV and per
+processing command as numpy ``.npy`` files, and memory-mapped back when a
+later request is fully covered by cached tiles. As in the replies of the
+appliance, each tile starts with the last sample before it, so that the value
+at the start of any range is known. Only tiles that ended a while
+ago are stored, since the appliance may still be receiving data for recent
+ones. The total size of the cache is bounded, with the least recently used
+tiles evicted first.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+
+from pydm import config
+
+logger = logging.getLogger(__name__)
+
+# Length of the time span covered by each tile, in seconds
+TILE_SECONDS = 3600
+
+# Tiles that ended less than this many seconds ago may still change on the appliance, so they are never stored
+SETTLE_SECONDS = 300
+
+# Version of the layout of the tiles, tiles stored with another layout are never read
+TILE_FORMAT = 2
+
+# Processing commands whose results only depend on the time of each bin, so they can be split into tiles.
+# Commands like optimized_N depend on the whole requested range and are never cached.
+_BINNED_COMMAND_RE = re.compile(
+    r"^(mean|median|std|variance|popvariance|min|max|count|ncount|firstSample|lastSample)_(\d+)$"
+)
+
+
+def is_cacheable(processing_command: Optional[str]) -> bool:
+    """
+    Returns True if the data retrieved with the given processing command can be stored in tiles.
+
+    Parameters
+    ----------
+    processing_command : str, optional
+        The processing command of the request, None or empty for raw data.
+
+    Returns
+    -------
+    bool
+    """
+    if not processing_command:
+        return True
+    match = _BINNED_COMMAND_RE.match(processing_command)
+    return match is not None and 0 < int(match.group(2)) and TILE_SECONDS % int(match.group(2)) == 0
+
+
+def tile_bounds(from_date: float, to_date: float):
+    """
+    Returns the range covered by the tiles that overlap [from_date, to_date].
+
+    Returns
+    -------
+    tuple
+        The start of the first tile and the end of the last tile, as timestamps.
+    """
+    first = int(from_date // TILE_SECONDS)
+    last = int(to_date // TILE_SECONDS)
+    return first * TILE_SECONDS, (last + 1) * TILE_SECONDS
+
+
+def trim(data: np.ndarray, from_date: float, to_date: float) -> np.ndarray:
+    """
+    Returns the columns of data within [from_date, to_date]. As the appliance does, the last
+    point before from_date is kept so that the value at the start of the range is known.
+    """
+    timestamps = data[0]
+    start = max(np.searchsorted(timestamps, from_date, side="right") - 1, 0)
+    end = np.searchsorted(timestamps, to_date, side="right")
+    return data[:, start:end]
+
+
+class ArchiverTileCache(object):
+    """
+    Least recently used cache of archiver data tiles stored under a directory.
+
+    Parameters
+    ----------
+    directory : str
+        The directory holding the tiles, created if it does not exist.
+    max_bytes : int
+        The total size the tiles are allowed to take up on disk.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # Path of every tile to its size in bytes, from least to most recently used
+        self._tiles = OrderedDict()
+        self._total_bytes = 0
+        os.makedirs(directory, exist_ok=True)
+        self._scan()
+
+    def _scan(self) -> None:
+        """Index the tiles left by previous sessions, using their modification time as the last use."""
+        found = []
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                path = os.path.join(root, name)
+                if not name.endswith(".npy"):
+                    continue
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                found.append((stat.st_mtime, path, stat.st_size))
+        for _, path, size in sorted(found):
+            self._tiles[path] = size
+            self._total_bytes += size
+
+    def _tile_path(self, key: str, tile: int) -> str:
+        digest = hashlib.sha1(f"{TILE_FORMAT}|{key}".encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest, f"{tile}.npy")
+
+    def load(self, key: str, from_date: float, to_date: float) -> Optional[np.ndarray]:
+        """
+        Returns the cached data for [from_date, to_date], or None unless every tile of the range is cached.
+
+        Parameters
+        ----------
+        key : str
+            Identifies the PV, processing command and appliance the data was retrieved from.
+        from_date : float
+            Timestamp for the oldest data point to retrieve
+        to_date : float
+            Timestamp for the newest data point to retrieve
+
+        Returns
+        -------
+        np.ndarray or None
+        """
+        first, last = tile_bounds(from_date, to_date)
+        paths = [self._tile_path(key, tile) for tile in range(first // TILE_SECONDS, last // TILE_SECONDS)]
+        with self._lock:
+            if not all(path in self._tiles for path in paths):
+                self.misses += 1
+                return None
+            for path in paths:
+                self._tiles.move_to_end(path)
+        try:
+            tiles = [np.load(path, mmap_mode="r") for path in paths]
+        except (OSError, ValueError):
+            logger.debug("Unable to read archiver cache tiles for %s", key, exc_info=True)
+            with self._lock:
+                self.misses += 1
+            return None
+        # Each tile starts with the last sample before it, which only the first tile of the range needs
+        tiles[1:] = [
+            tile_data[:, np.searchsorted(tile_data[0], first + index * TILE_SECONDS) :]
+            for index, tile_data in enumerate(tiles[1:], start=1)
+        ]
+        now = time.time()
+        for path in paths:
+            try:
+                os.utime(path, (now, now))
+            except OSError:
+                pass
+        with self._lock:
+            self.hits += 1
+        return trim(np.concatenate(tiles, axis=1), from_date, to_date)
+
+    def store(self, key: str, from_date: float, to_date: float, data: np.ndarray) -> None:
+        """
+        Stores the tiles fully covered by data retrieved for [from_date, to_date]. Each tile keeps the last
+        sample before its start, and tiles for which there is none, so that their value at the start is
+        unknown, are not stored.
+
+        Parameters
+        ----------
+        key : str
+            Identifies the PV, processing command and appliance the data was retrieved from.
+        from_date : float
+            Timestamp of the start of the retrieved range
+        to_date : float
+            Timestamp of the end of the retrieved range
+        data : np.ndarray
+            The retrieved data, with timestamps in its first row
+        """
+        if data.ndim != 2 or data.dtype.kind not in "fiu":
+            return
+        settled = time.time() - SETTLE_SECONDS
+        timestamps = data[0]
+        tile = int(-(-from_date // TILE_SECONDS))
+        while (tile + 1) * TILE_SECONDS <= min(to_date, settled):
+            start, end = np.searchsorted(timestamps, (tile * TILE_SECONDS, (tile + 1) * TILE_SECONDS))
+            if start > 0:
+                start -= 1
+            elif end == 0 or timestamps[0] > tile * TILE_SECONDS:
+                tile += 1
+                continue
+            self._write(self._tile_path(key, tile), np.ascontiguousarray(data[:, start:end]))
+            tile += 1
+        self._evict()
+
+    def _write(self, path: str, tile_data: np.ndarray) -> None:
+        temporary_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(temporary_path, "wb") as tile_file:
+                np.save(tile_file, tile_data)
+            os.replace(temporary_path, path)
+        except OSError:
+            logger.debug("Unable to write archiver cache tile %s", path, exc_info=True)
+            return
+        size = os.path.getsize(path)
+        with self._lock:
+            self._total_bytes += size - self._tiles.pop(path, 0)
+            self._tiles[path] = size
+
+    def _evict(self) -> None:
+        """Remove the least recently used tiles until the cache fits in its size limit."""
+        with self._lock:
+            evicted = []
+            while self._tiles and self._total_bytes > self.max_bytes:
+                path, size = self._tiles.popitem(last=False)
+                self._total_bytes -= size
+                evicted.append(path)
+        for path in evicted:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        """Remove every tile from the cache."""
+        with self._lock:
+            self._total_bytes = 0
+            paths = list(self._tiles)
+            self._tiles.clear()
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    @property
+    def size(self) -> int:
+        """The total size of the cached tiles, in bytes."""
+        return self._total_bytes
+
+
+_tile_cache = None
+_tile_cache_lock = threading.Lock()
+
+
+def tile_cache() -> Optional[ArchiverTileCache]:
+    """
+    Returns the tile cache shared by all archiver connections, or None if no cache directory is configured.
+    """
+    global _tile_cache
+    if not config.ARCHIVER_CACHE_DIR:
+        return None
+    with _tile_cache_lock:
+        if _tile_cache is None or _tile_cache.directory != config.ARCHIVER_CACHE_DIR:
+            try:
+                _tile_cache = ArchiverTileCache(config.ARCHIVER_CACHE_DIR, int(config.ARCHIVER_CACHE_SIZE * 1024**2))
+            except OSError:
+                logger.warning("Unable to use %s as the archiver cache directory", config.ARCHIVER_CACHE_DIR)
+                return None
+        return _tile_cache
@@ -0,0 +1,197 @@
+"""
+Decoders for the responses of the Archiver Appliance retrieval service.
+
+Both decoders return the data as numpy arrays in the layout expected by the
+archiver plugin: shape (2, data_length) with timestamps and values for raw
+data, or shape (5, data_length) with timestamps, mean values, standard
+deviations, minimums and maximums for optimized data.
+"""
+
+import json
+import logging
+import struct
+from datetime import datetime, timezone
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:
+    logger.debug("orjson not available, archiver responses will be decoded with the json module")
+    json_loads = json.loads
+
+
+def decode_json(payload: bytes, optimized: bool = False) -> np.ndarray:
+    """
+    Decode a response of the JSON retrieval format (getData.json).
+
+    Parameters
+    ----------
+    payload : bytes
+        The body of the response.
+    optimized : bool, optional
+        True if optimized (binned) data was requested. If the appliance fell back
+        to sending raw data, the raw layout is returned instead.
+
+    Returns
+    -------
+    np.ndarray
+    """
+    points = json_loads(payload)[0]["data"]
+    num_points = len(points)
+    timestamps = np.fromiter((point["secs"] for point in points), dtype=float, count=num_points)
+
+    if optimized:
+        values = np.array([point["val"] for point in points], dtype=object)
+        # The archiver will fall back to sending raw data if the optimized request is for more data points
+        # than are in the bin, in which case each value is a scalar instead of a list of statistics
+        if num_points and values.ndim == 2 and values.shape[1] >= 4:
+            return np.vstack((timestamps, values[:, :4].astype(float).T))
+
+    try:
+        values = np.fromiter((point["val"] for point in points), dtype=float, count=num_points)
+    except (TypeError, ValueError):
+        # Non-numeric data (e.g. strings), let numpy pick a type for it
+        return np.array((timestamps, [point["val"] for point in points]))
+    return np.vstack((timestamps, values))
+
+
+# Payload types of the protocol buffer retrieval format, see EPICSEvent.proto in the archiver appliance sources
+SCALAR_SHORT = 1
+SCALAR_FLOAT = 2
+SCALAR_ENUM = 3
+SCALAR_BYTE = 4
+SCALAR_INT = 5
+SCALAR_DOUBLE = 6
+WAVEFORM_FLOAT = 9
+WAVEFORM_INT = 12
+WAVEFORM_DOUBLE = 13
+
+_WAVEFORM_DTYPES = {WAVEFORM_FLOAT: "<f4", WAVEFORM_INT: "<i4", WAVEFORM_DOUBLE: "<f8"}
+
+_double = struct.Struct("<d")
+_float = struct.Struct("<f")
+_int = struct.Struct("<i")
+
+
+def _read_varint(buffer: bytes, position: int):
+    result = 0
+    shift = 0
+    while True:
+        byte = buffer[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, position
+        shift += 7
+
+
+def _parse_message(buffer: bytes) -> dict:
+    """Decode a protocol buffer message into a {field number: raw value} dictionary."""
+    fields = {}
+    position = 0
+    end = len(buffer)
+    while position < end:
+        key, position = _read_varint(buffer, position)
+        wire_type = key & 0x7
+        if wire_type == 0:
+            value, position = _read_varint(buffer, position)
+        elif wire_type == 1:
+            value = buffer[position : position + 8]
+            position += 8
+        elif wire_type == 2:
+            length, position = _read_varint(buffer, position)
+            value = buffer[position : position + length]
+            position += length
+        elif wire_type == 5:
+            value = buffer[position : position + 4]
+            position += 4
+        else:
+            raise ValueError(f"Unsupported protocol buffer wire type: {wire_type}")
+        fields[key >> 3] = value
+    return fields
+
+
+def _unescape(line: bytes) -> bytes:
+    """Undo the escaping applied by the appliance so that messages can be separated by newlines."""
+    if b"\x1b" not in line:
+        return line
+    # The escape character itself must be restored last so that it cannot form new escape sequences
+    return line.replace(b"\x1b\x02", b"\n").replace(b"\x1b\x03", b"\r").replace(b"\x1b\x01", b"\x1b")
+
+
+def _scalar_value(payload_type: int, value):
+    if payload_type == SCALAR_DOUBLE:
+        return _double.unpack(value)[0]
+    if payload_type == SCALAR_FLOAT:
+        return _float.unpack(value)[0]
+    if payload_type == SCALAR_INT:
+        return _int.unpack(value)[0]
+    if payload_type in (SCALAR_SHORT, SCALAR_ENUM):
+        # sint32 values are zigzag encoded
+        return (value >> 1) ^ -(value & 1)
+    if payload_type == SCALAR_BYTE:
+        return int(np.frombuffer(value[:1], dtype=np.int8)[0]) if value else 0
+    raise ValueError(f"Unsupported archiver payload type: {payload_type}")
+
+
+def decode_pb(payload: bytes, optimized: bool = False) -> np.ndarray:
+    """
+    Decode a response of the protocol buffer retrieval format (getData.raw).
+
+    The response is made of chunks, one per year of data. Each chunk starts
+    with a PayloadInfo header line, followed by one line per sample, and is
+    terminated by an empty line. Only numeric scalar types, and numeric
+    waveforms for optimized data, are supported.
+
+    Parameters
+    ----------
+    payload : bytes
+        The body of the response.
+    optimized : bool, optional
+        True if optimized (binned) data was requested.
+
+    Returns
+    -------
+    np.ndarray
+    """
+    # Every sample takes up one line, so this is an upper bound on the number of samples
+    max_points = payload.count(b"\n") + 1
+    timestamps = np.empty(max_points, dtype=float)
+    values = np.empty((4 if optimized else 1, max_points), dtype=float)
+    num_points = 0
+
+    year_start = None
+    payload_type = None
+    for line in payload.split(b"\n"):
+        if not line:
+            # End of a chunk, the next line is a new header
+            year_start = None
+            continue
+        fields = _parse_message(_unescape(line))
+        if year_start is None:
+            payload_type = fields.get(1, 0)
+            year = fields.get(3, 1970)
+            year_start = datetime(year, 1, 1, tzinfo=timezone.utc).timestamp()
+            continue
+
+        value = fields.get(3)
+        if payload_type in _WAVEFORM_DTYPES:
+            statistics = np.frombuffer(value or b"", dtype=_WAVEFORM_DTYPES[payload_type])
+            if not optimized or len(statistics) < 4:
+                raise ValueError("Waveform data is only supported for optimized requests")
+            values[:, num_points] = statistics[:4]
+        else:
+            # Fields holding their default value are not serialized at all
+            scalar = _scalar_value(payload_type, value) if value is not None else 0.0
+            # Raw data sent in response to an optimized request has no statistics to go with it
+            values[:, num_points] = (scalar, 0, scalar, scalar) if optimized else scalar
+        # Timestamps are whole seconds, matching the JSON format
+        timestamps[num_points] = year_start + fields.get(1, 0)
+        num_points += 1
+
+    return np.vstack((timestamps[:num_points], values[:, :num_points]))
@@ -1,25 +1,68 @@
 import os
-import json
+import atexit
+import collections
+import functools
 import logging
 import numpy as np
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Optional
 
 from pydm.widgets.channel import PyDMChannel
 from qtpy.compat import isalive
-from qtpy.QtCore import Slot, QObject, QUrl, QTimer
+from qtpy.QtCore import Signal, Slot, QObject, QUrl, QTimer
 from qtpy.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+from pydm.data_plugins.archiver_cache import is_cacheable, tile_bounds, tile_cache, trim
+from pydm.data_plugins.archiver_codec import decode_json, decode_pb
 from pydm.data_plugins.plugin import PyDMPlugin, PyDMConnection
 
 logger = logging.getLogger(__name__)
 
+# Responses larger than this many bytes are decoded on a worker thread instead of the GUI thread
+ASYNC_DECODE_THRESHOLD = 256 * 1024
+
+_decode_pool = None
+
+
+def decode_pool() -> ThreadPoolExecutor:
+    """Returns the thread pool shared by all archiver connections for decoding responses."""
+    global _decode_pool
+    if _decode_pool is None:
+        _decode_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pydm-archiver")
+        atexit.register(_decode_pool.shutdown, wait=False)
+    return _decode_pool
+
+
+class ArchiveData(np.ndarray):
+    """
+    The data of a reply from the archiver appliance, along with the (from, to) range it was requested for.
+
+    Several plots showing the same PV share a connection, and every reply is sent to all of them. The
+    requested range lets each plot tell which of its own requests, if any, a reply answers.
+    """
+
+    requested_range = None
+
+    def __array_finalize__(self, obj) -> None:
+        self.requested_range = getattr(obj, "requested_range", None)
+
+
+def archive_data(data: np.ndarray, requested_range: Optional[tuple]) -> ArchiveData:
+    """Returns a view of data received from the archiver appliance, tagged with the range it was requested for."""
+    data = data.view(ArchiveData)
+    data.requested_range = requested_range
+    return data
+
 
 class Connection(PyDMConnection):
     """
     Manages the requests between the archiver data plugin and the archiver appliance itself.
     """
 
+    # Emitted from a decoding thread once a response has been decoded
+    decode_finished_signal = Signal()
+
     def __init__(
         self, channel: PyDMChannel, address: str, protocol: Optional[str] = None, parent: Optional[QObject] = None
     ):
@@ -28,6 +71,17 @@ class Connection(PyDMConnection):
         self.address = address
         self.network_manager = QNetworkAccessManager()
         self.network_manager.finished[QNetworkReply].connect(self.data_request_finished)
+        # Requests waiting for a reply, so that identical requests made in the meantime are not sent again
+        self._in_flight = {}
+        self._replies = {}
+        # Responses being decoded, in the order they were received, so that their data is sent in that same order
+        self._decoding = collections.deque()
+        self.decode_finished_signal.connect(self._send_decoded)
+        # Metrics on the requests made to the archiver appliance, and on those avoided by deduplication or caching
+        self.requests_sent = 0
+        self.requests_saved = 0
+        self.bytes_received = 0
+        self.bytes_saved = 0
 
     def add_listener(self, channel: PyDMChannel) -> None:
         """
@@ -64,15 +118,6 @@ class Connection(PyDMConnection):
             logger.error(f"Cannot fetch data for invalid data range, from date={from_date} and to date={to_date}")
             return
 
-        # Archiver expects timestamps to be in utc by default
-        from_dt = datetime.fromtimestamp(from_date, tz=timezone.utc)
-        to_dt = datetime.fromtimestamp(to_date, tz=timezone.utc)
-
-        # Put the dates into the form expected by the archiver in the request url, see here for more details:
-        # http://joda-time.sourceforge.net/apidocs/org/joda/time/format/ISODateTimeFormat.html#dateTime()
-        from_date_str = from_dt.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
-        to_date_str = to_dt.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
-
         base_url = os.getenv("PYDM_ARCHIVER_URL")
         if base_url is None:
             logger.error(
@@ -82,15 +127,54 @@ class Connection(PyDMConnection):
             self.connection_state_signal.emit(False)
             return
 
-        url_string = f"{base_url}/retrieval/data/getData.json?{self.address}&from={from_date_str}&to={to_date_str}"
+        request_from, request_to = from_date, to_date
+        cache = tile_cache()
+        cache_context = None
+        if cache is not None and is_cacheable(processing_command):
+            cache_key = f"{base_url}|{self.address}|{processing_command or ''}"
+            cached_data = cache.load(cache_key, from_date, to_date)
+            if cached_data is not None:
+                self.requests_saved += 1
+                # Deliver asynchronously, the same way a reply from the network would be
+                QTimer.singleShot(0, functools.partial(self._send_cached_data, cached_data, (from_date, to_date)))
+                return
+            # Request whole tiles so that the response can be stored in the cache
+            request_from, request_to = tile_bounds(from_date, to_date)
+            cache_context = (cache, cache_key, request_from, request_to, from_date, to_date)
+
+        # Archiver expects timestamps to be in utc by default
+        from_dt = datetime.fromtimestamp(request_from, tz=timezone.utc)
+        to_dt = datetime.fromtimestamp(request_to, tz=timezone.utc)
+
+        # Put the dates into the form expected by the archiver in the request url, see here for more details:
+        # http://joda-time.sourceforge.net/apidocs/org/joda/time/format/ISODateTimeFormat.html#dateTime()
+        from_date_str = from_dt.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+        to_date_str = to_dt.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+        # The binary protocol buffer format is much cheaper to produce and decode than JSON for large requests
+        data_format = "raw" if os.getenv("PYDM_ARCHIVER_FORMAT", "json").lower() == "raw" else "json"
+        url_string = (
+            f"{base_url}/retrieval/data/getData.{data_format}?{self.address}&from={from_date_str}&to={to_date_str}"
+        )
         if processing_command:
             url_string = url_string.replace("pv=", "pv=" + processing_command + "(", 1)
             url_string = url_string.replace("&from=", ")&from=", 1)
 
+        # Several plots showing the same PV share this connection, and the reply is delivered to all of them.
+        # So an identical request already waiting for its reply does not need to be sent again.
+        request_key = (url_string, from_date, to_date)
+        if request_key in self._in_flight:
+            self._in_flight[request_key] += 1
+            self.requests_saved += 1
+            return
+
         request = QNetworkRequest(QUrl(url_string))
         # This get call is non-blocking, can be made in parallel with others, and when the results are ready they
         # will be delivered to the data_request_finished method below via the "finished" signal
         reply = self.network_manager.get(request)
+        self.requests_sent += 1
+        self._in_flight[request_key] = 0
+        self._replies[reply] = (request_key, cache_context)
 
         def timeout():
             if not isinstance(reply, QNetworkReply) or not isalive(reply):
@@ -109,19 +193,28 @@ class Connection(PyDMConnection):
         ----------
         reply: The response from the archiver appliance
         """
-        success = (
-            reply.error() == QNetworkReply.NoError
-            and reply.header(QNetworkRequest.ContentTypeHeader) == "application/json"
+        request_key, cache_context = self._replies.pop(reply, (None, None))
+        duplicates = self._in_flight.pop(request_key, 0)
+        url = reply.url().url()  # From a url object to a string
+        is_raw = "getData.raw" in url
+        requested_range = request_key[1:] if request_key is not None else None
+        success = reply.error() == QNetworkReply.NoError and (
+            is_raw or reply.header(QNetworkRequest.ContentTypeHeader) == "application/json"
         )
         self.connection_state_signal.emit(success)
         if success:
-            bytes_str = reply.readAll()
-            data_dict = json.loads(str(bytes_str, "utf-8"))
-
-            if "pv=optimized" in reply.url().url():  # From a url object to a string
-                self._send_optimized_data(data_dict)
+            payload = bytes(reply.readAll())
+            self.bytes_received += len(payload)
+            self.bytes_saved += duplicates * len(payload)
+            optimized = "pv=optimized" in url
+            if len(payload) < ASYNC_DECODE_THRESHOLD:
+                decoded = Future()
+                decoded.set_result(self._decode(payload, optimized, is_raw, cache_context))
             else:
-                self._send_raw_data(data_dict)
+                # Keep the GUI responsive while large responses are decoded
+                decoded = decode_pool().submit(self._decode, payload, optimized, is_raw, cache_context)
+            self._decoding.append((decoded, requested_range))
+            decoded.add_done_callback(self._decode_finished)
         else:
             logger.debug(
                 f"Request for data from archiver failed, request url: {reply.url()} retrieved header: "
@@ -129,39 +222,51 @@ class Connection(PyDMConnection):
             )
         reply.deleteLater()
 
-    def _send_raw_data(self, data_dict: dict) -> None:
+    def _decode(
+        self, payload: bytes, optimized: bool, is_raw: bool, cache_context: Optional[tuple] = None
+    ) -> Optional[np.ndarray]:
         """
-        Sends a numpy array of shape (2, data_length) containing the x-values (timestamps) and y-values (PV data)
-        via the new value signal
+        Decodes a response from the archiver appliance, or returns None if it can not be decoded. For raw data the
+        array has shape (2, data_length) and contains the x-values (timestamps) and y-values (PV data). For
+        optimized data it has shape (5, data_length). Index 0 contains the timestamps, index 1 the mean values,
+        index 2 the standard deviations, index 3 the minimum values, and index 4 the maximum values.
         """
-        data = np.array(
-            ([point["secs"] for point in data_dict[0]["data"]], [point["val"] for point in data_dict[0]["data"]])
-        )
-        self.new_value_signal[np.ndarray].emit(data)
+        try:
+            data = decode_pb(payload, optimized) if is_raw else decode_json(payload, optimized)
+        except Exception:
+            logger.exception("Unable to decode the data received from the archiver")
+            return None
+        if cache_context is not None:
+            cache, cache_key, request_from, request_to, from_date, to_date = cache_context
+            cache.store(cache_key, request_from, request_to, data)
+            data = trim(data, from_date, to_date)
+        return data
+
+    def _decode_finished(self, decoded: Future) -> None:
+        """Called from the thread which decoded a response, hands the result back to the main thread"""
+        if isalive(self):
+            self.decode_finished_signal.emit()
 
-    def _send_optimized_data(self, data_dict: dict) -> None:
+    @Slot()
+    def _send_decoded(self) -> None:
         """
-        Sends a numpy array of shape (5, data_length). Index 0 contains the timestamps, index 1 the mean values,
-        index 2 the standard deviations, index 3 the minimum values, and index 4 the maximum values.
+        Sends the data of every decoded response which is not waiting on the decoding of an earlier one, via the
+        new value signal. The data is sent as ArchiveData tagged with the requested (from, to) range, and
+        responses which could not be decoded are reported as a failed request.
         """
-        pv_data = [point["val"] for point in data_dict[0]["data"]]
-        try:
-            data = np.array(
-                (
-                    [point["secs"] for point in data_dict[0]["data"]],
-                    [point[0] for point in pv_data],
-                    [point[1] for point in pv_data],
-                    [point[2] for point in pv_data],
-                    [point[3] for point in pv_data],
-                )
-            )
-        except TypeError:
-            # The archiver will fall back to sending raw data if the optimized request is for more data points
-            # than are in the bin
-            self._send_raw_data(data_dict)
-            return
+        while self._decoding and self._decoding[0][0].done():
+            decoded, requested_range = self._decoding.popleft()
+            data = decoded.result()
+            if data is None:
+                self.connection_state_signal.emit(False)
+            else:
+                self.new_value_signal[np.ndarray].emit(archive_data(data, requested_range))
 
-        self.new_value_signal[np.ndarray].emit(data)
+    def _send_cached_data(self, data: np.ndarray, requested_range: tuple) -> None:
+        """Sends data loaded from the tile cache via the new value signal"""
+        if isalive(self):
+            self.connection_state_signal.emit(True)
+            self.new_value_signal[np.ndarray].emit(archive_data(data, requested_range))
 
 
 class ArchiverPlugin(PyDMPlugin):
@@ -3,6 +3,11 @@ from caproto import SubscriptionType
 import logging
 import numpy as np
 from pydm.data_plugins.plugin import PyDMPlugin, PyDMConnection
+from pydm.data_plugins.epics_plugins.change_detection import (
+    ChangeDetector,
+    change_detection_connection_id,
+    change_detection_strategy,
+)
 from qtpy.QtCore import Slot, Qt
 from qtpy.QtWidgets import QApplication
 from pydm.data_plugins import is_read_only
@@ -54,6 +59,7 @@ class Connection(PyDMConnection):
         self._upper_warning_limit = None
         self._lower_warning_limit = None
         self._timestamp = None
+        self._change_detector = ChangeDetector(change_detection_strategy(channel))
 
         monitor_mask = SubscriptionType.DBE_VALUE | SubscriptionType.DBE_ALARM | SubscriptionType.DBE_PROPERTY
         self.pv = epics.get_pv(
@@ -79,11 +85,12 @@ class Connection(PyDMConnection):
         self._upper_warning_limit = None
         self._lower_warning_limit = None
         self._timestamp = None
+        self._change_detector.reset()
 
     def send_new_value(self, value=None, char_value=None, count=None, typefull=None, type=None, *args, **kws):
         self.update_ctrl_vars(**kws)
 
-        if value is not None and not np.array_equal(value, self._value):
+        if value is not None and self._change_detector.changed(value, kws.get("timestamp")):
             self._value = value
             if isinstance(value, np.ndarray):
                 self.new_value_signal[np.ndarray].emit(value)
@@ -222,3 +229,7 @@ class CaprotoPlugin(PyDMPlugin):
     # be properly set before it is used.
     protocol = None
     connection_class = Connection
+
+    @staticmethod
+    def get_connection_id(channel):
+        return change_detection_connection_id(PyDMPlugin.get_connection_id(channel), channel)
@@ -0,0 +1,182 @@
+"""
+Deciding whether a value received from an EPICS monitor should be sent to widgets.
+
+Monitors can deliver the same value again, for instance when the callbacks of
+a PV are run once more on reconnection. Comparing every element of a new value
+with the previous one catches this, but for a large waveform that is a full
+scan of the array on the callback thread for each update. The strategy used
+can be chosen per channel with the ``change_detection`` address option, e.g.
+``ca://MY:WAVEFORM?change_detection=hash``, or for all channels with the
+PYDM_CHANGE_DETECTION environment variable. Channels asking for different
+strategies for the same PV are given connections of their own:
+
+* ``always`` sends every value received.
+* ``timestamp`` sends a value when its timestamp differs from that of the
+  previous one, without looking at the data at all.
+* ``hash`` sends a value when a hash of its shape, type and a regular sample of
+  its elements differs from that of the previous one. Changes confined to
+  elements outside of the sample are missed.
+* ``exact`` compares every element with the previous value.
+
+By default arrays are compared by timestamp, and scalars exactly.
+"""
+
+import logging
+from typing import Optional
+from urllib.parse import parse_qs
+
+import numpy as np
+
+from pydm import config
+from pydm.utilities.remove_protocol import parsed_address
+
+logger = logging.getLogger(__name__)
+
+ALWAYS = "always"
+TIMESTAMP = "timestamp"
+HASH = "hash"
+EXACT = "exact"
+STRATEGIES = (ALWAYS, TIMESTAMP, HASH, EXACT)
+
+# Number of elements of an array sampled by the hash strategy
+HASH_SAMPLE_SIZE = 4096
+
+
+def sampled_digest(value) -> int:
+    """
+    Returns a hash of the shape, type and a regular sample of the elements of a value.
+
+    Parameters
+    ----------
+    value : np.ndarray or scalar
+
+    Returns
+    -------
+    int
+    """
+    array = np.asarray(value)
+    flat = array.reshape(-1)
+    step = max(1, flat.size // HASH_SAMPLE_SIZE)
+    sample = flat[::step]
+    if sample.dtype.hasobject:
+        return hash((array.shape, tuple(sample.tolist())))
+    return hash((array.shape, array.dtype.str, sample.tobytes()))
+
+
+def _address_option(channel) -> Optional[str]:
+    """Returns the change_detection option of the address of a channel, or None if it has none."""
+    parsed_addr = parsed_address(getattr(channel, "address", None))
+    if parsed_addr and parsed_addr.query:
+        option = parse_qs(parsed_addr.query).get("change_detection")
+        if option:
+            return option[0].lower()
+    return None
+
+
+def change_detection_strategy(channel) -> Optional[str]:
+    """
+    Returns the change detection strategy requested for a channel.
+
+    The strategy is read from the ``change_detection`` option of the channel address, and falls back to the
+    PYDM_CHANGE_DETECTION environment variable. None selects the default: timestamps for arrays, and an exact
+    comparison for scalars.
+
+    Parameters
+    ----------
+    channel : PyDMChannel
+
+    Returns
+    -------
+    str or None
+    """
+    strategy = _address_option(channel) or config.CHANGE_DETECTION
+    if strategy and strategy not in STRATEGIES:
+        logger.error("Invalid change detection strategy %r, expected one of %s", strategy, ", ".join(STRATEGIES))
+        return None
+    return strategy or None
+
+
+def change_detection_connection_id(connection_id: Optional[str], channel) -> Optional[str]:
+    """
+    Returns the connection id of a channel, extended with the change detection strategy its address asks for.
+
+    Channels asking for different strategies for the same PV each need a connection of their own.
+
+    Parameters
+    ----------
+    connection_id : str or None
+        The connection id of the channel, without regard to change detection.
+    channel : PyDMChannel
+
+    Returns
+    -------
+    str or None
+    """
+    option = _address_option(channel)
+    if connection_id is None or option is None:
+        return connection_id
+    separator = "&" if "?" in connection_id else "?"
+    return f"{connection_id}{separator}change_detection={option}"
+
+
+class ChangeDetector(object):
+    """
+    Tells whether each value received from a monitor differs from the previous one.
+
+    Parameters
+    ----------
+    strategy : str, optional
+        One of ``always``, ``timestamp``, ``hash`` or ``exact``. The default
+        compares arrays by timestamp, and scalars exactly.
+    """
+
+    def __init__(self, strategy: Optional[str] = None):
+        if strategy is not None and strategy not in STRATEGIES:
+            raise ValueError(f"Invalid change detection strategy {strategy!r}")
+        self.strategy = strategy
+        # Number of values found to be the same as the previous one
+        self.unchanged = 0
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the previous value, so that the next one is considered changed."""
+        self._value = None
+        self._timestamp = None
+        self._digest = None
+
+    def changed(self, value, timestamp: Optional[float] = None) -> bool:
+        """
+        Returns whether a value differs from the previous one, and remembers it for the next call.
+
+        Parameters
+        ----------
+        value : np.ndarray or scalar
+            The value received.
+        timestamp : float, optional
+            The timestamp of the value. The timestamp strategy falls back to
+            an exact comparison for values received without one.
+
+        Returns
+        -------
+        bool
+        """
+        strategy = self.strategy or (TIMESTAMP if isinstance(value, np.ndarray) else EXACT)
+        if strategy == TIMESTAMP and timestamp is None:
+            strategy = EXACT
+
+        if strategy == ALWAYS:
+            changed = True
+        elif strategy == TIMESTAMP:
+            changed = self._value is None or timestamp != self._timestamp
+        elif strategy == HASH:
+            digest = sampled_digest(value)
+            changed = self._value is None or digest != self._digest
+            self._digest = digest
+        else:
+            changed = not np.array_equal(value, self._value)
+
+        self._value = value
+        self._timestamp = timestamp
+        if not changed:
+            self.unchanged += 1
+        return changed
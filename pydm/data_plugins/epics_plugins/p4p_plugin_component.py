@@ -5,14 +5,18 @@ import threading
 import p4p
 import re
 import time
+import weakref
 from p4p.client.thread import Context, Disconnected
 from p4p.wrapper import Value
 from p4p.nt import NTURI
-from .pva_codec import decompress
+from .pva_codec import decode_pool, decompress
 from pydm.data_plugins import is_read_only
 from pydm.data_plugins.plugin import PyDMPlugin, PyDMConnection
+from pydm.utilities.image_region import apply_image_region
 from pydm.widgets.channel import PyDMChannel
-from qtpy.QtCore import QObject, Qt
+from qtpy.compat import isalive
+from qtpy.QtCore import QEvent, QObject, Qt
+from qtpy.QtWidgets import QWidget
 from typing import Optional
 from urllib.parse import urlparse, parse_qs
 
@@ -55,6 +59,20 @@ class Connection(PyDMConnection):
         self._lower_warning_limit = None
         self._timestamp = None
 
+        # NTNDArray frames are decoded on the decode thread pool, one at a time per connection. A frame arriving
+        # while another is being decoded waits in _pending_frame, replacing (and dropping) any frame already there.
+        self._frame_lock = threading.Lock()
+        self._pending_frame = None
+        self._decoding = False
+        # Frames are not decoded at all while none of the widgets listening is visible. The latest one is kept
+        # in _skipped_frame, and decoded as soon as one of them is shown.
+        self._consumer_widgets = weakref.WeakSet()
+        self._other_consumers = 0
+        self._consumer_visible = False
+        self._skipped_frame = None
+        self.frames_dropped = 0
+        self.frames_skipped = 0
+
         # RPC = Remote Procedure Call (https://mdavidsaver.github.io/p4p/rpc.html#p4p.rpc.rpcproxy)
         # example address: pva://pv:call:add?lhs=4&rhs=7&pydm_pollrate=10
         self._rpc_function_name = ""  # pv:call:add (in case of above example)
@@ -286,8 +304,9 @@ class Connection(PyDMConnection):
                     if new_value is not None:
                         if isinstance(new_value, np.ndarray):
                             if "NTNDArray" in value.getID():
-                                new_value = decompress(value)
-                            self.new_value_signal[np.ndarray].emit(new_value)
+                                self.decode_frame(value)
+                            else:
+                                self.new_value_signal[np.ndarray].emit(apply_image_region(new_value, self.image_region))
                         elif isinstance(new_value, np.bool_):
                             self.new_value_signal[np.bool_].emit(new_value)
                         elif isinstance(new_value, list):
@@ -352,6 +371,92 @@ class Connection(PyDMConnection):
                     self._timestamp = value.timeStamp.secondsPastEpoch
                     self.timestamp_signal.emit(value.timeStamp.secondsPastEpoch)
 
+    def decode_frame(self, value: Value) -> None:
+        """
+        Decodes an NTNDArray frame on the decode thread pool, and sends it via the new value signal.
+
+        Frames are decoded one at a time, and only the latest of those arriving meanwhile is decoded next. If
+        none of the widgets listening to this connection is visible, the frame is not decoded at all.
+
+        Parameters
+        ----------
+        value : Value
+            The NTNDArray structure received from P4P
+        """
+        with self._frame_lock:
+            if not self._consumer_visible:
+                self.frames_skipped += 1
+                self._skipped_frame = value
+                return
+            if self._pending_frame is not None:
+                self.frames_dropped += 1
+            self._pending_frame = value
+            if self._decoding:
+                return
+            self._decoding = True
+        decode_pool().submit(self._decode_pending_frames)
+
+    def _decode_pending_frames(self) -> None:
+        """Decodes and sends frames until none is pending. Runs on the decode thread pool."""
+        while True:
+            with self._frame_lock:
+                value, self._pending_frame = self._pending_frame, None
+                if value is None:
+                    self._decoding = False
+                    return
+            try:
+                data = decompress(value)
+                if data is not None:
+                    data = self.apply_frame_region(value, data)
+            except Exception:
+                logger.exception("Unable to decode the NTNDArray frame received from %s", self.address)
+                continue
+            if data is not None and isalive(self):
+                self.new_value_signal[np.ndarray].emit(data)
+
+    def apply_frame_region(self, value: Value, data: np.ndarray) -> np.ndarray:
+        """
+        Crops and bins a decoded NTNDArray frame as requested by the channel address.
+
+        Frames are decoded with the shape of their dimensions, (x, y), while their pixels are stored row by row.
+        The region is therefore applied to the frame seen as (y, x) rows of pixels, and the result is sent back
+        in the same (x, y) layout as frames without a region. Frames decoded from JPEG are already rows of
+        pixels. Other frames with more than two dimensions, like raw color frames, are sent unchanged.
+
+        Parameters
+        ----------
+        value : Value
+            The NTNDArray structure the frame was decoded from
+        data : np.ndarray
+            The decoded frame
+        """
+        if self.image_region is None:
+            return data
+        if value.get("codec", {}).get("name") == "jpeg":
+            return apply_image_region(data, self.image_region)
+        if data.ndim != 2:
+            return data
+        image = apply_image_region(data.reshape(data.shape[1], data.shape[0]), self.image_region)
+        return image.reshape(image.shape[1], image.shape[0])
+
+    def _update_consumer_visibility(self) -> None:
+        """Checks whether anything will display the frames received, and decodes the latest skipped one if so."""
+        visible = self._other_consumers > 0 or any(
+            isalive(widget) and widget.isVisible() for widget in self._consumer_widgets
+        )
+        with self._frame_lock:
+            self._consumer_visible = visible
+            skipped_frame = self._skipped_frame if visible else None
+            self._skipped_frame = None if visible else self._skipped_frame
+        if skipped_frame is not None:
+            self.decode_frame(skipped_frame)
+
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:
+        """Tracks the visibility of the widgets listening to this connection."""
+        if event.type() in (QEvent.Show, QEvent.Hide):
+            self._update_consumer_visibility()
+        return False
+
     @staticmethod
     def convert_epics_nttable(epics_struct):
         """
@@ -426,6 +531,13 @@ class Connection(PyDMConnection):
             The channel that will be listening to any changes from this connection
         """
         super().add_listener(channel)
+        consumer = getattr(channel.value_slot, "__self__", None)
+        if isinstance(consumer, QWidget):
+            self._consumer_widgets.add(consumer)
+            consumer.installEventFilter(self)
+        elif channel.value_slot is not None:
+            self._other_consumers += 1
+        self._update_consumer_visibility()
 
         if self.is_rpc:
             # In case of a RPC, we can just query the channel immediately and emit the value,
@@ -461,6 +573,27 @@ class Connection(PyDMConnection):
                 except (KeyError, IndexError, TypeError):
                     pass
 
+    def remove_listener(self, channel: PyDMChannel, destroying: Optional[bool] = False) -> None:
+        """
+        Removes a listener from this connection, closing it if there are no more listeners remaining.
+
+        Parameters
+        ----------
+        channel : PyDMChannel
+            The channel that was listening to this connection
+        destroying : bool, optional
+            True if the widget using this channel is being destroyed
+        """
+        consumer = getattr(channel.value_slot, "__self__", None)
+        if isinstance(consumer, QWidget):
+            self._consumer_widgets.discard(consumer)
+            if not destroying and isalive(consumer):
+                consumer.removeEventFilter(self)
+        elif channel.value_slot is not None:
+            self._other_consumers = max(self._other_consumers - 1, 0)
+        self._update_consumer_visibility()
+        super().remove_listener(channel, destroying)
+
     def close(self):
         """Closes out this connection."""
         # If RPC, we have no monitor to close
@@ -477,6 +610,10 @@ class P4PPlugin(PyDMPlugin):
     connection_class = Connection
     context = None
 
+    @staticmethod
+    def get_connection_id(channel):
+        return PyDMPlugin.get_image_region_connection_id(channel)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         if P4PPlugin.context is None:
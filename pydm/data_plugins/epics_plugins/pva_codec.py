@@ -1,8 +1,14 @@
 import io
+import sys
+import atexit
 import logging
+import threading
 import numpy as np
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from functools import reduce
 from p4p.wrapper import Value
+from pydm import config
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +30,80 @@ ScalarType = (
 
 codecs = {}
 
+_decode_pool = None
+
+
+def decode_pool() -> ThreadPoolExecutor:
+    """Returns the thread pool shared by all PVA connections for decoding NTNDArray frames."""
+    global _decode_pool
+    if _decode_pool is None:
+        _decode_pool = ThreadPoolExecutor(max_workers=config.PVA_DECODE_THREADS, thread_name_prefix="pydm-pva-decode")
+        atexit.register(_decode_pool.shutdown, wait=False)
+    return _decode_pool
+
+
+class BufferPool(object):
+    """
+    Output arrays for decompressed frames, reused from one frame to the next.
+
+    Frames of a camera all have the same shape and type, so instead of
+    allocating a new array for each of them, arrays are handed out again
+    once the previous frame decoded into them has been released. An array
+    still referenced anywhere else, such as by a widget displaying it, is
+    never reused.
+
+    Parameters
+    ----------
+    max_buffers : int
+        The maximum number of arrays kept for each shape and type.
+    max_shapes : int
+        The maximum number of shapes and types arrays are kept for, the least
+        recently used ones are forgotten first.
+    """
+
+    def __init__(self, max_buffers: int = 3, max_shapes: int = 4):
+        self.max_buffers = max_buffers
+        self.max_shapes = max_shapes
+        self._buffers = OrderedDict()
+        self._lock = threading.Lock()
+        self.allocated = 0
+        self.reused = 0
+
+    def get(self, shape, dtype) -> np.ndarray:
+        """
+        Returns an array of the given shape and type, with undefined contents.
+
+        Parameters
+        ----------
+        shape : tuple
+        dtype : np.dtype
+        """
+        key = (tuple(shape), np.dtype(dtype).str)
+        with self._lock:
+            buffers = self._buffers.setdefault(key, [])
+            self._buffers.move_to_end(key)
+            for buffer in buffers:
+                # Referenced only by the list, the loop variable and getrefcount itself
+                if sys.getrefcount(buffer) <= 3:
+                    self.reused += 1
+                    return buffer
+            buffer = np.empty(key[0], dtype=dtype)
+            self.allocated += 1
+            buffers.append(buffer)
+            if len(buffers) > self.max_buffers:
+                buffers.pop(0)
+            while len(self._buffers) > self.max_shapes:
+                self._buffers.popitem(last=False)
+            return buffer
+
+    def clear(self) -> None:
+        """Forget every array."""
+        with self._lock:
+            self._buffers.clear()
+
+
+output_buffers = BufferPool()
+
 
 def decompress(structure: Value):
     """
@@ -76,9 +156,13 @@ def jpeg_decompress(data, shape, dtype, uncompressed_size):
 
 
 def blosc_decompress(data, shape, dtype, uncompressed_size):
-    """Decompress using blosc"""
-    dec_data = blosc.decompress(data)
-    return np.frombuffer(dec_data, dtype=dtype).reshape(shape)
+    """Decompress using blosc, into a reused output array"""
+    output = output_buffers.get(shape, dtype)
+    if output.nbytes != uncompressed_size:
+        dec_data = blosc.decompress(data)
+        return np.frombuffer(dec_data, dtype=dtype).reshape(shape)
+    blosc.decompress_ptr(data, output.__array_interface__["data"][0])
+    return output
 
 
 def lz4_decompress(data, shape, dtype, uncompressed_size):
@@ -97,6 +181,8 @@ def bslz4_decompress(data, shape, dtype, uncompressed_size):
 try:
     import blosc
 
+    # blosc splits the decompression of each frame over several threads
+    blosc.set_nthreads(config.PVA_DECODE_THREADS)
     codecs["blosc"] = blosc_decompress
 except ImportError:
     logger.debug("Blosc codec not available for PVAccess data decompression")
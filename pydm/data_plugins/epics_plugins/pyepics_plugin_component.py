@@ -8,6 +8,12 @@ import numpy as np
 from epics.ca import use_initial_context
 from pydm.data_plugins import is_read_only
 from pydm.data_plugins.plugin import PyDMConnection, PyDMPlugin
+from pydm.data_plugins.epics_plugins.change_detection import (
+    ChangeDetector,
+    change_detection_connection_id,
+    change_detection_strategy,
+)
+from pydm.utilities.image_region import apply_image_region
 from qtpy.QtCore import Qt, Slot
 from qtpy.QtWidgets import QApplication
 
@@ -55,6 +61,8 @@ class Connection(PyDMConnection):
     def __init__(self, channel, pv, protocol=None, parent=None):
         super().__init__(channel, pv, protocol, parent)
         self.app = QApplication.instance()
+        # Created before the PV, whose connection callback may already clear it
+        self._change_detector = ChangeDetector(change_detection_strategy(channel))
         self.pv = epics.PV(
             pv,
             connection_callback=self.send_connection_state,
@@ -95,14 +103,15 @@ class Connection(PyDMConnection):
         self._upper_warning_limit = None
         self._lower_warning_limit = None
         self._timestamp = None
+        self._change_detector.reset()
 
     def send_new_value(self, value=None, char_value=None, count=None, ftype=None, *args, **kws):
         self.update_ctrl_vars(**kws)
 
-        if value is not None and not np.array_equal(value, self._value):
+        if value is not None and self._change_detector.changed(value, kws.get("timestamp")):
             self._value = value
             if isinstance(value, np.ndarray):
-                self.new_value_signal[np.ndarray].emit(value)
+                self.new_value_signal[np.ndarray].emit(apply_image_region(value, self.image_region))
             else:
                 if ftype in int_types:
                     try:
@@ -250,6 +259,10 @@ class PyEPICSPlugin(PyDMPlugin):
     connection_class = Connection
     thread_pool = None
 
+    @staticmethod
+    def get_connection_id(channel):
+        return change_detection_connection_id(PyDMPlugin.get_image_region_connection_id(channel), channel)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         # Not the end of the world if this happens twice, but better not to
@@ -262,3 +275,8 @@ class PyEPICSPlugin(PyDMPlugin):
             # Class variable for connections to use
             # This is the easiest way to share state
             PyEPICSPlugin.thread_pool = thread_pool
+
+    def flush_connections(self):
+        # Channels are created without waiting for them to connect, so send out all of the
+        # search requests queued up by a batch of new connections in one go
+        epics.ca.flush_io()
@@ -1,22 +1,78 @@
 import functools
+import logging
 import numpy as np
+import time
 import weakref
 import threading
 import warnings
 
-from typing import Optional, Callable
-from urllib.parse import ParseResult
+from typing import Callable, List, Optional
+from urllib.parse import ParseResult, parse_qs
 
+from pydm.utilities.image_region import ImageRegion, parse_image_region
 from pydm.utilities.remove_protocol import parsed_address
 from pydm.widgets import PyDMChannel
 from qtpy.compat import isalive
-from qtpy.QtCore import Signal, QObject, Qt
+from qtpy.QtCore import Signal, QObject, Qt, QTimer
 from qtpy.QtWidgets import QApplication
 from pydm import config
 
+logger = logging.getLogger(__name__)
+
+# How often pending coalesced values are flushed to widgets, in milliseconds (roughly once per frame)
+COALESCE_FLUSH_INTERVAL = 16
+
+
+class ValueCoalescer(QObject):
+    """
+    Periodically delivers the pending values of rate-limited connections.
+
+    A single instance lives in the GUI thread and is shared by every
+    PyDMConnection with a maximum update rate. On each tick, it asks the
+    registered connections to emit their latest pending value, if any.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._connections = weakref.WeakSet()
+        self._timer = QTimer(self)
+        self._timer.setInterval(COALESCE_FLUSH_INTERVAL)
+        self._timer.timeout.connect(self.flush)
+
+    def register(self, connection):
+        self._connections.add(connection)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def unregister(self, connection):
+        self._connections.discard(connection)
+        if not self._connections:
+            self._timer.stop()
+
+    def flush(self):
+        now = time.monotonic()
+        for connection in list(self._connections):
+            if isalive(connection):
+                connection.flush_pending_value(now)
+            else:
+                self._connections.discard(connection)
+
+
+_value_coalescer = None
+
+
+def value_coalescer() -> ValueCoalescer:
+    """Return the ValueCoalescer shared by all connections, creating it on first use."""
+    global _value_coalescer
+    if _value_coalescer is None:
+        _value_coalescer = ValueCoalescer()
+    return _value_coalescer
+
 
 class PyDMConnection(QObject):
     new_value_signal = Signal((float,), (int,), (str,), (bool,), (object,))
+    # Re-emits values from new_value_signal at a limited rate when the connection has a maximum update rate
+    coalesced_value_signal = Signal((float,), (int,), (str,), (bool,), (object,))
     connection_state_signal = Signal(bool)
     new_severity_signal = Signal(int)
     write_access_signal = Signal(bool)
@@ -40,6 +96,103 @@ class PyDMConnection(QObject):
         self.listener_count = 0
         self.app = QApplication.instance()
 
+        # Counters for the values that were never delivered because a newer one arrived before the flush,
+        # and for the deliveries which replaced at least one such value
+        self.dropped_updates = 0
+        self.merged_updates = 0
+        self._pending_value = None
+        self._pending_dropped = 0
+        self._pending_lock = threading.Lock()
+        self._last_flush = 0.0
+        self.max_rate = self.get_max_rate(channel)
+        # Crop and binning of images requested by the channel address, applied by the plugins supporting it
+        self.image_region = self.get_image_region(channel)
+        if self.max_rate:
+            for signal_type in (int, float, str, bool, object):
+                self.new_value_signal[signal_type].connect(
+                    functools.partial(self._queue_value, signal_type), Qt.DirectConnection
+                )
+            value_coalescer().register(self)
+
+    @staticmethod
+    def get_max_rate(channel: Optional[PyDMChannel]) -> float:
+        """
+        Return the maximum rate, in Hz, at which new values are delivered to the listeners of this connection.
+
+        The rate is read from the ``max_rate`` option of the channel address, e.g. ``ca://MY:PV?max_rate=10``,
+        and falls back to the PYDM_MAX_UPDATE_RATE environment variable. A rate of 0 delivers every value.
+        """
+        parsed_addr = parsed_address(getattr(channel, "address", None))
+        if parsed_addr and parsed_addr.query:
+            max_rate = parse_qs(parsed_addr.query).get("max_rate")
+            if max_rate:
+                try:
+                    return max(float(max_rate[0]), 0.0)
+                except ValueError:
+                    logger.error("Invalid max_rate %r for channel %s", max_rate[0], channel.address)
+        return config.MAX_UPDATE_RATE
+
+    @staticmethod
+    def get_image_region(channel: Optional[PyDMChannel]) -> Optional[ImageRegion]:
+        """
+        Return the crop and binning of images requested by the address of a channel.
+
+        These are given by the ``roi=x,y,w,h``, ``bin=n`` and ``width=n`` options of the channel address, e.g.
+        ``pva://CAM:IMAGE?roi=0,0,1024,1024&bin=4``. See :func:`pydm.utilities.image_region.parse_image_region`.
+        Returns None if the address does not ask for any.
+        """
+        parsed_addr = parsed_address(getattr(channel, "address", None))
+        if not parsed_addr or not parsed_addr.query:
+            return None
+        try:
+            return parse_image_region(parsed_addr.query)
+        except ValueError:
+            logger.error("Invalid image region options %r for channel %s", parsed_addr.query, channel.address)
+            return None
+
+    @property
+    def _value_signal(self):
+        """The signal listeners' value slots are connected to, depending on whether updates are rate limited."""
+        return self.coalesced_value_signal if self.max_rate else self.new_value_signal
+
+    def _queue_value(self, signal_type, value):
+        """Store the latest value until the next flush. Runs in the thread that emitted new_value_signal."""
+        with self._pending_lock:
+            if self._pending_value is not None:
+                self._pending_dropped += 1
+            self._pending_value = (signal_type, value)
+
+    def flush_pending_value(self, now: Optional[float] = None) -> bool:
+        """
+        Deliver the pending value to the listeners if the maximum update rate allows it.
+
+        Parameters
+        ----------
+        now : float, optional
+            The current time.monotonic() value, to avoid querying it for every connection.
+
+        Returns
+        -------
+        bool
+            True if a value was delivered.
+        """
+        if now is None:
+            now = time.monotonic()
+        if now - self._last_flush < 1.0 / self.max_rate:
+            return False
+        with self._pending_lock:
+            if self._pending_value is None:
+                return False
+            signal_type, value = self._pending_value
+            self._pending_value = None
+            if self._pending_dropped:
+                self.dropped_updates += self._pending_dropped
+                self.merged_updates += 1
+                self._pending_dropped = 0
+        self._last_flush = now
+        self.coalesced_value_signal[signal_type].emit(value)
+        return True
+
     def add_listener(self, channel):
         self.listener_count = self.listener_count + 1
         if channel.connection_slot is not None:
@@ -48,7 +201,7 @@ class PyDMConnection(QObject):
         if channel.value_slot is not None:
             for signal_type in (int, float, str, bool, object):
                 try:
-                    self.new_value_signal[signal_type].connect(channel.value_slot, Qt.QueuedConnection)
+                    self._value_signal[signal_type].connect(channel.value_slot, Qt.QueuedConnection)
                 # If the signal exists (always does in this case since we define it for all 'signal_type' values above)
                 # but doesn't match slot, TypeError is thrown. We also don't need to catch KeyError/IndexError here,
                 # since those are only thrown when signal type doesn't exist.
@@ -118,7 +271,7 @@ class PyDMConnection(QObject):
             if self._should_disconnect(channel.value_slot, destroying):
                 for signal_type in (int, float, str, bool, object):
                     try:
-                        self.new_value_signal[signal_type].disconnect(channel.value_slot)
+                        self._value_signal[signal_type].disconnect(channel.value_slot)
                     # If the signal exists (always does in this case since we define it for all 'signal_type' earlier)
                     # but doesn't match slot, TypeError is thrown. We also don't need to catch KeyError/IndexError here,
                     # since those are only thrown when signal type doesn't exist.
@@ -208,6 +361,8 @@ class PyDMConnection(QObject):
 
         self.listener_count = self.listener_count - 1
         if self.listener_count < 1:
+            if self.max_rate:
+                value_coalescer().unregister(self)
             self.close()
 
     @staticmethod
@@ -281,7 +436,42 @@ class PyDMPlugin(object):
 
     @staticmethod
     def get_connection_id(channel: PyDMChannel) -> Optional[str]:
-        return PyDMPlugin.get_full_address(channel)
+        return PyDMPlugin.get_max_rate_connection_id(PyDMPlugin.get_full_address(channel), channel)
+
+    @staticmethod
+    def get_max_rate_connection_id(connection_id: Optional[str], channel: PyDMChannel) -> Optional[str]:
+        """
+        Extend a connection id with the maximum update rate requested by the channel address.
+
+        The rate is applied by the connection to all of its listeners, so channels asking for different
+        rates for the same address each need a connection of their own.
+        """
+        parsed_addr = parsed_address(channel.address)
+        if connection_id is None or not parsed_addr or not parsed_addr.query:
+            return connection_id
+        max_rate = parse_qs(parsed_addr.query).get("max_rate")
+        if not max_rate:
+            return connection_id
+        separator = "&" if "?" in connection_id else "?"
+        return f"{connection_id}{separator}max_rate={max_rate[0]}"
+
+    @staticmethod
+    def get_image_region_connection_id(channel: PyDMChannel) -> Optional[str]:
+        """
+        The connection id for plugins cropping and binning images as requested by channel addresses.
+
+        Channels asking for different regions of the same address each need a connection of their own.
+        """
+        connection_id = PyDMPlugin.get_full_address(channel)
+        parsed_addr = parsed_address(channel.address)
+        if connection_id is not None and parsed_addr.query:
+            try:
+                region = parse_image_region(parsed_addr.query)
+            except ValueError:
+                region = None
+            if region is not None:
+                connection_id = f"{connection_id}?roi={region.roi}&bin={region.binning}&width={region.width}"
+        return PyDMPlugin.get_max_rate_connection_id(connection_id, channel)
 
     def add_connection(self, channel: PyDMChannel) -> None:
         from pydm.utilities import is_qt_designer
@@ -303,6 +493,70 @@ class PyDMPlugin(object):
             else:
                 self.connections[connection_id] = self.connection_class(channel, address, self.protocol)
 
+    def add_connections(self, channels: List[PyDMChannel]) -> None:
+        """
+        Connect several channels to this plugin at once.
+
+        The plugin lock is taken a single time for the whole batch, and the
+        channels are grouped by connection id so that each underlying
+        connection is created only once, with any further channels for it
+        added as listeners. Once the batch is done, flush_connections is
+        called so that plugins can send out their pending requests together.
+        Plugins which override add_connection have it called for each channel
+        instead, so that their own logic still applies.
+
+        Parameters
+        ----------
+        channels : list of PyDMChannel
+            The channels to connect.
+        """
+        from pydm.utilities import is_qt_designer
+
+        if type(self).add_connection is not PyDMPlugin.add_connection:
+            for channel in channels:
+                try:
+                    self.add_connection(channel)
+                except Exception:
+                    logger.exception("Unable to make proper connection for %r", channel)
+            self.flush_connections()
+            return
+
+        if is_qt_designer() and not config.DESIGNER_ONLINE and not self.designer_online_by_default:
+            return
+
+        with self.lock:
+            grouped = {}
+            for channel in channels:
+                # If this channel is already connected to this plugin lets ignore
+                if channel in self.channels:
+                    continue
+                try:
+                    connection_id = self.get_connection_id(channel)
+                    address = self.get_address(channel)
+                except Exception:
+                    logger.exception("Unable to make proper connection for %r", channel)
+                    continue
+                grouped.setdefault(connection_id, (address, []))[1].append(channel)
+
+            for connection_id, (address, group) in grouped.items():
+                for channel in group:
+                    self.channels.add(channel)
+                    if connection_id in self.connections:
+                        self.connections[connection_id].add_listener(channel)
+                    else:
+                        self.connections[connection_id] = self.connection_class(channel, address, self.protocol)
+
+            self.flush_connections()
+
+    def flush_connections(self) -> None:
+        """
+        Called after a batch of channels has been connected by add_connections.
+
+        Plugins whose connections queue up network requests can override this
+        to send them all at once. The default implementation does nothing.
+        """
+        pass
+
     def remove_connection(self, channel: PyDMChannel, destroying: bool = False) -> None:
         with self.lock:
             connection_id = self.get_connection_id(channel)
@@ -0,0 +1,96 @@
+import os
+import numpy as np
+from unittest import mock
+from pydm import config
+from pydm.data_plugins.archiver_cache import TILE_SECONDS, ArchiverTileCache, is_cacheable
+from pydm.data_plugins.archiver_plugin import Connection
+from pydm.tests.conftest import ConnectionSignals
+from pydm.widgets.channel import PyDMChannel
+
+# Two hours of data with a point every ten minutes, starting at a tile boundary a long time ago
+START = 1000 * TILE_SECONDS
+DATA = np.array([np.arange(START, START + 2 * TILE_SECONDS, 600, dtype=float), np.arange(12, dtype=float)])
+
+
+def test_is_cacheable():
+    """Only data that does not depend on the requested range can be split into tiles"""
+    assert is_cacheable(None)
+    assert is_cacheable("")
+    assert is_cacheable("mean_60")
+    assert not is_cacheable("mean_7")
+    assert not is_cacheable("optimized_1000")
+
+
+def test_store_and_load(tmp_path):
+    """Verify data is served from the tiles it was split into, and only once every tile of the range is cached"""
+    cache = ArchiverTileCache(str(tmp_path), max_bytes=1024**2)
+    assert cache.load("pv=PV", START, START + 100) is None
+
+    cache.store("pv=PV", START, START + TILE_SECONDS, DATA)
+    assert cache.load("pv=PV", START + 1500, START + 3000).tolist() == DATA[:, 2:6].tolist()
+    # The second tile was never stored, and the first tile is not shared with other PVs
+    assert cache.load("pv=PV", START + 1500, START + TILE_SECONDS + 1) is None
+    assert cache.load("pv=OTHER", START + 1500, START + 3000) is None
+
+    # The tiles left by a previous session are found again
+    cache.store("pv=PV", START, START + 2 * TILE_SECONDS, DATA)
+    cache = ArchiverTileCache(str(tmp_path), max_bytes=1024**2)
+    assert np.array_equal(cache.load("pv=PV", START, START + 2 * TILE_SECONDS - 1), DATA)
+    assert cache.hits == 1 and cache.misses == 0
+
+
+def test_store_leading_sample(tmp_path):
+    """Verify tiles keep the last sample before them, so that the value of a slowly changing PV is known"""
+    cache = ArchiverTileCache(str(tmp_path), max_bytes=1024**2)
+    # As returned by the appliance, the last sample before the requested range comes first
+    data = np.array([[START - 100, START + TILE_SECONDS + 600], [1.0, 2.0]])
+    cache.store("pv=PV", START, START + 2 * TILE_SECONDS, data)
+    assert cache.load("pv=PV", START + 1500, START + 3000).tolist() == [[START - 100], [1.0]]
+    assert cache.load("pv=PV", START, START + 2 * TILE_SECONDS - 1).tolist() == data.tolist()
+
+    # Without a sample before the range, the value at the start of the first tile is unknown
+    data = np.array([[START + 600, START + TILE_SECONDS + 600], [1.0, 2.0]])
+    cache.store("pv=OTHER", START, START + 2 * TILE_SECONDS, data)
+    assert cache.load("pv=OTHER", START + 1500, START + 3000) is None
+    assert cache.load("pv=OTHER", START + TILE_SECONDS, START + 2 * TILE_SECONDS - 1).tolist() == data.tolist()
+
+
+def test_eviction(tmp_path):
+    """Verify the least recently used tiles are removed once the cache grows past its limit"""
+    cache = ArchiverTileCache(str(tmp_path), max_bytes=1024**2)
+    cache.store("pv=PV", START, START + 2 * TILE_SECONDS, DATA)
+    cache.max_bytes = cache.size
+    # Using the first tile makes the second one the least recently used
+    assert cache.load("pv=PV", START, START + 100) is not None
+    cache.store("pv=OTHER", START, START + TILE_SECONDS, DATA)
+    assert cache.size <= cache.max_bytes
+    assert cache.load("pv=PV", START, START + 100) is not None
+    assert cache.load("pv=PV", START + TILE_SECONDS, START + TILE_SECONDS + 100) is None
+
+
+def test_fetch_cached_data(qtbot, signals: ConnectionSignals, tmp_path, monkeypatch):
+    """Ensure a request fully covered by cached data is answered without going to the network"""
+    monkeypatch.setattr(config, "ARCHIVER_CACHE_DIR", str(tmp_path))
+    archiver_connection = Connection(PyDMChannel(), "pv=mock_pv_address")
+    archiver_connection.network_manager = mock.Mock()
+    archiver_connection.new_value_signal[np.ndarray].connect(signals.receiveValue)
+
+    with mock.patch.dict(os.environ, {"PYDM_ARCHIVER_URL": "http://mock-pydm-url"}):
+        archiver_connection.fetch_data(START + 1500, START + 3000)
+        request_url = archiver_connection.network_manager.get.call_args[0][0].url().url()
+        # Whole tiles are requested so the response can be cached
+        assert "from=1970-02-11T16:00:00.000Z&to=1970-02-11T17:00:00.000Z" in request_url
+
+        # Store the data as if it had come back from the network, then ask again
+        data = archiver_connection._decode(
+            b'[{"data": [' + b",".join(b'{"secs": %d, "val": %d}' % (t, v) for t, v in DATA.T[:6]) + b"]}]",
+            optimized=False,
+            is_raw=False,
+            cache_context=archiver_connection._replies.popitem()[1][1],
+        )
+        assert data.tolist() == DATA[:, 2:6].tolist()
+
+        archiver_connection.fetch_data(START + 1500, START + 3000)
+        assert archiver_connection.network_manager.get.call_count == 1
+        qtbot.waitUntil(lambda: signals.value is not None)
+        assert signals.value.tolist() == DATA[:, 2:6].tolist()
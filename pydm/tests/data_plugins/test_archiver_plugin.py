@@ -1,8 +1,12 @@
 import os
+import struct
 import numpy as np
+from concurrent.futures import Future
 from unittest import mock
 from qtpy.QtCore import QUrl
 from qtpy.QtNetwork import QNetworkRequest, QNetworkReply
+from pydm.data_plugins import archiver_plugin
+from pydm.data_plugins.archiver_codec import decode_pb
 from pydm.data_plugins.archiver_plugin import Connection
 from pydm.tests.conftest import ConnectionSignals
 from pydm.widgets.channel import PyDMChannel
@@ -119,3 +123,117 @@ def test_data_request_finished(signals: ConnectionSignals):
     # Verify the data was sent as expected (timestamps, values, standard deviations, minimums, maximums)
     expected_data_sent = np.array([[100, 101, 102], [53, 54.1, 53.9], [0.2, 0.3, 0.1], [52, 54, 53.8], [54, 55, 54]])
     assert np.array_equal(signals._value, expected_data_sent)
+
+
+def _pb_line(*fields) -> bytes:
+    """Encode (field number, wire type, value) tuples as an escaped line of the archiver protocol buffer format"""
+    message = b""
+    for number, wire_type, value in fields:
+        message += bytes([number << 3 | wire_type])
+        if wire_type == 0:
+            while value > 0x7F:
+                message += bytes([value & 0x7F | 0x80])
+                value >>= 7
+            message += bytes([value])
+        elif wire_type == 2:
+            message += bytes([len(value)]) + value
+        else:
+            message += value
+    return message.replace(b"\x1b", b"\x1b\x01").replace(b"\n", b"\x1b\x02").replace(b"\r", b"\x1b\x03") + b"\n"
+
+
+def test_decode_pb():
+    """Verify that responses in the binary protocol buffer format are decoded into the same layout as JSON"""
+    year_start = 1640995200  # 2022-01-01T00:00:00Z
+    # Header: SCALAR_DOUBLE payload for 2022, then samples at 100, 101 and 10 (whose value has to be escaped) seconds
+    payload = _pb_line((1, 0, 6), (2, 2, b"ROOM:TEMP"), (3, 0, 2022))
+    for secs, value in ((100, 53.0), (101, 54.1), (10, struct.unpack("<d", b"\n\r\x1b\x00\x00\x00\xf0?")[0])):
+        payload += _pb_line((1, 0, secs), (2, 0, 5), (3, 1, struct.pack("<d", value)))
+    # Start of a new chunk holding SCALAR_SHORT (zigzag encoded) data for 2023
+    payload += b"\n" + _pb_line((1, 0, 1), (2, 2, b"ROOM:TEMP"), (3, 0, 2023)) + _pb_line((1, 0, 5), (3, 0, 3))
+
+    data = decode_pb(payload)
+    assert data.shape == (2, 4)
+    assert np.array_equal(data[0], [year_start + 100, year_start + 101, year_start + 10, 1672531200 + 5])
+    assert data[1][:2].tolist() == [53.0, 54.1]
+    assert data[1][2] == struct.unpack("<d", b"\n\r\x1b\x00\x00\x00\xf0?")[0]
+    assert data[1][3] == -2
+
+    # Optimized data is sent as a waveform of statistics
+    payload = _pb_line((1, 0, 13), (3, 0, 2022))
+    payload += _pb_line((1, 0, 100), (3, 2, np.array([53, 0.2, 52, 54, 10], dtype="<f8").tobytes()))
+    data = decode_pb(payload, optimized=True)
+    assert np.array_equal(data, [[year_start + 100], [53], [0.2], [52], [54]])
+
+
+@mock.patch.dict(os.environ, {"PYDM_ARCHIVER_URL": "http://mock-pydm-url", "PYDM_ARCHIVER_FORMAT": "raw"})
+def test_fetch_raw_data():
+    """Ensure the binary retrieval format is requested when configured"""
+    archiver_connection = Connection(PyDMChannel(), "pv=mock_pv_address")
+    archiver_connection.network_manager = MockNetworkManager()
+    archiver_connection.fetch_data(1639468800, 1639560600)
+    assert archiver_connection.network_manager.request_url.startswith(
+        "http://mock-pydm-url/retrieval/data/getData.raw?pv=mock_pv_address"
+    )
+
+
+@mock.patch.dict(os.environ, {"PYDM_ARCHIVER_URL": "http://mock-pydm-url"})
+def test_deduplicate_requests():
+    """Identical requests made while waiting for a reply are not sent again"""
+    archiver_connection = Connection(PyDMChannel(), "pv=mock_pv_address")
+    archiver_connection.network_manager = mock.Mock()
+    replies = [MockNetworkReply(is_optimized=False) for _ in range(3)]
+    archiver_connection.network_manager.get.side_effect = replies
+
+    archiver_connection.fetch_data(1639468800, 1639560600)
+    archiver_connection.fetch_data(1639468800, 1639560600)
+    archiver_connection.fetch_data(1639468800, 1639560700)
+    assert archiver_connection.network_manager.get.call_count == 2
+    assert archiver_connection.requests_sent == 2
+    assert archiver_connection.requests_saved == 1
+
+    received = []
+    archiver_connection.new_value_signal[np.ndarray].connect(received.append)
+    archiver_connection.data_request_finished(replies[0])  # type: ignore
+    assert archiver_connection.bytes_saved == len(replies[0].response)
+    # The reply is tagged with the range it was requested for
+    assert received[0].requested_range == (1639468800, 1639560600)
+
+    # Once the reply is received, the same request is sent again
+    archiver_connection.fetch_data(1639468800, 1639560600)
+    assert archiver_connection.network_manager.get.call_count == 3
+
+
+class DeferredPool:
+    """Stands in for the decoding thread pool, running the submitted tasks only when asked to"""
+
+    def __init__(self):
+        self.tasks = []
+
+    def submit(self, function, *args):
+        future = Future()
+        self.tasks.append((future, function, args))
+        return future
+
+    def run(self):
+        for future, function, args in self.tasks:
+            future.set_result(function(*args))
+
+
+def test_decoded_data_order(monkeypatch):
+    """Replies are sent in the order they were received, even when a later one is decoded first"""
+    pool = DeferredPool()
+    monkeypatch.setattr(archiver_plugin, "decode_pool", lambda: pool)
+    archiver_connection = Connection(PyDMChannel(), "pv=mock_pv_address")
+    received = []
+    archiver_connection.new_value_signal[np.ndarray].connect(received.append)
+
+    # The optimized reply is large enough to be decoded on the thread pool, the raw one is decoded right away
+    large_reply, small_reply = MockNetworkReply(is_optimized=True), MockNetworkReply(is_optimized=False)
+    monkeypatch.setattr(archiver_plugin, "ASYNC_DECODE_THRESHOLD", len(small_reply.response) + 1)
+    archiver_connection.data_request_finished(large_reply)  # type: ignore
+    archiver_connection.data_request_finished(small_reply)  # type: ignore
+    assert received == []
+
+    pool.run()
+    assert [data.shape[0] for data in received] == [5, 2]
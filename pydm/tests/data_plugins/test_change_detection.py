@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from pydm import config
+from pydm.data_plugins.epics_plugins.change_detection import (
+    ChangeDetector,
+    change_detection_connection_id,
+    change_detection_strategy,
+)
+from pydm.widgets.channel import PyDMChannel
+
+
+def test_default_strategy():
+    """Arrays are compared by timestamp by default, and scalars exactly"""
+    detector = ChangeDetector()
+    waveform = np.arange(10.0)
+    assert detector.changed(waveform, timestamp=1.0)
+    # Same timestamp, so the same update delivered again
+    assert not detector.changed(waveform.copy(), timestamp=1.0)
+    assert detector.changed(waveform.copy(), timestamp=2.0)
+    # Without a timestamp, arrays are compared exactly
+    assert not detector.changed(waveform.copy())
+    assert detector.changed(waveform + 1)
+
+    assert detector.changed(5, timestamp=3.0)
+    assert not detector.changed(5, timestamp=4.0)
+    assert detector.unchanged == 3
+
+    detector.reset()
+    assert detector.changed(5, timestamp=4.0)
+
+
+def test_hash_strategy():
+    """Values are compared through a hash of a sample of their elements"""
+    detector = ChangeDetector("hash")
+    waveform = np.zeros(100000)
+    assert detector.changed(waveform)
+    assert not detector.changed(waveform.copy())
+    sampled = waveform.copy()
+    sampled[0] = 1.0
+    assert detector.changed(sampled)
+    assert detector.changed(sampled.reshape(1000, 100))
+    assert detector.changed(sampled.astype(np.float32).reshape(1000, 100))
+    assert detector.changed("text") and not detector.changed("text")
+
+
+@pytest.mark.parametrize("strategy, expected", [("always", [True, True, True]), ("exact", [True, False, True])])
+def test_always_and_exact_strategies(strategy, expected):
+    detector = ChangeDetector(strategy)
+    values = [np.ones(3), np.ones(3), np.zeros(3)]
+    assert [detector.changed(value, timestamp=1.0) for value in values] == expected
+
+
+def test_change_detection_strategy(monkeypatch):
+    """The change_detection address option takes precedence over the global configuration"""
+    assert change_detection_strategy(PyDMChannel("ca://TEST:WAVEFORM")) is None
+    monkeypatch.setattr(config, "CHANGE_DETECTION", "exact")
+    assert change_detection_strategy(PyDMChannel("ca://TEST:WAVEFORM")) == "exact"
+    assert change_detection_strategy(PyDMChannel("ca://TEST:WAVEFORM?change_detection=hash")) == "hash"
+    assert change_detection_strategy(PyDMChannel("ca://TEST:WAVEFORM?change_detection=fast")) is None
+    with pytest.raises(ValueError):
+        ChangeDetector("fast")
+
+
+def test_change_detection_connection_id():
+    """Channels asking for different strategies for the same PV get different connection ids"""
+    assert change_detection_connection_id("TEST:WAVEFORM", PyDMChannel("ca://TEST:WAVEFORM")) == "TEST:WAVEFORM"
+    channel = PyDMChannel("ca://TEST:WAVEFORM?change_detection=HASH")
+    assert change_detection_connection_id("TEST:WAVEFORM", channel) == "TEST:WAVEFORM?change_detection=hash"
+    assert change_detection_connection_id("TEST:WAVEFORM?bin=2", channel) == "TEST:WAVEFORM?bin=2&change_detection=hash"
+    assert change_detection_connection_id(None, channel) is None
@@ -1,11 +1,12 @@
 import functools
 import numpy as np
 import pytest
-from p4p.nt import NTEnum, NTScalar
+from p4p.nt import NTEnum, NTNDArray, NTScalar
 from pydm.data_plugins.epics_plugins.p4p_plugin_component import Connection, P4PPlugin
 from pydm.tests.conftest import ConnectionSignals
 from pydm.widgets.channel import PyDMChannel
 from pytest import MonkeyPatch
+from qtpy.QtWidgets import QWidget
 from p4p.wrapper import Type, Value
 
 
@@ -300,3 +301,58 @@ def test_create_rpc_value_obj(
 
     for item1, item2 in zip(result_query.items(), expected_query.items()):
         assert item1 == item2
+
+
+class ImageListener(QWidget):
+    """A widget receiving the frames of a connection"""
+
+    def __init__(self):
+        super().__init__()
+        self.frames = []
+
+    def receive_value(self, value):
+        self.frames.append(value)
+
+
+def test_decode_frame_skipped_while_hidden(qtbot, monkeypatch: MonkeyPatch):
+    """Ensure that NTNDArray frames are only decoded while a widget listening to them is visible"""
+    monkeypatch.setattr(P4PPlugin, "context", MockContext())
+    monkeypatch.setattr(P4PPlugin.context, "monitor", lambda **args: None)
+    listener = ImageListener()
+    qtbot.addWidget(listener)
+    channel = PyDMChannel(address="pva://TEST:IMAGE", value_slot=listener.receive_value)
+    p4p_connection = Connection(channel, "TEST:IMAGE")
+
+    for i in range(3):
+        p4p_connection.send_new_value(NTNDArray().wrap(np.full((3, 4), i, dtype=np.uint16)))
+    assert p4p_connection.frames_skipped == 3
+    assert listener.frames == []
+
+    # The latest frame is decoded once the widget is shown
+    listener.show()
+    qtbot.waitUntil(lambda: len(listener.frames) == 1)
+    assert listener.frames[0].shape == (4, 3)
+    assert (listener.frames[0] == 2).all()
+
+    listener.hide()
+    p4p_connection.send_new_value(NTNDArray().wrap(np.zeros((3, 4), dtype=np.uint16)))
+    assert p4p_connection.frames_skipped == 4
+
+    p4p_connection.remove_listener(channel)
+    assert not p4p_connection._consumer_widgets
+
+
+def test_decode_frame_image_region(qtbot, monkeypatch: MonkeyPatch):
+    """Ensure that frames are cropped and binned as requested by the channel address before being sent"""
+    monkeypatch.setattr(P4PPlugin, "context", MockContext())
+    monkeypatch.setattr(P4PPlugin.context, "monitor", lambda **args: None)
+    received = []
+    channel = PyDMChannel(address="pva://TEST:IMAGE?roi=1,0,4,2&bin=2", value_slot=received.append)
+    p4p_connection = Connection(channel, "TEST:IMAGE")
+    assert P4PPlugin.get_connection_id(channel) != P4PPlugin.get_connection_id(PyDMChannel("pva://TEST:IMAGE"))
+
+    p4p_connection.send_new_value(NTNDArray().wrap(np.arange(30, dtype=np.uint8).reshape(6, 5)))
+    qtbot.waitUntil(lambda: len(received) == 1)
+    # Rows 0 and 1, columns 1 to 4 of the image, binned, and sent in the same (x, y) layout as whole frames
+    assert received[0].shape == (2, 1)
+    assert received[0].reshape(1, 2).tolist() == [[4.0, 6.0]]
@@ -1,6 +1,8 @@
 from unittest.mock import MagicMock
 
+from pydm import config
 from pydm.data_plugins import PyDMPlugin
+from pydm.data_plugins.plugin import PyDMConnection
 from pydm.widgets.channel import PyDMChannel
 
 
@@ -28,6 +30,47 @@ def test_connections():
     assert len(pydm_plugin.connections) == 0
 
 
+def test_add_connections():
+    """Test that connecting channels in bulk creates a single connection per address and flushes once"""
+    pydm_plugin = PyDMPlugin()
+    pydm_plugin.flush_connections = MagicMock()
+
+    channels = [PyDMChannel("ca://TEST:CHANNEL:ONE"), PyDMChannel("ca://TEST:CHANNEL:TWO")]
+    channels += [PyDMChannel("ca://TEST:CHANNEL:ONE", value_slot=lambda: None) for _ in range(3)]
+    pydm_plugin.add_connections(channels)
+
+    pydm_plugin.flush_connections.assert_called_once()
+    assert all(channel in pydm_plugin.channels for channel in channels)
+    assert sorted(pydm_plugin.connections) == ["TEST:CHANNEL:ONE", "TEST:CHANNEL:TWO"]
+    # The base connection class does not register its first channel, the others are added as listeners
+    assert pydm_plugin.connections["TEST:CHANNEL:ONE"].listener_count == 3
+    assert pydm_plugin.connections["TEST:CHANNEL:TWO"].listener_count == 0
+
+    # Channels which are already connected are skipped
+    pydm_plugin.add_connections(channels[:2])
+    assert pydm_plugin.connections["TEST:CHANNEL:ONE"].listener_count == 3
+
+
+def test_add_connections_override():
+    """Test that plugins which override add_connection have it called for each channel connected in bulk"""
+
+    class CustomPlugin(PyDMPlugin):
+        def add_connection(self, channel):
+            self.added.append(channel)
+            super().add_connection(channel)
+
+    pydm_plugin = CustomPlugin()
+    pydm_plugin.added = []
+    pydm_plugin.flush_connections = MagicMock()
+
+    channels = [PyDMChannel("ca://TEST:CHANNEL:ONE"), PyDMChannel("ca://TEST:CHANNEL:TWO")]
+    pydm_plugin.add_connections(channels)
+
+    assert pydm_plugin.added == channels
+    assert sorted(pydm_plugin.connections) == ["TEST:CHANNEL:ONE", "TEST:CHANNEL:TWO"]
+    pydm_plugin.flush_connections.assert_called_once()
+
+
 def test_signal_slot_disconnect():
     """When a listener is removed from a channel, verify all signals/slots for that listener are disconnected"""
     pydm_plugin = PyDMPlugin()
@@ -66,6 +109,66 @@ def test_signal_slot_disconnect():
     signal_two[str].disconnect.assert_called()
 
 
+def test_coalesced_values(qtbot):
+    """Verify that a connection with a maximum update rate only delivers the latest of several pending values"""
+    pydm_plugin = PyDMPlugin()
+    received = []
+    channel = PyDMChannel("ca://TEST:COALESCED?max_rate=5", value_slot=received.append)
+    pydm_plugin.add_connection(channel)
+
+    connection = pydm_plugin.connections["TEST:COALESCED?max_rate=5"]
+    assert connection.max_rate == 5
+    connection.add_listener(channel)
+
+    for value in (1, 2, 3):
+        connection.new_value_signal[int].emit(value)
+    assert received == []
+
+    assert connection.flush_pending_value(now=100.0)
+    qtbot.waitUntil(lambda: received == [3])
+    assert connection.dropped_updates == 2
+    assert connection.merged_updates == 1
+
+    # The next value is held back until 1 / max_rate seconds have passed since the previous delivery
+    connection.new_value_signal[int].emit(4)
+    assert not connection.flush_pending_value(now=100.1)
+    assert connection.flush_pending_value(now=100.2)
+    qtbot.waitUntil(lambda: received == [3, 4])
+    assert connection.dropped_updates == 2
+    assert connection.merged_updates == 1
+
+    pydm_plugin.remove_connection(channel)
+
+
+def test_max_rate_configuration(monkeypatch):
+    """The per-channel max_rate address option takes precedence over the global configuration"""
+    assert PyDMConnection.get_max_rate(PyDMChannel("ca://TEST:CHANNEL")) == 0
+    monkeypatch.setattr(config, "MAX_UPDATE_RATE", 20.0)
+    assert PyDMConnection.get_max_rate(PyDMChannel("ca://TEST:CHANNEL")) == 20.0
+    assert PyDMConnection.get_max_rate(PyDMChannel("ca://TEST:CHANNEL?max_rate=2.5")) == 2.5
+    assert PyDMConnection.get_max_rate(PyDMChannel("ca://TEST:CHANNEL?max_rate=0")) == 0
+    assert PyDMConnection.get_max_rate(None) == 20.0
+
+
+def test_max_rate_connection_id():
+    """Channels asking for different rates for the same address are given connections of their own"""
+    pydm_plugin = PyDMPlugin()
+    channels = [PyDMChannel("ca://TEST:CHANNEL"), PyDMChannel("ca://TEST:CHANNEL?max_rate=10")]
+    for channel in channels:
+        pydm_plugin.add_connection(channel)
+
+    assert sorted(pydm_plugin.connections) == ["TEST:CHANNEL", "TEST:CHANNEL?max_rate=10"]
+    assert pydm_plugin.connections["TEST:CHANNEL"].max_rate == 0
+    assert pydm_plugin.connections["TEST:CHANNEL?max_rate=10"].max_rate == 10.0
+    assert (
+        PyDMPlugin.get_image_region_connection_id(PyDMChannel("pva://CAM:IMAGE?bin=2&max_rate=5"))
+        == "CAM:IMAGE?roi=None&bin=(2, 2)&width=None&max_rate=5"
+    )
+
+    pydm_plugin.remove_connection(channels[1])
+    assert sorted(pydm_plugin.connections) == ["TEST:CHANNEL"]
+
+
 def assert_all_signal_receivers(connection, expected_receivers):
     signals = [
         "new_value_signal",
@@ -108,3 +211,19 @@ def create_channel(address, value_signal):
         value_signal=value_signal,
         timestamp_slot=lambda: None,
     )
+
+
+def test_image_region_configuration():
+    """The roi and bin address options give the image region, and a connection id of its own"""
+    channel = PyDMChannel("pva://CAM:IMAGE?roi=10,20,300,400&bin=4")
+    region = PyDMConnection.get_image_region(channel)
+    assert region.roi == (10, 20, 300, 400)
+    assert region.binning == (4, 4)
+    assert PyDMConnection.get_image_region(PyDMChannel("pva://CAM:IMAGE")) is None
+    assert PyDMConnection.get_image_region(PyDMChannel("pva://CAM:IMAGE?bin=0")) is None
+
+    assert PyDMPlugin.get_image_region_connection_id(PyDMChannel("pva://CAM:IMAGE?width=2048")) == "CAM:IMAGE"
+    assert PyDMPlugin.get_image_region_connection_id(channel) != "CAM:IMAGE"
+    assert PyDMPlugin.get_image_region_connection_id(channel) == PyDMPlugin.get_image_region_connection_id(
+        PyDMChannel("pva://CAM:IMAGE?bin=4,4&roi=10,20,300,400")
+    )
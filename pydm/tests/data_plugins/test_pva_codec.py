@@ -0,0 +1,37 @@
+import numpy as np
+from p4p.nt import NTNDArray
+from pydm.data_plugins.epics_plugins.pva_codec import BufferPool, decompress
+
+
+def test_buffer_pool_reuse():
+    """Ensure that output arrays are only handed out again once nothing else references them"""
+    pool = BufferPool(max_buffers=2, max_shapes=2)
+    first = pool.get((3, 4), np.uint16)
+    assert first.shape == (3, 4) and first.dtype == np.uint16
+
+    # Still referenced, so a new array is needed
+    second = pool.get((3, 4), np.uint16)
+    assert second is not first
+
+    # Views keep their base referenced as well
+    view = second.reshape(12)
+    del first
+    third = pool.get((3, 4), np.uint16)
+    assert third is not second
+    assert (pool.allocated, pool.reused) == (2, 1)
+    del view, second, third
+
+    pool.get((5,), np.float64)
+    pool.get((6,), np.float64)
+    # The (3, 4) arrays were the least recently used, and have been forgotten
+    pool.get((3, 4), np.uint16)
+    assert pool.allocated == 5
+
+
+def test_decompress_uncompressed():
+    """Ensure that uncompressed frames are reshaped to their dimensions"""
+    image = np.arange(12, dtype=np.int16).reshape(3, 4)
+    decoded = decompress(NTNDArray().wrap(image))
+    assert decoded.shape == (4, 3)
+    assert np.array_equal(decoded.ravel(), image.ravel())
+    assert decompress(None) is None
@@ -1,3 +1,4 @@
+import numpy as np
 from pydm.data_plugins.epics_plugins.pyepics_plugin_component import Connection
 from pydm.tests.conftest import ConnectionSignals
 from pydm.widgets.channel import PyDMChannel
@@ -28,3 +29,21 @@ def test_update_ctrl_vars(signals: ConnectionSignals):
 
     expected_values = [70, 20, 100, 2, 90, 10]
     assert values_received == expected_values
+
+
+def test_send_new_value_change_detection():
+    """Verify that a waveform delivered again with the same timestamp is not sent to widgets a second time"""
+    values_received = []
+    mock_pyepics_connection = Connection(PyDMChannel(), "Test:PV:2")
+    mock_pyepics_connection.new_value_signal[np.ndarray].connect(values_received.append)
+
+    waveform = np.arange(1000)
+    mock_pyepics_connection.send_new_value(waveform, timestamp=10.0)
+    mock_pyepics_connection.send_new_value(waveform, timestamp=10.0)
+    mock_pyepics_connection.send_new_value(waveform.copy(), timestamp=11.0)
+    assert len(values_received) == 2
+
+    # After a reconnection the value is always sent again
+    mock_pyepics_connection.clear_cache()
+    mock_pyepics_connection.send_new_value(waveform, timestamp=11.0)
+    assert len(values_received) == 3
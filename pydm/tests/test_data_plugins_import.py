@@ -5,12 +5,14 @@ import entrypoints
 from pydm import config
 from pydm.data_plugins import (
     PyDMPlugin,
+    connection_queue,
     initialize_plugins_if_needed,
     load_plugins_from_entrypoints,
     load_plugins_from_path,
     plugin_for_address,
     plugin_modules,
 )
+from pydm.widgets.channel import PyDMChannel
 
 
 def test_data_plugin_add(qapp, test_plugin):
@@ -52,6 +54,20 @@ def test_plugin_for_address(test_plugin, monkeypatch):
     assert isinstance(plugin_for_address("tst:this"), test_plugin)
 
 
+def test_queued_connections_are_batched(qapp, test_plugin, monkeypatch):
+    plugin = plugin_for_address("tst://tst:this")
+    batches = []
+    monkeypatch.setattr(plugin, "add_connections", lambda channels: batches.append(list(channels)))
+
+    channels = [PyDMChannel("tst://tst:{}".format(i)) for i in range(5)]
+    with connection_queue():
+        for channel in channels:
+            channel.connect()
+        assert batches == []
+
+    assert batches == [channels]
+
+
 fake_file = """\
 from pydm.data_plugins import PyDMPlugin
 
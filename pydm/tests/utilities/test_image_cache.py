@@ -0,0 +1,82 @@
+import os
+
+from qtpy.QtCore import Qt, QSize
+from qtpy.QtGui import QPixmap
+from qtpy.QtSvg import QSvgRenderer
+
+from pydm.utilities.image_cache import ImageCache, bucket_size
+
+SVG = """<svg xmlns="http://www.w3.org/2000/svg" width="40" height="20">
+<rect width="40" height="20" fill="red"/>
+</svg>
+"""
+
+
+def write_png(path, color, size=QSize(40, 20)):
+    pixmap = QPixmap(size)
+    pixmap.fill(color)
+    assert pixmap.save(str(path), "PNG")
+
+
+def test_bucket_size():
+    assert bucket_size(QSize(1, 1)) == QSize(8, 8)
+    assert bucket_size(QSize(16, 17)) == QSize(16, 24)
+
+
+def test_load_shared(qapp, tmp_path):
+    cache = ImageCache(1024**2)
+    svg_path = tmp_path / "valve.svg"
+    svg_path.write_text(SVG)
+    png_path = tmp_path / "valve.png"
+    write_png(png_path, Qt.red)
+
+    svg = cache.load(str(svg_path))
+    assert isinstance(svg, QSvgRenderer)
+    assert cache.load(str(svg_path)) is svg
+    png = cache.load(str(png_path))
+    assert isinstance(png, QPixmap)
+    assert cache.load(str(png_path)) is png
+    assert cache.load(str(tmp_path / "missing.png")) is None
+
+    # A file changed on disk is loaded again
+    write_png(png_path, Qt.blue, QSize(10, 10))
+    stat = os.stat(png_path)
+    os.utime(png_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000))
+    reloaded = cache.load(str(png_path))
+    assert reloaded is not png
+    assert reloaded.size() == QSize(10, 10)
+
+
+def test_rendered(qapp, tmp_path):
+    cache = ImageCache(1024**2)
+    svg_path = tmp_path / "valve.svg"
+    svg_path.write_text(SVG)
+
+    pixmap = cache.rendered(str(svg_path), QSize(30, 15))
+    assert pixmap.size() == QSize(32, 16)
+    assert pixmap.toImage().pixelColor(16, 8).name() == "#ff0000"
+    # Sizes in the same bucket share the rasterization
+    assert cache.rendered(str(svg_path), QSize(32, 10)) is pixmap
+    assert cache.rendered(str(svg_path), QSize(33, 10)) is not pixmap
+    assert cache.rendered(str(svg_path), QSize(0, 10)) is None
+    # High DPI screens get a rasterization at their resolution
+    hidpi = cache.rendered(str(svg_path), QSize(30, 15), 2.0)
+    assert hidpi.size() == QSize(64, 32)
+    assert hidpi.devicePixelRatio() == 2.0
+
+
+def test_eviction(qapp, tmp_path):
+    png_path = tmp_path / "valve.png"
+    write_png(png_path, Qt.red)
+    # Room for the source, a 32x32 and a 24x24 rasterization
+    cache = ImageCache(40 * 20 * 4 + 32 * 32 * 4 + 24 * 24 * 4)
+    first = cache.rendered(str(png_path), QSize(32, 32))
+    cache.rendered(str(png_path), QSize(24, 24))
+    assert cache.total_bytes <= cache.max_bytes
+    assert cache.rendered(str(png_path), QSize(32, 32)) is first
+
+    cache.rendered(str(png_path), QSize(16, 16))
+    assert cache.total_bytes <= cache.max_bytes
+    # The least recently used rasterization was evicted, the most recently used ones were kept
+    assert len(cache) == 3
+    assert cache.rendered(str(png_path), QSize(32, 32)) is first
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from pydm.utilities.image_region import ImageRegion, apply_image_region, bin_image, parse_image_region
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("", None),
+        ("max_rate=10", None),
+        ("roi=1,2,3,4", ImageRegion((1, 2, 3, 4), (1, 1), None)),
+        ("bin=4", ImageRegion(None, (4, 4), None)),
+        ("bin=2,3&width=640", ImageRegion(None, (2, 3), 640)),
+        ("roi=0,0,10,10&bin=2&max_rate=5", ImageRegion((0, 0, 10, 10), (2, 2), None)),
+    ],
+)
+def test_parse_image_region(query, expected):
+    assert parse_image_region(query) == expected
+
+
+@pytest.mark.parametrize("query", ["roi=1,2,3", "roi=0,0,0,10", "roi=-1,0,5,5", "bin=0", "bin=a", "bin=2&width=0"])
+def test_parse_invalid_image_region(query):
+    with pytest.raises(ValueError):
+        parse_image_region(query)
+
+
+def test_bin_image():
+    image = np.arange(7 * 9, dtype=np.uint16).reshape(7, 9)
+    binned = bin_image(image, 3, 2)
+    # The last row and the last columns are not part of a whole block
+    assert binned.shape == (3, 3)
+    assert binned.dtype == np.float32
+    assert binned[1, 2] == image[2:4, 6:9].mean()
+
+    color = np.random.rand(4, 4, 3)
+    binned = bin_image(color, 2, 2)
+    assert binned.shape == (2, 2, 3)
+    assert binned.dtype == np.float64
+    assert np.allclose(binned[1, 0], color[2:4, 0:2].mean(axis=(0, 1)))
+    assert bin_image(color, 1, 1) is color
+
+
+def test_apply_image_region():
+    image = np.arange(100).reshape(10, 10)
+    assert apply_image_region(image, None) is image
+
+    cropped = apply_image_region(image, ImageRegion((2, 1, 3, 4), (1, 1), None))
+    assert cropped.tolist() == image[1:5, 2:5].tolist()
+    # A region of interest past the edges of the image is clipped
+    assert apply_image_region(image, ImageRegion((8, 8, 5, 5), (1, 1), None)).shape == (2, 2)
+    assert apply_image_region(image, ImageRegion((0, 0, 4, 4), (2, 2), None)).tolist() == [[5.5, 7.5], [25.5, 27.5]]
+
+    # Flat images are only cropped when their width is known
+    flat = image.ravel()
+    assert apply_image_region(flat, ImageRegion((0, 0, 2, 2), (1, 1), None)) is flat
+    assert apply_image_region(flat, ImageRegion((0, 0, 2, 2), (1, 1), 10)).tolist() == [[0, 1], [10, 11]]
+    assert apply_image_region(flat, ImageRegion((0, 0, 2, 2), (1, 1), 7)) is flat
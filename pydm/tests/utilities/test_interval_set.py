@@ -0,0 +1,36 @@
+from pydm.utilities.interval_set import IntervalSet
+
+
+def test_add_and_remove():
+    intervals = IntervalSet()
+    intervals.add(10, 20)
+    intervals.add(30, 40)
+    intervals.add(50, 60)
+    assert list(intervals) == [(10, 20), (30, 40), (50, 60)]
+
+    # Overlapping and touching intervals are merged
+    intervals.add(15, 30)
+    assert list(intervals) == [(10, 40), (50, 60)]
+    intervals.add(0, 100)
+    assert list(intervals) == [(0, 100)]
+
+    intervals.remove(20, 30)
+    intervals.remove(90, 110)
+    assert list(intervals) == [(0, 20), (30, 90)]
+    intervals.remove(-10, 50)
+    assert list(intervals) == [(50, 90)]
+
+    intervals.clear()
+    assert len(intervals) == 0
+
+
+def test_gaps():
+    intervals = IntervalSet()
+    assert intervals.gaps(0, 10) == [(0, 10)]
+
+    intervals.add(10, 20)
+    intervals.add(30, 40)
+    assert intervals.gaps(0, 50) == [(0, 10), (20, 30), (40, 50)]
+    assert intervals.gaps(12, 35) == [(20, 30)]
+    assert intervals.gaps(12, 18) == []
+    assert intervals.covered(0, 50) == 20
@@ -0,0 +1,38 @@
+import numpy as np
+
+from pydm.utilities.min_max_pyramid import MinMaxPyramid
+
+
+def test_decimate_keeps_extremes():
+    values = np.random.default_rng(0).random(100000)
+    values[1234] = 10
+    values[98765] = -10
+    pyramid = MinMaxPyramid(len(values))
+
+    indices = pyramid.decimate(values, 0, len(values), 1000)
+    assert len(indices) <= 1010
+    assert np.all(np.diff(indices) > 0)
+    assert {0, 1234, 98765, len(values) - 1} <= set(indices)
+
+    # Every block of the range contributes its extremes, so each of them is at least as large as the
+    # values around it
+    subset = pyramid.decimate(values, 5000, 9000, 100)
+    assert subset[0] == 5000 and subset[-1] == 8999
+    assert 5000 + np.argmax(values[5000:9000]) in subset
+    assert 5000 + np.argmin(values[5000:9000]) in subset
+
+    # Short ranges are returned as they are
+    assert pyramid.decimate(values, 10, 20, 100).tolist() == list(range(10, 20))
+
+
+def test_invalidate():
+    values = np.zeros(1000)
+    pyramid = MinMaxPyramid(len(values))
+    assert 500 not in pyramid.decimate(values, 0, 1000, 10)
+
+    values[500] = 1
+    values[501] = np.nan
+    pyramid.invalidate(500, 502)
+    indices = pyramid.decimate(values, 0, 1000, 10)
+    assert 500 in indices
+    assert 501 not in indices
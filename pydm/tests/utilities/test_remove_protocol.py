@@ -1,6 +1,8 @@
 from pydm.utilities.remove_protocol import remove_protocol
 from pydm.utilities.remove_protocol import protocol_and_address
 from pydm.utilities.remove_protocol import parsed_address
+from pydm.utilities.remove_protocol import address_cache_info, clear_address_cache
+from pydm import config
 
 
 def test_remove_protocol():
@@ -52,3 +54,26 @@ def test_parsed_address():
 
     out = parsed_address("loc://my_variable_name?type=variable_type&init=initial_values")
     assert out == ("loc", "my_variable_name", "", "type=variable_type&init=initial_values")
+
+
+def test_parsed_address_cache(monkeypatch):
+    clear_address_cache()
+    first = parsed_address("foo://bar/baz?q")
+    second = parsed_address("foo://bar/baz?q")
+    assert first is second
+    info = address_cache_info()["parsed_address"]
+    assert info.hits == 1
+    assert info.misses == 1
+
+    # Changing the default protocol must not return stale results for addresses without one
+    monkeypatch.setattr(config, "DEFAULT_PROTOCOL", None)
+    assert parsed_address("bar") is None
+    monkeypatch.setattr(config, "DEFAULT_PROTOCOL", "ca")
+    assert parsed_address("bar") == ("ca", "bar", "", "")
+
+    assert protocol_and_address("foo://bar") == ("foo", "bar")
+    assert protocol_and_address("foo://bar") == ("foo", "bar")
+    assert address_cache_info()["protocol_and_address"].hits >= 1
+
+    clear_address_cache()
+    assert address_cache_info()["parsed_address"].currsize == 0
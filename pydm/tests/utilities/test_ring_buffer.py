@@ -0,0 +1,101 @@
+import numpy as np
+
+from pydm.utilities.ring_buffer import RingBuffer
+
+
+def test_append_and_latest():
+    ring = RingBuffer(4)
+    assert ring.capacity == 4
+    assert ring.rows == 2
+    assert ring.latest(0).shape == (2, 0)
+
+    for i in range(3):
+        ring.append(i, 10 * i)
+    assert np.array_equal(ring.latest(3), [[0, 1, 2], [0, 10, 20]])
+
+    # Wrap around the end of the storage
+    for i in range(3, 6):
+        ring.append(i, 10 * i)
+    assert np.array_equal(ring.latest(4), [[2, 3, 4, 5], [20, 30, 40, 50]])
+    assert np.array_equal(ring.latest(2), [[4, 5], [40, 50]])
+    # Asking for more than the capacity returns the whole buffer
+    assert ring.latest(10).shape == (2, 4)
+
+
+def test_item():
+    ring = RingBuffer(3)
+    for i in range(5):
+        ring.append(i, -i)
+    assert ring.item(0, -1) == 4
+    assert ring.item(1, -1) == -4
+    assert ring.item(0, 0) == 2
+    assert ring.item(0, -3) == 2
+
+
+def test_linearize_and_assign():
+    ring = RingBuffer(3)
+    for i in range(4):
+        ring.append(i, i)
+    data = ring.linearize()
+    assert np.array_equal(data, [[1, 2, 3], [1, 2, 3]])
+
+    # The linearized storage is the live buffer, so writes go through
+    data[1, -1] = 100
+    assert ring.item(1, -1) == 100
+
+    ring.append(4, 4)
+    assert np.array_equal(ring.linearize(), [[2, 3, 4], [2, 100, 4]])
+
+    ring.assign(np.array([[7.0, 8.0], [9.0, 10.0]]))
+    assert ring.capacity == 2
+    ring.append(11, 12)
+    assert np.array_equal(ring.latest(2), [[8, 11], [10, 12]])
+
+
+def test_extrema():
+    rng = np.random.default_rng(0)
+    ring = RingBuffer(5, track_extrema=True)
+    appended = []
+    for x, y in rng.normal(size=(40, 2)):
+        ring.append(x, y)
+        appended.append((x, y))
+        window = np.array(appended[-5:]).T
+        for row in range(2):
+            assert ring.extrema(row) == (np.amin(window[row]), np.amax(window[row]))
+        # A shorter range falls back to scanning
+        if len(appended) > 2:
+            assert ring.extrema(1, 2) == (np.amin(window[1, -2:]), np.amax(window[1, -2:]))
+
+
+def test_extrema_nan():
+    ring = RingBuffer(2, track_extrema=True)
+    ring.append(1, 1)
+    ring.append(np.nan, 2)
+    assert np.isnan(ring.extrema(0)).all()
+    assert ring.extrema(1) == (1, 2)
+    ring.append(3, 3)
+    assert np.isnan(ring.extrema(0)).all()
+    # Once the NaN has been overwritten it no longer contributes
+    ring.append(4, 4)
+    assert ring.extrema(0) == (3, 4)
+
+
+def test_decimate():
+    ring = RingBuffer(1000)
+    for i in range(1500):
+        ring.append(i, 100 if i == 1200 else i % 10)
+
+    assert ring.searchsorted(0, 1200) == 700
+    assert ring.searchsorted(0, 1200, side="right") == 701
+
+    data = ring.decimate(1, 1000, 50)
+    assert data.shape[1] <= 60
+    assert np.all(np.diff(data[0]) > 0)
+    assert data[0, 0] == 500 and data[0, -1] == 1499
+    assert 1200 in data[0]
+
+    # The pyramid follows the values written after it was built
+    ring.append(1500, -100)
+    data = ring.decimate(1, 1000, 50, start=900)
+    assert data[0, 0] == 1401 and data[0, -1] == 1500
+    assert -100 in data[1]
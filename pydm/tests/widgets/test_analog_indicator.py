@@ -37,3 +37,65 @@ def test_construct(qtbot, init_channel):
     # ("Internal C++ object (PyDMDateTimeLabel) already deleted")
     parent.deleteLater()
     pydm_analog_indicator.deleteLater()
+
+
+def test_static_layer_cache(qtbot):
+    """
+    Test that the static layer of the indicator is reused while only the value
+    moves, and redrawn when the value enters an alarm region or the size changes.
+
+    Parameters
+    ----------
+     qtbot : fixture
+        Window for widget testing
+    """
+    pydm_analog_indicator = PyDMAnalogIndicator()
+    qtbot.addWidget(pydm_analog_indicator)
+    pydm_analog_indicator.majorAlarmFromChannel = False
+    pydm_analog_indicator.userUpperMajorAlarm = 4
+    pydm_analog_indicator.userLowerMajorAlarm = -4
+    with qtbot.waitExposed(pydm_analog_indicator):
+        pydm_analog_indicator.show()
+    scale = pydm_analog_indicator.scale_indicator
+
+    scale.set_value(0)
+    scale.repaint()
+    static_layer = scale._static_layer
+    assert static_layer is not None
+
+    scale.set_value(1)
+    scale.repaint()
+    assert scale._static_layer is static_layer
+
+    scale.set_value(4.5)
+    scale.repaint()
+    assert scale._static_layer is not static_layer
+    static_layer = scale._static_layer
+
+    pydm_analog_indicator.resize(pydm_analog_indicator.width() + 50, pydm_analog_indicator.height())
+    scale.repaint()
+    assert scale._static_layer is not static_layer
+
+
+def test_max_frame_rate(qtbot):
+    """
+    Test that values received faster than the maximum frame rate are painted together.
+
+    Parameters
+    ----------
+     qtbot : fixture
+        Window for widget testing
+    """
+    pydm_analog_indicator = PyDMAnalogIndicator()
+    qtbot.addWidget(pydm_analog_indicator)
+    pydm_analog_indicator.maxFrameRate = 10
+    assert pydm_analog_indicator.maxFrameRate == 10
+    with qtbot.waitExposed(pydm_analog_indicator):
+        pydm_analog_indicator.show()
+    scale = pydm_analog_indicator.scale_indicator
+    scale.repaint()
+
+    for value in range(5):
+        scale.set_value(value)
+    assert scale._update_timer.isActive()
+    qtbot.waitUntil(lambda: not scale._update_timer.isActive(), timeout=1000)
@@ -2,6 +2,7 @@ import numpy as np
 import pytest
 from qtpy.QtCore import Slot
 
+from pydm.data_plugins.archiver_plugin import archive_data
 from pydm.tests.conftest import ConnectionSignals
 from pydm.widgets.archiver_time_plot import ArchivePlotCurveItem, PyDMArchiverTimePlot, FormulaCurveItem
 
@@ -255,3 +256,85 @@ def test_disconnected_formula_curve_item():
     # Both curves should have no data
     assert np.array_equal(formula_curve_1.archive_data_buffer, np.zeros((2, 0), dtype=float))
     assert np.array_equal(formula_curve_2.archive_data_buffer, np.zeros((2, 0), dtype=float))
+
+
+def test_request_archive_gaps():
+    """Only the parts of the requested range that are not loaded yet are requested from the archiver"""
+    plot = PyDMArchiverTimePlot(optimized_data_bins=10)
+    curve_item = ArchivePlotCurveItem()
+    requests = []
+    curve_item.archive_data_request_signal.connect(lambda *args: requests.append(args))
+    plot._curves.append(curve_item)
+
+    plot.requestDataFromArchiver(100, 201)
+    assert requests == [(100, 200, "")]
+    curve_item.receiveArchiveData(archive_data(np.array([[100, 150, 200], [1, 2, 3]], dtype=float), (100, 200)))
+
+    # Scrolling to the left only requests the older data, which is merged with what was loaded
+    plot.requestDataFromArchiver(50, 201)
+    assert requests[-1] == (50, 100, "")
+    assert curve_item.archive_seconds_saved == 100
+    curve_item.receiveArchiveData(archive_data(np.array([[50, 75], [4, 5]], dtype=float), (50, 100)))
+    assert curve_item.archive_points_accumulated == 5
+    assert curve_item.archive_data_buffer[:, -5:].tolist() == [[50, 75, 100, 150, 200], [4, 5, 1, 2, 3]]
+
+    # Everything is loaded, so there is nothing left to request
+    plot.requestDataFromArchiver(60, 201)
+    assert len(requests) == 2
+
+    # A failed request has to be made again
+    plot.requestDataFromArchiver(0, 201)
+    assert requests[-1] == (0, 50, "")
+    curve_item.archiveConnectionStateChanged(False)
+    plot.requestDataFromArchiver(0, 201)
+    assert requests[-1] == (0, 50, "")
+    assert len(requests) == 4
+
+    # Optimized data replaces the raw data, so everything is requested again afterwards
+    plot.requestDataFromArchiver(0, 100000)
+    assert requests[-1] == (0, 99999, "optimized_10")
+    plot.requestDataFromArchiver(0, 201)
+    assert requests[-1] == (0, 200, "")
+
+
+def test_settle_archive_requests():
+    """Each reply settles the request it answers, whatever the order it arrives in"""
+    curve_item = ArchivePlotCurveItem()
+    curve_item.request_archive_data(0, 50)
+    curve_item.request_archive_data(100, 200)
+    curve_item.request_archive_data(300, 400)
+
+    # A reply requested by another plot showing the same PV is ignored, and leaves the requests of this curve pending
+    curve_item.receiveArchiveData(archive_data(np.array([[10, 20], [1, 2]], dtype=float), (0, 30)))
+    assert curve_item.archive_points_accumulated == 0
+    assert curve_item._pending_ranges == [(0, 50), (100, 200), (300, 400)]
+
+    # An empty reply settles its request, as does a reply arriving before those of older requests
+    curve_item.receiveArchiveData(archive_data(np.zeros((2, 0)), (100, 200)))
+    curve_item.receiveArchiveData(archive_data(np.array([[300, 350], [1, 2]], dtype=float), (300, 400)))
+    assert curve_item._pending_ranges == [(0, 50)]
+
+    # So a failure only has the range still waiting for its reply requested again
+    curve_item.archiveConnectionStateChanged(False)
+    assert curve_item.archive_ranges.gaps(0, 50) == [(0, 50)]
+    assert curve_item.archive_ranges.gaps(100, 200) == []
+    assert curve_item.archive_ranges.gaps(300, 400) == []
+
+
+def test_archive_lod_mode():
+    """Archive data is reduced along with live data when level of detail rendering is enabled"""
+    curve_item = ArchivePlotCurveItem(lodMode=True)
+    curve_item.setArchiveBufferSize(50000)
+    values = np.sin(np.arange(50000))
+    values[12345] = 10
+    curve_item.receiveArchiveData(np.array([np.arange(50000, dtype=float), values]))
+
+    curve_item.redrawCurve()
+    assert len(curve_item.xData) <= curve_item.lod_max_points() + 10
+    assert 12345 in curve_item.xData
+
+    # Data written into the existing buffer is picked up
+    values[20000] = -10
+    curve_item.receiveArchiveData(np.array([np.arange(50000, dtype=float), values]))
+    curve_item.redrawCurve()
+    assert 20000 in curve_item.xData
@@ -8,7 +8,8 @@ from qtpy.QtWidgets import QMenu
 from qtpy.QtGui import QClipboard, QColor, QMouseEvent
 from pydm.tests.conftest import ConnectionSignals
 from pydm.utilities import is_pydm_app
-from pydm import data_plugins
+from pydm import config, data_plugins
+from pydm.widgets import base
 from pydm.widgets.base import AlarmLimit, is_channel_valid, PyDMWidget
 from pydm.widgets import (
     PyDMChannel,
@@ -323,6 +324,41 @@ def test_pydmwidget_alarm_severity_changed(qtbot):
     assert pydm_label.alarmSeverity == PyDMWidget.ALARM_MAJOR
 
 
+@pytest.mark.parametrize("recursive", [False, True])
+def test_pydmwidget_refresh_alarm_style(qtbot, monkeypatch, recursive):
+    """
+    Test that an alarm severity change only restyles the widget itself, unless
+    the recursive alarm styling is enabled.
+
+    Parameters
+    ----------
+    qtbot : fixture
+        Window for widget testing
+    monkeypatch : fixture
+        To enable the recursive alarm styling and record the restyled widgets
+    recursive : bool
+        Whether the recursive alarm styling is enabled
+    """
+    frame = PyDMFrame(init_channel="CA://MA_TEST")
+    qtbot.addWidget(frame)
+    child = PyDMLabel(parent=frame)
+
+    monkeypatch.setattr(config, "ALARM_STYLE_RECURSIVE", recursive)
+    refreshed = []
+    original_refresh_style = base.refresh_style
+
+    def refresh_style(widget, recursive=True):
+        refreshed.append((widget, recursive))
+        original_refresh_style(widget, recursive)
+
+    monkeypatch.setattr(base, "refresh_style", refresh_style)
+
+    frame.alarm_severity_changed(PyDMWidget.ALARM_MINOR)
+    assert frame.alarmSeverity == PyDMWidget.ALARM_MINOR
+    assert refreshed == [(frame, recursive)]
+    assert child.alarmSeverity != PyDMWidget.ALARM_MINOR
+
+
 @pytest.mark.parametrize(
     "init_channel",
     [
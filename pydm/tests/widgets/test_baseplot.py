@@ -74,6 +74,8 @@ def test_baseplotcurveitem_to_dict(qtbot):
     assert dictionary["lineWidth"] == base_plotcurve_item.lineWidth
     assert dictionary["symbol"] == base_plotcurve_item.symbol
     assert dictionary["symbolSize"] == base_plotcurve_item.symbolSize
+    # Level of detail rendering is only saved by the curves which support it
+    assert "lodMode" not in dictionary
 
 
 def test_baseplot_construct(qtbot):
@@ -1,5 +1,8 @@
 import pytest
 
+from qtpy.QtGui import QColor
+from qtpy.QtWidgets import QLabel
+
 from pydm.widgets.byte import PyDMByteIndicator
 
 
@@ -58,3 +61,67 @@ def test_value_shift(qtbot, signals, shift, value, expected):
     for i, bit, indicator in zip(range(num_bits), expected, pydm_byte._indicators):
         expected_color = pydm_byte.onColor if bit else pydm_byte.offColor
         assert indicator._brush.color().name() == expected_color.name(), "Failed to match bit#{}".format(i)
+
+
+@pytest.mark.parametrize("circles", [False, True])
+def test_flat_painting(qtbot, circles):
+    """
+    Test that in flat painting mode the bits are painted by the widget itself, with the right colors.
+    """
+    pydm_byte = PyDMByteIndicator()
+    qtbot.addWidget(pydm_byte)
+    pydm_byte.numBits = 4
+    pydm_byte.labels = ["A", "B", "C", "D"]
+    pydm_byte.circles = circles
+    pydm_byte.flatPainting = True
+    pydm_byte._connected = True
+    pydm_byte.value = 0b0101
+    pydm_byte.update_indicators()
+
+    assert pydm_byte._indicators == []
+    assert pydm_byte.findChildren(QLabel) == []
+    assert pydm_byte.labels == ["A", "B", "C", "D"]
+
+    pydm_byte.resize(100, 200)
+    with qtbot.waitExposed(pydm_byte):
+        pydm_byte.show()
+    image = pydm_byte.grab().toImage()
+    bit_rects, label_rects = pydm_byte.flat_layout()
+    assert len(bit_rects) == 4
+    assert len(label_rects) == 4
+    for i, bit_rect in enumerate(bit_rects):
+        expected_color = pydm_byte.onColor if (0b0101 >> i) & 1 else pydm_byte.offColor
+        center = bit_rect.center().toPoint()
+        assert image.pixelColor(center).name() == expected_color.name(), "Failed to match bit#{}".format(i)
+
+    # Switching back recreates the inner widgets, keeping the labels
+    pydm_byte.flatPainting = False
+    assert len(pydm_byte._indicators) == 4
+    assert [label.text() for label in pydm_byte.findChildren(QLabel)] == ["A", "B", "C", "D"]
+
+
+def test_flat_painting_updates_changed_bits(qtbot, monkeypatch):
+    """
+    Test that only the bits which changed are repainted, and that nothing is done for an unchanged value.
+    """
+    pydm_byte = PyDMByteIndicator()
+    qtbot.addWidget(pydm_byte)
+    pydm_byte.numBits = 8
+    pydm_byte.flatPainting = True
+    pydm_byte._connected = True
+    pydm_byte.value = 0b0011
+    pydm_byte.update_indicators()
+
+    updated = []
+    monkeypatch.setattr(pydm_byte, "update", lambda *args: updated.append(args))
+    pydm_byte.update_indicators()
+    assert updated == []
+
+    pydm_byte.value = 0b0110
+    pydm_byte.update_indicators()
+    assert len(updated) == 2
+
+    # A change of color repaints every bit
+    updated.clear()
+    pydm_byte.onColor = QColor(0, 0, 255)
+    assert len(updated) == 8
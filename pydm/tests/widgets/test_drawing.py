@@ -4,7 +4,7 @@ import os
 from logging import ERROR
 import pytest
 
-from qtpy.QtGui import QColor, QBrush, QPixmap
+from qtpy.QtGui import QColor, QBrush, QLinearGradient, QPixmap
 from qtpy.QtWidgets import QApplication
 from qtpy.QtCore import Qt, QSize
 from qtpy.QtDesigner import QDesignerFormWindowInterface
@@ -28,6 +28,7 @@ from pydm.widgets.drawing import (
     PyDMDrawingIrregularPolygon,
 )
 from pydm.utilities import checkObjectProperties
+from pydm.utilities.image_cache import ImageCache
 
 
 # --------------------
@@ -182,6 +183,45 @@ def test_pydmdrawing_paintEvent(qtbot, signals, alarm_sensitive_content):
         assert brush_before == brush_after
 
 
+def test_pydmdrawing_pixmap_cache(qtbot):
+    """
+    Test the caching of the rendered drawings.
+
+    Expectations:
+    Identical drawings share the same rendered pixmap, and changing a property that affects the drawing renders
+    it again. Drawings with gradient brushes are not cached.
+
+    Parameters
+    ----------
+    qtbot : fixture
+        Window for widget testing
+    """
+    drawings = []
+    for _ in range(2):
+        drawing = PyDMDrawingArc()
+        qtbot.addWidget(drawing)
+        drawing.resize(40, 30)
+        drawing.brush = QBrush(QColor(10, 20, 30))
+        drawings.append(drawing)
+
+    pixmap = drawings[0].drawing_pixmap()
+    assert pixmap is not None
+    assert pixmap.width() >= 40
+    assert drawings[1].drawing_pixmap().cacheKey() == pixmap.cacheKey()
+    assert drawings[0].drawing_pixmap() is pixmap
+
+    drawings[1].spanAngle = 180
+    assert drawings[1].drawing_pixmap().cacheKey() != pixmap.cacheKey()
+
+    drawings[0].resize(50, 30)
+    assert drawings[0].drawing_pixmap().cacheKey() != pixmap.cacheKey()
+
+    gradient = QLinearGradient(0, 0, 1, 1)
+    drawings[0].brush = QBrush(gradient)
+    assert drawings[0].drawing_cache_key() is None
+    assert drawings[0].drawing_pixmap() is None
+
+
 @pytest.mark.parametrize(
     "widget_width, widget_height, expected_results", [(4.0, 4.0, (2.0, 2.0)), (1.0, 1.0, (0.5, 0.5)), (0, 0, (0, 0))]
 )
@@ -633,6 +673,20 @@ def test_pydmdrawingimage_size_hint(qtbot, monkeypatch, is_pixmap_empty):
     assert size_hint == QSize(100, 100) if is_pixmap_empty else size_hint == pydm_drawingimage._pixmap.size()
 
 
+def test_pydmdrawingimage_svg_size_hint(qtbot, tmp_path):
+    """
+    Test that the size hint of an SVG image is its own size, not that of its rasterization, which is rounded up.
+    """
+    svg_path = tmp_path / "image.svg"
+    svg_path.write_text(
+        '<svg xmlns="http://www.w3.org/2000/svg" width="37" height="23"><rect width="37" height="23"/></svg>'
+    )
+    pydm_drawingimage = PyDMDrawingImage(filename=str(svg_path))
+    qtbot.addWidget(pydm_drawingimage)
+
+    assert pydm_drawingimage.sizeHint() == QSize(37, 23)
+
+
 @pytest.mark.parametrize(
     "width, height, pen_width",
     [
@@ -1397,3 +1451,32 @@ def test_get_inner_max_neg(qtbot, monkeypatch, caplog, width, height, rotation_d
         assert "Invalid width. The value must be greater than 0" in caplog.text
     elif height == 0:
         assert "Invalid height. The value must be greater than 0" in caplog.text
+
+
+def test_pydmdrawingimage_shared_image(qtbot, monkeypatch):
+    """
+    Test that PyDMDrawingImage objects showing the same file share the loaded image and its rasterizations.
+    """
+    base_path = os.path.dirname(__file__)
+    test_file = os.path.join(base_path, "..", "..", "..", "examples", "drawing", "SLAC_logo.jpeg")
+    images = [PyDMDrawingImage(filename=test_file) for _ in range(2)]
+    for image in images:
+        qtbot.addWidget(image)
+        image.resize(100, 50)
+        with qtbot.waitExposed(image):
+            image.show()
+    assert images[0]._pixmap.cacheKey() == images[1]._pixmap.cacheKey()
+
+    painted = []
+    rendered = ImageCache.rendered
+
+    def record_rendered(*args, **kwargs):
+        pixmap = rendered(*args, **kwargs)
+        painted.append(pixmap.cacheKey())
+        return pixmap
+
+    monkeypatch.setattr(ImageCache, "rendered", record_rendered)
+    for image in images:
+        image.repaint()
+    assert len(painted) == 2
+    assert painted[0] == painted[1]
@@ -0,0 +1,119 @@
+import numpy as np
+import pytest
+
+from pydm.widgets.image import (
+    ImageFrame,
+    ImageUpdateThread,
+    ReadingOrder,
+    DimensionOrder,
+    apply_lut,
+    sampled_levels,
+)
+
+
+class ImageProcessor:
+    """Stands in for the image view the thread prepares images for."""
+
+    def process_image(self, image):
+        return image
+
+
+def make_frame(image, width=0, normalize_data=False, lut=None, level_percentile=0.0):
+    return ImageFrame(
+        image, width, ReadingOrder.Clike, DimensionOrder.HeightFirst, normalize_data, 0.0, 255.0, lut, level_percentile
+    )
+
+
+# Gray ramp of 256 opaque colors
+LUT = np.column_stack([np.arange(256)] * 3 + [np.full(256, 255)]).astype(np.uint8)
+
+
+def test_image_thread_keeps_latest_frame(qtbot):
+    """
+    Test that frames posted while the thread is busy replace each other, and that only the latest one is prepared.
+    """
+    thread = ImageUpdateThread(ImageProcessor())
+    for i in range(3):
+        thread.post(make_frame(np.full((2, 3), i)))
+    assert thread.frames_dropped == 2
+
+    with qtbot.waitSignal(thread.updateSignal) as blocker:
+        thread.start()
+    thread.stop()
+    assert blocker.args[0][2].tolist() == [[2, 2, 2], [2, 2, 2]]
+    assert thread.frames_processed == 1
+    assert not thread.isRunning()
+
+
+def test_image_thread_prepare():
+    """
+    Test the reshape and level computation of a flat image.
+    """
+    thread = ImageUpdateThread(ImageProcessor())
+    assert thread.prepare(make_frame(np.arange(6))) is None
+
+    mini, maxi, img, prerendered = thread.prepare(make_frame(np.arange(6), width=3, normalize_data=True))
+    assert img.shape == (2, 3)
+    assert not prerendered
+    assert (mini, maxi) == (0, 5)
+    assert thread.frames_processed == 1
+
+    # Color images are only displayed as they are when they were colored with a lookup table
+    _, _, img, prerendered = thread.prepare(make_frame(np.zeros((4, 5, 3)), normalize_data=True))
+    assert img.shape == (4, 5, 3)
+    assert not prerendered
+
+
+def test_apply_lut():
+    """
+    Test the scaling of an image to the lookup table, with clipping out of the levels and NaN made transparent.
+    """
+    image = np.array([[-10.0, 0.0, 50.0], [100.0, 200.0, np.nan]])
+    colors = apply_lut(image, 0.0, 100.0, LUT)
+    assert colors.shape == (2, 3, 4)
+    assert colors.dtype == np.uint8
+    assert colors[..., 0].tolist() == [[0, 0, 128], [255, 255, 0]]
+    assert colors[..., 3].tolist() == [[255, 255, 255], [255, 255, 0]]
+    # Flat levels map everything to the first color
+    assert apply_lut(image[:, :2], 5.0, 5.0, LUT)[..., 0].max() == 0
+
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.int16, np.uint16, np.int32, np.float32])
+def test_image_thread_colorize(dtype):
+    """
+    Test that images are colored the same whether or not a table of the colors of every value is used.
+    """
+    thread = ImageUpdateThread(ImageProcessor())
+    start = 0 if np.dtype(dtype).kind == "u" else -20
+    image = np.arange(start, start + 120).astype(dtype).reshape(4, 30)
+    colors = thread.colorize(image, 10, 90, LUT)
+    assert np.array_equal(colors, apply_lut(image, 10, 90, LUT))
+    # The table of colors is reused while the levels do not change
+    table = thread._value_colors[1]
+    thread.colorize(image, 10, 90, LUT)
+    assert thread._value_colors[1] is table
+
+
+def test_image_thread_prepare_lut():
+    """
+    Test that frames with a lookup table are colored, with percentile levels when requested.
+    """
+    thread = ImageUpdateThread(ImageProcessor())
+    image = np.arange(10000.0).reshape(100, 100)
+    image[0, 0] = 1e9
+    mini, maxi, img, prerendered = thread.prepare(make_frame(image, normalize_data=True, lut=LUT, level_percentile=1.0))
+    assert img.shape == (100, 100, 4)
+    assert prerendered
+    assert 50 < mini < 150 and 9850 < maxi < 9950
+    assert thread.stage_times["color"] > 0.0
+
+    # Color images are not colored again, they keep their own colors and levels
+    mini, maxi, img, prerendered = thread.prepare(
+        make_frame(np.arange(9000, dtype=np.uint8).reshape(50, 60, 3), normalize_data=True, lut=LUT)
+    )
+    assert img.shape == (50, 60, 3)
+    assert not prerendered
+    assert (mini, maxi) == (0, 255)
+
+    low, high = sampled_levels(np.arange(1000000.0).reshape(1000, 1000), 10.0)
+    assert abs(low - 100000) < 5000 and abs(high - 900000) < 5000
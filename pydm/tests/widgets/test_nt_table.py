@@ -0,0 +1,83 @@
+import numpy as np
+from qtpy.QtCore import Qt
+
+from pydm.widgets.nt_table import PyDMNTTable
+
+
+def table_data(names, positions):
+    return {"labels": ["name", "position"], "name": list(names), "position": np.array(positions, dtype=float)}
+
+
+def test_value_changed(qtbot):
+    """
+    Test that the columns of the NTTable are displayed, with the labels as headers.
+    """
+    table = PyDMNTTable()
+    qtbot.addWidget(table)
+    table.value_changed(table_data(["a", "b", "c"], [1.0, 2.0, 3.0]))
+
+    model = table._table.model()
+    assert model.rowCount() == 3
+    assert model.columnCount() == 2
+    assert model.headerData(1, Qt.Horizontal) == "position"
+    assert model.data(model.index(1, 0)) == "b"
+    assert model.data(model.index(2, 1)) == "3.0"
+
+
+def test_value_changed_reports_changed_rows(qtbot):
+    """
+    Test that updates only report the rows that changed, and insert or remove the rows at the end.
+    """
+    table = PyDMNTTable()
+    qtbot.addWidget(table)
+    table.value_changed(table_data("abcdef", np.arange(6)))
+    model = table._table.model()
+
+    events = []
+    model.dataChanged.connect(lambda first, last: events.append(("changed", first.row(), last.row())))
+    model.rowsInserted.connect(lambda parent, first, last: events.append(("inserted", first, last)))
+    model.rowsRemoved.connect(lambda parent, first, last: events.append(("removed", first, last)))
+    model.modelReset.connect(lambda: events.append(("reset",)))
+
+    table.value_changed(table_data("abcdef", np.arange(6)))
+    assert events == []
+
+    table.value_changed(table_data("xbcdez", [0, 1, 7, 8, 4, 5]))
+    assert events == [("changed", 0, 0), ("changed", 2, 3), ("changed", 5, 5)]
+
+    events.clear()
+    table.value_changed(table_data("xbcdezgh", [0, 1, 7, 8, 4, 5, 6, 7]))
+    assert events == [("inserted", 6, 7)]
+    assert model.data(model.index(7, 0)) == "h"
+
+    events.clear()
+    table.value_changed(table_data("xbc", [0, 9, 7]))
+    assert events == [("removed", 3, 7), ("changed", 1, 1)]
+    assert model.rowCount() == 3
+
+
+def test_sort(qtbot, signals):
+    """
+    Test that sorting reorders the rows of the view, and that edits are applied to the row displayed.
+    """
+    table = PyDMNTTable()
+    qtbot.addWidget(table)
+    table.readOnly = False
+    table.value_changed(table_data("abc", [3.0, 1.0, 2.0]))
+    model = table._table.model()
+
+    model.sort(1, Qt.AscendingOrder)
+    assert [model.data(model.index(row, 0)) for row in range(3)] == ["b", "c", "a"]
+    model.sort(1, Qt.DescendingOrder)
+    assert [model.data(model.index(row, 0)) for row in range(3)] == ["a", "c", "b"]
+
+    # Updates keep the table sorted
+    table.value_changed(table_data("abc", [3.0, 1.0, 4.0]))
+    assert [model.data(model.index(row, 0)) for row in range(3)] == ["c", "a", "b"]
+
+    table.send_value_signal[dict].connect(signals.receiveValue)
+    assert model.setData(model.index(2, 1), 5.0)
+    assert list(signals.value["value"]["position"]) == [3.0, 5.0, 4.0]
+
+    model.sort(-1)
+    assert [model.data(model.index(row, 0)) for row in range(3)] == ["a", "b", "c"]
@@ -1,4 +1,5 @@
 import logging
+import time
 import pytest
 import weakref
 
@@ -300,3 +301,273 @@ def test_rules_initial_value(qtbot, caplog):
     blocker.wait()
     assert re.widget_map[weakref.ref(widget)][0]["calculate"] is False
     assert widget.text() == str(5)
+
+
+def test_rules_syntax_error(qtbot, caplog):
+    """
+    Test that invalid expressions are reported when the rules are registered.
+
+    Parameters
+    ----------
+    qtbot : fixture
+        Parent of all the widgets
+    caplog : fixture
+        To capture the log messages
+    """
+    widget = PyDMLabel()
+    qtbot.addWidget(widget)
+
+    rules = [
+        {
+            "name": "Rule #1",
+            "property": "Visible",
+            "expression": "ch[0] <",
+            "channels": [{"channel": "ca://TESTRULES:Float", "trigger": True}],
+        }
+    ]
+
+    dispatcher = RulesDispatcher()
+    with caplog.at_level(logging.ERROR):
+        dispatcher.register(widget, rules)
+    assert "Error while compiling Rule" in caplog.text
+
+    re = dispatcher.rules_engine
+    rule = re.widget_map[weakref.ref(widget)][0]
+    assert rule["code"] is None
+
+    re.calculate_expression(weakref.ref(widget), 0, rule)
+    assert rule["evaluations"] == 0
+
+    dispatcher.unregister(widget)
+
+
+def test_rules_statistics(qtbot):
+    """
+    Test the evaluation counts and timings of the rules.
+
+    Parameters
+    ----------
+    qtbot : fixture
+        Parent of all the widgets
+    """
+    widget = PyDMLabel()
+    qtbot.addWidget(widget)
+
+    rules = [
+        {
+            "name": "Rule #1",
+            "property": "Text",
+            "expression": "str(max(floor(v) for v in ch))",
+            "channels": [{"channel": "ca://TESTRULES:Float", "trigger": True}],
+        }
+    ]
+
+    dispatcher = RulesDispatcher()
+    dispatcher.register(widget, rules)
+
+    re = dispatcher.rules_engine
+    blocker = qtbot.waitSignal(re.rule_signal, timeout=5000)
+    re.callback_conn(weakref.ref(widget), 0, 0, value=True)
+    re.callback_value(weakref.ref(widget), 0, 0, trigger=True, value=5.5)
+    blocker.wait()
+    assert widget.text() == "5"
+
+    statistics = [stat for stat in dispatcher.rule_statistics() if stat["widget"] is widget]
+    assert len(statistics) == 1
+    assert statistics[0]["name"] == "Rule #1"
+    assert statistics[0]["evaluations"] == 1
+    assert statistics[0]["errors"] == 0
+    assert statistics[0]["total_time"] > 0
+    assert statistics[0]["mean_time"] == statistics[0]["total_time"]
+
+    dispatcher.unregister(widget)
+
+
+def test_rules_min_interval(qtbot):
+    """
+    Test that a rule triggered again within its minimum interval is evaluated
+    once, with the latest values, when the interval elapses.
+
+    Parameters
+    ----------
+    qtbot : fixture
+        Parent of all the widgets
+    """
+    widget = PyDMLabel()
+    qtbot.addWidget(widget)
+
+    rules = [
+        {
+            "name": "Rule #1",
+            "property": "Text",
+            "expression": "str(ch[0])",
+            "min_interval": 0.5,
+            "channels": [{"channel": "ca://TESTRULES:Float", "trigger": True}],
+        }
+    ]
+
+    dispatcher = RulesDispatcher()
+    dispatcher.register(widget, rules)
+
+    re = dispatcher.rules_engine
+    rule = re.widget_map[weakref.ref(widget)][0]
+    with qtbot.waitSignal(re.rule_signal, timeout=5000):
+        re.callback_conn(weakref.ref(widget), 0, 0, value=True)
+        re.callback_value(weakref.ref(widget), 0, 0, trigger=True, value=1)
+    assert widget.text() == "1"
+
+    start = time.monotonic()
+    with qtbot.waitSignal(re.rule_signal, timeout=5000):
+        re.callback_conn(weakref.ref(widget), 0, 0, value=True)
+        re.callback_value(weakref.ref(widget), 0, 0, trigger=True, value=2)
+        re.callback_value(weakref.ref(widget), 0, 0, trigger=True, value=3)
+    assert time.monotonic() - start > 0.3
+    assert widget.text() == "3"
+    assert rule["evaluations"] == 2
+
+    dispatcher.unregister(widget)
+
+
+def test_rules_min_interval_busy_engine(qtbot):
+    """
+    Test that a rule held back by its minimum interval is still evaluated
+    while other rules keep the engine busy.
+
+    Parameters
+    ----------
+    qtbot : fixture
+        Parent of all the widgets
+    """
+    busy_widget, throttled_widget = PyDMLabel(), PyDMLabel()
+    qtbot.addWidget(busy_widget)
+    qtbot.addWidget(throttled_widget)
+
+    def make_rules(address, min_interval):
+        return [
+            {
+                "name": "Rule #1",
+                "property": "Text",
+                "expression": "str(ch[0])",
+                "min_interval": min_interval,
+                "channels": [{"channel": address, "trigger": True}],
+            }
+        ]
+
+    dispatcher = RulesDispatcher()
+    dispatcher.register(busy_widget, make_rules("ca://TESTRULES:Busy", 0))
+    dispatcher.register(throttled_widget, make_rules("ca://TESTRULES:Throttled", 0.2))
+
+    re = dispatcher.rules_engine
+    busy_ref, throttled_ref = weakref.ref(busy_widget), weakref.ref(throttled_widget)
+    re.callback_conn(busy_ref, 0, 0, value=True)
+    re.callback_conn(throttled_ref, 0, 0, value=True)
+    with qtbot.waitSignal(re.rule_signal, timeout=5000):
+        re.callback_value(throttled_ref, 0, 0, trigger=True, value=1)
+    # Triggered again within its minimum interval, so it is deferred
+    re.callback_value(throttled_ref, 0, 0, trigger=True, value=2)
+
+    # Each evaluation of the busy rule triggers it again, so the engine always has a rule waiting for evaluation
+    calculate_expression = re.calculate_expression
+
+    def calculate_and_retrigger(widget_ref, idx, rule, results):
+        calculate_expression(widget_ref, idx, rule, results)
+        if widget_ref is busy_ref:
+            re.schedule(busy_ref, 0)
+
+    re.calculate_expression = calculate_and_retrigger
+    re.callback_value(busy_ref, 0, 0, trigger=True, value=1)
+    try:
+        qtbot.waitUntil(lambda: throttled_widget.text() == "2", timeout=3000)
+    finally:
+        del re.calculate_expression
+    assert throttled_widget.text() == "2"
+
+    dispatcher.unregister(busy_widget)
+    dispatcher.unregister(throttled_widget)
+
+
+def test_rules_shared_channels(qtbot):
+    """
+    Test that rules using the same address share a single channel, which
+    forwards its values to every rule.
+
+    Parameters
+    ----------
+    qtbot : fixture
+        Parent of all the widgets
+    """
+    address = "ca://TESTRULES:Shared"
+    widgets = [PyDMLabel() for _ in range(3)]
+    for widget in widgets:
+        qtbot.addWidget(widget)
+
+    dispatcher = RulesDispatcher()
+    re = dispatcher.rules_engine
+    for widget in widgets:
+        rules = [
+            {
+                "name": "Rule #1",
+                "property": "Text",
+                "expression": "str(ch[0])",
+                "channels": [{"channel": address, "trigger": True}],
+            }
+        ]
+        dispatcher.register(widget, rules)
+
+    rule_channel = re.channel_map[address]
+    assert len(rule_channel.listeners) == 3
+
+    rule_channel.connection_changed(True)
+    with qtbot.waitSignal(re.rule_signal, timeout=5000):
+        rule_channel.value_changed(7)
+    qtbot.waitUntil(lambda: all(widget.text() == "7" for widget in widgets), timeout=5000)
+
+    # A rule registered later starts from the values the channel already received
+    late_widget = PyDMLabel()
+    qtbot.addWidget(late_widget)
+    dispatcher.register(late_widget, rules)
+    assert re.widget_map[weakref.ref(late_widget)][0]["values"] == [7]
+    assert re.widget_map[weakref.ref(late_widget)][0]["conn"] == [True]
+
+    for widget in widgets:
+        dispatcher.unregister(widget)
+    assert re.channel_map[address] is rule_channel
+    dispatcher.unregister(late_widget)
+    assert address not in re.channel_map
+
+
+def test_rules_dispatch_batch(qtbot, monkeypatch):
+    """
+    Test that a batch of rule results only applies the last value of each
+    widget property, with the widget updates suppressed meanwhile.
+
+    Parameters
+    ----------
+    qtbot : fixture
+        Parent of all the widgets
+    monkeypatch : fixture
+        To record the rule results applied to the widget
+    """
+    widget = PyDMLabel()
+    qtbot.addWidget(widget)
+    widget.show()
+
+    applied = []
+
+    def rule_evaluated(payload):
+        applied.append((payload["property"], payload["value"], widget.updatesEnabled()))
+
+    monkeypatch.setattr(widget, "rule_evaluated", rule_evaluated)
+
+    widget_ref = weakref.ref(widget)
+    dispatcher = RulesDispatcher()
+    dispatcher.dispatch(
+        [
+            {"widget": widget_ref, "name": "Rule #1", "property": "Text", "value": "first"},
+            {"widget": widget_ref, "name": "Rule #2", "property": "Visible", "value": True},
+            {"widget": widget_ref, "name": "Rule #1", "property": "Text", "value": "last"},
+        ]
+    )
+
+    assert sorted(applied) == [("Text", "last", False), ("Visible", True, False)]
+    assert widget.updatesEnabled()
@@ -3,6 +3,7 @@ import logging
 import numpy as np
 from collections import OrderedDict
 from pydm.widgets.channel import PyDMChannel
+from pydm.widgets.baseplot import NoDataError
 from pydm.widgets.scatterplot import ScatterPlotCurveItem, MINIMUM_BUFFER_SIZE, DEFAULT_BUFFER_SIZE
 from pydm.utilities import remove_protocol
 
@@ -231,3 +232,24 @@ def test_scatterplotcurve_get_set_reset_buffer_size_channel_addr(qtbot, addr, ne
         plot_curve_item.bufferSizeChannelValueReceiver(new_size)
         assert plot_curve_item.getBufferSize() == new_size
         assert plot_curve_item.data_buffer.shape == (2, new_size)
+
+
+def test_scatterplotcurve_limits(qtbot):
+    plot_curve_item = ScatterPlotCurveItem(None, None)
+    plot_curve_item.setBufferSize(3)
+
+    with pytest.raises(NoDataError):
+        plot_curve_item.limits()
+
+    for x, y in [(5, -1), (1, 10), (3, 2), (4, 0)]:
+        plot_curve_item.receiveXValue(x)
+        plot_curve_item.receiveYValue(y)
+
+    # REDRAW_ON_EITHER adds a point on every update, and the buffer only holds the last 3
+    data = plot_curve_item.data_buffer
+    assert plot_curve_item.points_accumulated == 3
+    assert plot_curve_item.limits() == (
+        (float(np.amin(data[0])), float(np.amax(data[0]))),
+        (float(np.amin(data[1])), float(np.amax(data[1]))),
+    )
+    assert plot_curve_item.limits() == ((3.0, 4.0), (0.0, 2.0))
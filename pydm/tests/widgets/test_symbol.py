@@ -0,0 +1,34 @@
+import json
+
+from pydm.widgets.symbol import PyDMSymbol
+
+ANIMATED_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}">'
+    '<rect width="{size}" height="{size}"><animateTransform attributeName="transform" type="rotate"'
+    ' from="0" to="360" dur="1s" repeatCount="indefinite"/></rect></svg>'
+)
+
+
+def test_symbol_animated_images(qtbot, tmp_path):
+    """
+    Test that the widget only repaints on the animated images it currently shows, once per frame.
+    """
+    first_path, second_path = tmp_path / "first.svg", tmp_path / "second.svg"
+    first_path.write_text(ANIMATED_SVG.format(size=20))
+    second_path.write_text(ANIMATED_SVG.format(size=30))
+
+    symbol = PyDMSymbol()
+    qtbot.addWidget(symbol)
+    # Setting the same files again, or using a file for several states, connects its image once
+    symbol.imageFiles = json.dumps({"0": str(first_path), "1": str(first_path)})
+    symbol.imageFiles = json.dumps({"0": str(first_path), "1": str(first_path)})
+    first_image = symbol._state_images[0][1]
+    assert first_image.animated()
+    assert first_image.receivers(first_image.repaintNeeded) == 1
+
+    # Images which are no longer shown do not repaint the widget anymore
+    symbol.imageFiles = json.dumps({"0": str(second_path)})
+    second_image = symbol._state_images[0][1]
+    assert first_image.receivers(first_image.repaintNeeded) == 0
+    assert second_image.receivers(second_image.repaintNeeded) == 1
+    assert list(symbol._state_images) == [0]
@@ -286,6 +286,45 @@ def test_timeplotcurve_max_x(qtbot):
     assert pydm_timeplot_curve_item.data_buffer[1, pydm_timeplot_curve_item._bufferSize - 1] == 100
 
 
+def test_timeplotcurve_ring_buffer_wraparound(qtbot):
+    """Appending past the buffer size keeps the most recent points in chronological order"""
+    pydm_timeplot_curve_item = TimePlotCurveItem()
+    pydm_timeplot_curve_item.setBufferSize(5)
+
+    for value in range(8):
+        pydm_timeplot_curve_item.receiveNewValue(value)
+
+    assert pydm_timeplot_curve_item.points_accumulated == 5
+    assert np.array_equal(pydm_timeplot_curve_item.live_data()[1], [3, 4, 5, 6, 7])
+    assert np.all(np.diff(pydm_timeplot_curve_item.live_data()[0]) >= 0)
+    assert pydm_timeplot_curve_item.min_x() == pydm_timeplot_curve_item.live_data()[0, 0]
+    assert pydm_timeplot_curve_item.max_x() == pydm_timeplot_curve_item.live_data()[0, -1]
+    assert np.array_equal(pydm_timeplot_curve_item.data_buffer[1], [3, 4, 5, 6, 7])
+
+
+def test_timeplotcurve_lod_mode(qtbot):
+    """With level of detail rendering, only a few points per pixel are drawn and spikes are kept"""
+    curve = TimePlotCurveItem(lodMode=True)
+    curve.setBufferSize(100000)
+    values = np.zeros(100000)
+    values[54321] = 5
+    curve.data_buffer = np.array([np.arange(100000, dtype=float), values])
+    curve.points_accumulated = 100000
+    assert curve.to_dict()["lodMode"]
+
+    curve.redrawCurve()
+    assert len(curve.xData) <= 2 * curve.lod_max_points()
+    assert 5 in curve.yData
+    assert curve.xData[0] == 0 and curve.xData[-1] == 99999
+
+    # Only the visible range, and the same width on each side, is drawn
+    curve.redrawCurve(min_x=50000, max_x=51000)
+    assert curve.xData[0] == 48999 and curve.xData[-1] == 52001
+
+    curve.lodMode = False
+    assert len(curve.xData) == 100000
+
+
 def test_timeaxisitem_tickstrings():
     time_axis_item = TimeAxisItem("bottom")
     assert len(time_axis_item.tickStrings((10, 20, 30), 1, 1)) > 0
@@ -0,0 +1,72 @@
+import numpy as np
+from qtpy.QtCore import Qt
+
+from pydm.widgets.waveformtable import PyDMWaveformTable
+
+
+def test_value_changed(qtbot):
+    """
+    Test that the waveform is laid out in the configured number of columns, with the configured labels.
+    """
+    table = PyDMWaveformTable()
+    qtbot.addWidget(table)
+    table.numberOfColumns = 3
+    table.columnHeaderLabels = ["A", "B"]
+    table.value_changed(np.arange(7, dtype=float))
+
+    model = table.model()
+    assert table.rowCount() == 3
+    assert table.columnCount() == 3
+    assert model.data(model.index(1, 2)) == "5.0"
+    assert model.data(model.index(2, 0)) == "6.0"
+    assert model.data(model.index(2, 1)) is None
+    assert model.flags(model.index(2, 1)) == Qt.NoItemFlags
+    assert [model.headerData(i, Qt.Horizontal) for i in range(3)] == ["A", "B", ""]
+    assert model.headerData(0, Qt.Vertical) == "1"
+
+
+def test_value_changed_reports_changed_rows(qtbot):
+    """
+    Test that a new waveform of the same length only reports the runs of rows that changed.
+    """
+    table = PyDMWaveformTable()
+    qtbot.addWidget(table)
+    table.setColumnCount(2)
+    waveform = np.arange(10, dtype=float)
+    waveform[9] = np.nan
+    table.value_changed(waveform)
+
+    changes = []
+    table.model().dataChanged.connect(lambda first, last: changes.append((first.row(), last.row(), last.column())))
+    table.value_changed(waveform.copy())
+    assert changes == []
+
+    new_waveform = waveform.copy()
+    new_waveform[[0, 3, 4, 8]] = -1
+    table.value_changed(new_waveform)
+    assert changes == [(0, 2, 1), (4, 4, 1)]
+
+    # A different length resets the model
+    resets = []
+    table.model().modelReset.connect(lambda: resets.append(True))
+    table.value_changed(np.arange(3))
+    assert resets == [True]
+    assert table.rowCount() == 2
+
+
+def test_send_waveform(qtbot, signals):
+    """
+    Test that editing a cell sends the modified waveform to the channel.
+    """
+    table = PyDMWaveformTable()
+    qtbot.addWidget(table)
+    table.setColumnCount(2)
+    table.value_changed(np.arange(4, dtype=float))
+    table.subtype = float
+    table.send_value_signal[np.ndarray].connect(signals.receiveValue)
+
+    model = table.model()
+    assert model.setData(model.index(1, 0), "7.5")
+    assert np.array_equal(signals.value, [0.0, 1.0, 7.5, 3.0])
+    assert model.data(model.index(1, 0)) == "7.5"
+    assert not model.setData(model.index(1, 1), "not a number")
@@ -21,7 +21,13 @@ from qtpy import QtCore, QtGui, QtWidgets
 from . import colors, macro, shortcuts
 from .connection import close_widget_connections, establish_widget_connections
 from .iconfont import IconFont
-from .remove_protocol import protocol_and_address, remove_protocol, parsed_address
+from .remove_protocol import (
+    protocol_and_address,
+    remove_protocol,
+    parsed_address,
+    address_cache_info,
+    clear_address_cache,
+)
 from .units import convert, find_unit_options, find_unittype
 
 __all__ = [
@@ -35,6 +41,8 @@ __all__ = [
     "remove_protocol",
     "BasicURI",
     "parsed_address",
+    "address_cache_info",
+    "clear_address_cache",
     "convert",
     "find_unit_options",
     "find_unittype",
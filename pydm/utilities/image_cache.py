@@ -0,0 +1,219 @@
+"""
+Process-wide cache of the images displayed by widgets.
+
+Widgets showing the same file, like hundreds of identical valve symbols on a
+synoptic display, share a single loaded copy of it. The rasterizations of an
+image at the sizes it is drawn at are cached as well, so vector images are not
+rendered again on every repaint. Sizes are rounded up to buckets of a few
+pixels so that widgets of nearly the same size also share them. The total size
+of the cached images is bounded, with the least recently used evicted first.
+"""
+
+import math
+import os
+from collections import OrderedDict
+from typing import Optional, Union
+
+from qtpy.QtCore import Qt, QRectF, QSize, qInstallMessageHandler
+from qtpy.QtGui import QPainter, QPixmap
+from qtpy.QtSvg import QSvgRenderer
+
+from pydm import config
+
+# Rasterizations are made at sizes rounded up to a multiple of this many pixels
+SIZE_BUCKET = 8
+
+# Cost, in bytes, given to a loaded SVG document
+SVG_COST = 64 * 1024
+
+
+def _silence_qt_messages(msg_type, *args):
+    # Intentionally suppress all qt messages.  Make sure not to leave this handler installed.
+    pass
+
+
+def bucket_size(size: QSize) -> QSize:
+    """
+    Rounds a size up to the size bucket it belongs to.
+
+    Parameters
+    ----------
+    size : QSize
+
+    Returns
+    -------
+    QSize
+    """
+    return QSize(
+        max(SIZE_BUCKET, int(math.ceil(size.width() / SIZE_BUCKET)) * SIZE_BUCKET),
+        max(SIZE_BUCKET, int(math.ceil(size.height() / SIZE_BUCKET)) * SIZE_BUCKET),
+    )
+
+
+class ImageCache(object):
+    """
+    LRU cache of the images loaded from files, and of their rasterizations.
+
+    Parameters
+    ----------
+    max_bytes : int
+        The maximum total size of the cached images, in bytes.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        # Keyed on ("source", path) or ("render", path, version, width, height), values are (image, cost) tuples
+        self._entries = OrderedDict()
+        self._total_bytes = 0
+        # Loaded files are checked for changes when they are loaded again, and a change invalidates their renders
+        self._versions = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        """The total size of the cached images, in bytes."""
+        return self._total_bytes
+
+    def clear(self) -> None:
+        """Remove every image from the cache."""
+        self._entries.clear()
+        self._versions.clear()
+        self._total_bytes = 0
+
+    def _get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def _put(self, key, image, cost: int) -> None:
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._total_bytes -= old[1]
+        self._entries[key] = (image, cost)
+        self._total_bytes += cost
+        # The newest entry is always kept, even when it alone exceeds the bound
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            _, (_, evicted_cost) = self._entries.popitem(last=False)
+            self._total_bytes -= evicted_cost
+
+    def load(self, path: str) -> Optional[Union[QSvgRenderer, QPixmap]]:
+        """
+        Loads an image file, or returns the copy already loaded.
+
+        SVG files are loaded as a QSvgRenderer, any other image as a QPixmap.
+
+        Parameters
+        ----------
+        path : str
+            The path of the image file.
+
+        Returns
+        -------
+        QSvgRenderer, QPixmap or None
+            The image, or None if the file could not be loaded.
+        """
+        path = os.path.realpath(path)
+        try:
+            version = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        if self._versions.get(path) == version:
+            image = self._get(("source", path))
+            if image is not None:
+                return image
+        else:
+            self.misses += 1
+        self._versions[path] = version
+
+        # First, lets try SVG.  We have to try SVG first, otherwise
+        # QPixmap will happily load the SVG and turn it into a raster image.
+        # Qt prints a warning message any time SVG loading fails,
+        # so we have to temporarily silence Qt warning messages here.
+        qInstallMessageHandler(_silence_qt_messages)
+        try:
+            svg = QSvgRenderer()
+            loaded = svg.load(path)
+        finally:
+            qInstallMessageHandler(None)
+        if loaded:
+            self._put(("source", path), svg, SVG_COST)
+            return svg
+        # SVG didn't work, lets try QPixmap
+        pixmap = QPixmap(path)
+        if pixmap.isNull():
+            return None
+        self._put(("source", path), pixmap, pixmap.width() * pixmap.height() * 4)
+        return pixmap
+
+    def rendered(self, path: str, size: QSize, device_pixel_ratio: float = 1.0) -> Optional[QPixmap]:
+        """
+        Returns the image of a file rasterized to fill the given size.
+
+        The rasterization is made at the bucket of the size, so the pixmap
+        returned may be a few pixels larger and is meant to be drawn into a
+        rectangle of the requested size.
+
+        Parameters
+        ----------
+        path : str
+            The path of the image file.
+        size : QSize
+            The size the image is drawn at, in device independent pixels.
+        device_pixel_ratio : float, optional
+            The device pixel ratio of the widget the image is drawn on.
+
+        Returns
+        -------
+        QPixmap or None
+            The rasterized image, or None if the file could not be loaded.
+        """
+        if size.isEmpty():
+            return None
+        path = os.path.realpath(path)
+        physical = bucket_size(
+            QSize(int(math.ceil(size.width() * device_pixel_ratio)), int(math.ceil(size.height() * device_pixel_ratio)))
+        )
+        key = ("render", path, self._versions.get(path), physical.width(), physical.height())
+        pixmap = self._get(key)
+        if pixmap is not None:
+            return pixmap
+        source = self._get(("source", path)) if path in self._versions else None
+        if source is None:
+            source = self.load(path)
+            if source is None:
+                return None
+            key = ("render", path, self._versions.get(path), physical.width(), physical.height())
+
+        if isinstance(source, QSvgRenderer):
+            pixmap = QPixmap(physical)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            source.render(painter, QRectF(0.0, 0.0, physical.width(), physical.height()))
+            painter.end()
+        else:
+            pixmap = source.scaled(physical, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        self._put(key, pixmap, physical.width() * physical.height() * 4)
+        return pixmap
+
+
+_image_cache = None
+
+
+def image_cache() -> ImageCache:
+    """
+    Returns the image cache shared by all widgets.
+    """
+    global _image_cache
+    if _image_cache is None:
+        _image_cache = ImageCache(int(config.IMAGE_CACHE_SIZE * 1024**2))
+    return _image_cache
@@ -0,0 +1,133 @@
+"""
+Cropping and binning of images by the data plugins, before they reach widgets.
+
+A display often shows a large camera image in a much smaller widget, or only
+cares about part of it. The channel address can ask for a region of interest
+and a binning factor, e.g. ``pva://CAM:IMAGE?roi=512,512,1024,1024&bin=4``,
+so that widgets and their threads only receive the pixels they display.
+"""
+
+import collections
+from typing import Optional
+from urllib.parse import parse_qs
+
+import numpy as np
+
+# roi: (x, y, width, height) of the region of interest, or None for the whole image
+# binning: (horizontal, vertical) factors of the binning, (1, 1) for none
+# width: the width of flat images, which are reshaped into rows of this many pixels, or None
+ImageRegion = collections.namedtuple("ImageRegion", ["roi", "binning", "width"])
+
+
+def _parse_ints(text, count, minimum):
+    values = [int(value) for value in text.split(",")]
+    if len(values) != count or any(value < minimum for value in values):
+        raise ValueError(text)
+    return tuple(values)
+
+
+def parse_image_region(query: str) -> Optional[ImageRegion]:
+    """
+    Returns the image region requested by the options of a channel address.
+
+    The options are ``roi=x,y,w,h`` for the region of interest, ``bin=n`` or
+    ``bin=nx,ny`` for the binning factors, and ``width=n`` for the width of
+    images delivered as flat arrays.
+
+    Parameters
+    ----------
+    query : str
+        The query of the channel address, e.g. ``roi=0,0,100,100&bin=2``.
+
+    Returns
+    -------
+    ImageRegion or None
+        The region, or None if the address neither crops nor bins.
+
+    Raises
+    ------
+    ValueError
+        If an option is not valid.
+    """
+    if not query:
+        return None
+    options = parse_qs(query)
+    if "roi" not in options and "bin" not in options:
+        return None
+    roi = None
+    binning = (1, 1)
+    width = None
+    if "roi" in options:
+        roi = _parse_ints(options["roi"][0], 4, 0)
+        if roi[2] == 0 or roi[3] == 0:
+            raise ValueError(options["roi"][0])
+    if "bin" in options:
+        factors = options["bin"][0]
+        binning = _parse_ints(factors, 2, 1) if "," in factors else _parse_ints(factors, 1, 1) * 2
+    if "width" in options:
+        width = _parse_ints(options["width"][0], 1, 1)[0]
+    return ImageRegion(roi, binning, width)
+
+
+def bin_image(image: np.ndarray, horizontal: int, vertical: int) -> np.ndarray:
+    """
+    Averages blocks of pixels of an image.
+
+    Rows and columns left over past the last whole block are dropped.
+
+    Parameters
+    ----------
+    image : np.ndarray
+        The image, with rows along the first axis and columns along the second.
+        Any further axis, like color channels, is kept.
+    horizontal : int
+        The number of columns of each block.
+    vertical : int
+        The number of rows of each block.
+
+    Returns
+    -------
+    np.ndarray
+        The binned image. Integer images are averaged into float32.
+    """
+    if horizontal == 1 and vertical == 1:
+        return image
+    rows = image.shape[0] // vertical
+    columns = image.shape[1] // horizontal
+    blocks = image[: rows * vertical, : columns * horizontal].reshape(
+        (rows, vertical, columns, horizontal) + image.shape[2:]
+    )
+    dtype = image.dtype if image.dtype.kind == "f" else np.float32
+    return blocks.mean(axis=(1, 3), dtype=dtype)
+
+
+def apply_image_region(image: np.ndarray, region: Optional[ImageRegion]) -> np.ndarray:
+    """
+    Crops and bins an image as requested by a channel address.
+
+    The region of interest is clipped to the image. Arrays which are not
+    images, such as flat arrays when the address gives no width, are
+    returned unchanged.
+
+    Parameters
+    ----------
+    image : np.ndarray
+    region : ImageRegion or None
+
+    Returns
+    -------
+    np.ndarray
+        A view of the region of interest when not binned, and a new array otherwise.
+    """
+    if region is None or not isinstance(image, np.ndarray):
+        return image
+    if image.ndim == 1 and region.width:
+        if image.size % region.width:
+            return image
+        image = image.reshape(-1, region.width)
+    if image.ndim < 2:
+        return image
+    if region.roi is not None:
+        x, y, width, height = region.roi
+        image = image[y : y + height, x : x + width]
+    return bin_image(image, *region.binning)
@@ -0,0 +1,110 @@
+import bisect
+
+
+class IntervalSet(object):
+    """
+    Set of disjoint closed intervals on the real line, kept sorted.
+
+    Overlapping or touching intervals are merged as they are added, so the
+    set always holds the smallest number of intervals that cover the same
+    values.
+    """
+
+    def __init__(self):
+        self._starts = []
+        self._ends = []
+
+    def __iter__(self):
+        return iter(zip(self._starts, self._ends))
+
+    def __len__(self):
+        return len(self._starts)
+
+    def __repr__(self):
+        return f"IntervalSet({list(self)})"
+
+    def clear(self):
+        """Remove every interval from the set."""
+        self._starts = []
+        self._ends = []
+
+    def add(self, start, end):
+        """
+        Add the interval [start, end] to the set.
+
+        Parameters
+        ----------
+        start : float
+            The beginning of the interval.
+        end : float
+            The end of the interval. Intervals with end < start are ignored.
+        """
+        if end < start:
+            return
+        # Intervals ending before start, and starting after end, are left untouched
+        first = bisect.bisect_left(self._ends, start)
+        last = bisect.bisect_right(self._starts, end)
+        if first < last:
+            start = min(start, self._starts[first])
+            end = max(end, self._ends[last - 1])
+        self._starts[first:last] = [start]
+        self._ends[first:last] = [end]
+
+    def remove(self, start, end):
+        """
+        Remove the interval [start, end] from the set, splitting the intervals that extend past it.
+
+        Parameters
+        ----------
+        start : float
+            The beginning of the interval.
+        end : float
+            The end of the interval.
+        """
+        if end < start:
+            return
+        first = bisect.bisect_left(self._ends, start)
+        last = bisect.bisect_right(self._starts, end)
+        starts = []
+        ends = []
+        if first < last:
+            if self._starts[first] < start:
+                starts.append(self._starts[first])
+                ends.append(start)
+            if self._ends[last - 1] > end:
+                starts.append(end)
+                ends.append(self._ends[last - 1])
+        self._starts[first:last] = starts
+        self._ends[first:last] = ends
+
+    def gaps(self, start, end):
+        """
+        Return the parts of [start, end] that are not covered by the set.
+
+        Parameters
+        ----------
+        start : float
+            The beginning of the range to check.
+        end : float
+            The end of the range to check.
+
+        Returns
+        -------
+        list
+            The (start, end) tuples of the uncovered parts, in increasing order.
+        """
+        gaps = []
+        position = start
+        index = bisect.bisect_left(self._ends, start)
+        while index < len(self._starts) and self._starts[index] <= end:
+            if self._starts[index] > position:
+                gaps.append((position, self._starts[index]))
+            position = max(position, self._ends[index])
+            index += 1
+        if position < end:
+            gaps.append((position, end))
+        return gaps
+
+    def covered(self, start, end):
+        """Return the total length of [start, end] covered by the set."""
+        return (end - start) - sum(gap_end - gap_start for gap_start, gap_end in self.gaps(start, end))
@@ -0,0 +1,121 @@
+import numpy as np
+
+
+class MinMaxPyramid(object):
+    """
+    Pyramid of the positions of the minimums and maximums of an array.
+
+    Level ``l`` of the pyramid splits the array into blocks of ``2 ** l``
+    entries and holds the index of the smallest and largest value of each
+    block. This allows :meth:`decimate` to pick the extremes of a range at
+    any resolution without scanning it, which is what is needed to draw a
+    large curve with a couple of points per pixel while keeping its spikes.
+
+    The pyramid does not hold the values themselves. Writes to the array are
+    reported with :meth:`invalidate`, and only the affected blocks are
+    recomputed the next time the pyramid is used.
+
+    Parameters
+    ----------
+    capacity : int
+        The length of the array the pyramid is built over.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = int(capacity)
+        indices = np.arange(self.capacity)
+        # Level 0 holds every entry, so the minimum and maximum of each block of one entry is itself
+        self._argmins = [indices]
+        self._argmaxs = [indices]
+        length = self.capacity
+        while length > 1:
+            length = (length + 1) // 2
+            self._argmins.append(np.zeros(length, dtype=indices.dtype))
+            self._argmaxs.append(np.zeros(length, dtype=indices.dtype))
+        self._dirty_start = 0
+        self._dirty_stop = self.capacity
+
+    def invalidate(self, start=0, stop=None):
+        """
+        Report that the entries in [start, stop) of the array have changed.
+
+        Parameters
+        ----------
+        start : int, optional
+            The first changed entry. Defaults to the beginning of the array.
+        stop : int, optional
+            One past the last changed entry. Defaults to the end of the array.
+        """
+        if stop is None:
+            stop = self.capacity
+        if self._dirty_start < self._dirty_stop:
+            start = min(start, self._dirty_start)
+            stop = max(stop, self._dirty_stop)
+        self._dirty_start = start
+        self._dirty_stop = stop
+
+    def _update(self, values):
+        """Recompute the blocks covering the entries changed since the last update."""
+        start, stop = self._dirty_start, self._dirty_stop
+        if start >= stop:
+            return
+        for level in range(1, len(self._argmins)):
+            start //= 2
+            stop = (stop + 1) // 2
+            children = len(self._argmins[level - 1])
+            left = np.arange(2 * start, 2 * stop, 2)
+            right = np.minimum(left + 1, children - 1)
+            for argext, compare in ((self._argmins, np.less), (self._argmaxs, np.greater)):
+                left_index = argext[level - 1][left]
+                right_index = argext[level - 1][right]
+                left_value = values[left_index]
+                right_value = values[right_index]
+                # NaN entries only win when there is nothing else in the block
+                use_right = compare(right_value, left_value) | np.isnan(left_value)
+                argext[level][start:stop] = np.where(use_right, right_index, left_index)
+        self._dirty_start = self._dirty_stop = 0
+
+    def decimate(self, values, start, stop, max_points):
+        """
+        Pick at most about ``max_points`` entries of values[start:stop] that keep its overall shape.
+
+        The range is split into blocks, and the minimum and maximum of each
+        block is kept. The first and last entries of the range are always kept.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The array the pyramid is built over.
+        start : int
+            The first entry of the range.
+        stop : int
+            One past the last entry of the range.
+        max_points : int
+            The number of entries to aim for.
+
+        Returns
+        -------
+        np.ndarray
+            The sorted indices of the entries kept.
+        """
+        length = stop - start
+        if length <= max(max_points, 2):
+            return np.arange(start, stop)
+        self._update(values)
+        # Use the finest level with at most max_points / 2 blocks, each giving a minimum and a maximum
+        level = min(int(np.ceil(np.log2(length / max(max_points // 2, 1)))), len(self._argmins) - 1)
+        size = 1 << level
+        first_block = -(-start // size)
+        last_block = stop // size
+        picks = [
+            [start, stop - 1],
+            self._argmins[level][first_block:last_block],
+            self._argmaxs[level][first_block:last_block],
+        ]
+        # The partial blocks at the ends of the range are scanned directly
+        for edge_start, edge_stop in ((start, min(first_block * size, stop)), (max(last_block * size, start), stop)):
+            if edge_start < edge_stop:
+                edge = values[edge_start:edge_stop]
+                if not np.isnan(edge).all():
+                    picks.append([edge_start + np.nanargmin(edge), edge_start + np.nanargmax(edge)])
+        return np.unique(np.concatenate(picks))
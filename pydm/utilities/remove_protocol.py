@@ -1,8 +1,18 @@
 import collections
+import functools
 import re
+import sys
 import urllib
 from pydm import config
 
+# Maximum number of distinct addresses whose parse results are kept in memory
+ADDRESS_CACHE_SIZE = 8192
+
+_PROTOCOL_RE = re.compile(".*?://")
+# scheme://netloc/path?query will decompose into "scheme", "netloc", "/path", "query"
+# scheme is required. netloc, path, and query are each optional but have to appear in this order
+_COMPONENTS_RE = re.compile(r"(.*?)://([^/?]*)(?:(/[^?]*)?(?:\?(.*))?)?")
+
 
 def remove_protocol(addr):
     """
@@ -21,10 +31,14 @@ def remove_protocol(addr):
     return addr
 
 
+@functools.lru_cache(maxsize=ADDRESS_CACHE_SIZE)
 def protocol_and_address(address):
     """
     Returns the Protocol and Address pieces of a Channel Address
 
+    Results are cached, since the same addresses are parsed over and over
+    as channels connect and disconnect.
+
     Parameters
     ----------
     address : str
@@ -37,11 +51,11 @@ def protocol_and_address(address):
     addr : str
         The piece of the address without the protocol.
     """
-    match = re.match(".*?://", address)
+    match = _PROTOCOL_RE.match(address)
     protocol = None
     addr = address
     if match:
-        protocol = match.group(0)[:-3]
+        protocol = sys.intern(match.group(0)[:-3])
         addr = address.replace(match.group(0), "")
 
     return protocol, addr
@@ -54,6 +68,10 @@ def parsed_address(address):
     """
     Returns the given address parsed into a BasicURI named tuple.
 
+    Results are cached, since the same addresses are parsed over and over
+    as channels connect and disconnect. Use address_cache_info to inspect
+    the cache statistics.
+
     Parameters
     ----------
     address : str
@@ -65,22 +83,49 @@ def parsed_address(address):
     """
     if not isinstance(address, str):
         return None
+    # The default protocol is part of the key, since it changes how addresses without one are parsed
+    return _parsed_address(address, config.DEFAULT_PROTOCOL)
 
-    match = re.match(".*?://", address)
+
+@functools.lru_cache(maxsize=ADDRESS_CACHE_SIZE)
+def _parsed_address(address, default_protocol):
+    match = _PROTOCOL_RE.match(address)
     if not match:
-        if not config.DEFAULT_PROTOCOL:
+        if not default_protocol:
             return None
-        address = config.DEFAULT_PROTOCOL + "://" + address
+        address = default_protocol + "://" + address
 
-    # scheme://netloc/path?query will decompose into "scheme", "netloc", "/path", "query"
-    # scheme is required. netloc, path, and query are each optional but have to appear in this order
-    components = re.match(r"(.*?)://([^/?]*)(?:(/[^?]*)?(?:\?(.*))?)?", address)
+    components = _COMPONENTS_RE.match(address)
     if not components:
         return None
 
+    # Many channels share the same scheme and connection, so intern the pieces
     return BasicURI(
-        scheme=(components.group(1) or ""),
-        netloc=(components.group(2) or ""),
-        path=(components.group(3) or ""),
+        scheme=sys.intern(components.group(1) or ""),
+        netloc=sys.intern(components.group(2) or ""),
+        path=sys.intern(components.group(3) or ""),
         query=(components.group(4) or ""),
     )
+
+
+def address_cache_info():
+    """
+    Returns the hit and miss statistics of the address parsing caches.
+
+    Returns
+    -------
+    dict
+        The functools cache info of protocol_and_address and parsed_address, keyed by function name.
+    """
+    return {
+        "protocol_and_address": protocol_and_address.cache_info(),
+        "parsed_address": _parsed_address.cache_info(),
+    }
+
+
+def clear_address_cache():
+    """
+    Empties the address parsing caches and resets their statistics.
+    """
+    protocol_and_address.cache_clear()
+    _parsed_address.cache_clear()
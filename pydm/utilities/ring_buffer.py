@@ -0,0 +1,315 @@
+from collections import deque
+
+import numpy as np
+
+from pydm.utilities.min_max_pyramid import MinMaxPyramid
+
+
+class RingBuffer(object):
+    """
+    Fixed-capacity circular buffer of ``(rows, capacity)`` samples.
+
+    Samples are written in place at a moving head index, so appending a
+    column is constant-time regardless of the buffer capacity. Readers that
+    need the data in chronological order either ask for the most recent
+    ``n`` columns with :meth:`latest`, which only copies when the requested
+    range wraps around the end of the storage, or use :meth:`linearize` to
+    rotate the storage once so that the oldest sample sits at column 0.
+
+    Optionally, the minimum and maximum of each row over the valid columns are
+    maintained incrementally with monotonic deques, so :meth:`extrema` does
+    not need to rescan the buffer.
+
+    Rows passed to :meth:`decimate` get a :class:`MinMaxPyramid` that is kept
+    up to date as columns are appended, so large buffers can be reduced to a
+    few points per pixel for drawing.
+
+    Parameters
+    ----------
+    capacity : int
+        The number of columns the buffer holds.
+    rows : int, optional
+        The number of rows of each column. Defaults to 2 (x and y).
+    dtype : numpy.dtype, optional
+        The data type of the storage. Defaults to float.
+    track_extrema : bool, optional
+        If True, keep running minimums and maximums of each row up to date on
+        every append. Defaults to False.
+    """
+
+    def __init__(self, capacity, rows=2, dtype=float, track_extrema=False):
+        self._data = np.zeros((rows, int(capacity)), order="f", dtype=dtype)
+        self._head = 0
+        self._count = 0
+        self._track_extrema = track_extrema
+        self._reset_extrema()
+        self._pyramids = {}
+
+    @property
+    def capacity(self):
+        """The number of columns the buffer holds."""
+        return self._data.shape[1]
+
+    @property
+    def rows(self):
+        """The number of rows of each column."""
+        return self._data.shape[0]
+
+    @property
+    def count(self):
+        """The number of columns appended so far, up to the capacity."""
+        return self._count
+
+    def append(self, *column):
+        """
+        Overwrite the oldest column of the buffer with a new one.
+
+        Parameters
+        ----------
+        *column : float
+            One value per row of the buffer.
+        """
+        if self.capacity == 0:
+            return
+        self._data[:, self._head] = column
+        for pyramid in self._pyramids.values():
+            pyramid.invalidate(self._head, self._head + 1)
+        self._head += 1
+        if self._head == self.capacity:
+            self._head = 0
+        if self._count < self.capacity:
+            self._count += 1
+        if self._track_extrema:
+            self._update_extrema(self._data[:, self._head - 1])
+
+    def fill(self, row, value):
+        """Set every entry of the given row to ``value``."""
+        self._data[row].fill(value)
+        if row in self._pyramids:
+            self._pyramids[row].invalidate()
+
+    def item(self, row, index):
+        """
+        Return a single entry, indexed in chronological order.
+
+        Parameters
+        ----------
+        row : int
+            The row to read from.
+        index : int
+            Position in chronological order, where ``-1`` is the most
+            recently appended column and ``0`` is the oldest one.
+
+        Returns
+        -------
+        float
+        """
+        return self._data[row, (self._head + index) % self.capacity]
+
+    def latest(self, n):
+        """
+        Return the ``n`` most recent columns in chronological order.
+
+        The result is a view into the storage when the range is contiguous,
+        and a fresh array when it wraps around the end of the storage.
+
+        Parameters
+        ----------
+        n : int
+            The number of columns to return.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape ``(rows, n)``.
+        """
+        n = min(max(int(n), 0), self.capacity)
+        start = self._head - n
+        if start >= 0:
+            return self._data[:, start : self._head]
+        return np.concatenate((self._data[:, start:], self._data[:, : self._head]), axis=1)
+
+    def linearize(self):
+        """
+        Rotate the storage in place so that the oldest column is at index 0.
+
+        Returns
+        -------
+        np.ndarray
+            The underlying storage of shape ``(rows, capacity)``. Writes to it
+            are reflected in the buffer.
+        """
+        if self._head:
+            self._data = np.roll(self._data, -self._head, axis=1)
+            self._head = 0
+        # The caller may write to the storage, so the pyramids have to be rebuilt
+        for pyramid in self._pyramids.values():
+            pyramid.invalidate()
+        return self._data
+
+    def assign(self, data):
+        """
+        Replace the contents of the buffer with ``data``.
+
+        Parameters
+        ----------
+        data : np.ndarray
+            Array of shape ``(rows, capacity)`` in chronological order. The
+            capacity of the buffer becomes the number of columns of ``data``.
+        """
+        self._data = np.asarray(data)
+        self._head = 0
+        self._count = self.capacity
+        self._pyramids = {}
+        self._reset_extrema()
+        if self._track_extrema:
+            for column in self._data.T:
+                self._update_extrema(column)
+
+    def searchsorted(self, row, value, n=None, side="left"):
+        """
+        Find where ``value`` would be inserted in a row sorted in chronological order.
+
+        Parameters
+        ----------
+        row : int
+            The row to search, e.g. the timestamps of the samples.
+        value : float
+            The value to locate.
+        n : int, optional
+            The number of recent columns to search. Defaults to all of the valid columns.
+        side : str, optional
+            As for numpy.searchsorted, "left" or "right".
+
+        Returns
+        -------
+        int
+            The position among the ``n`` most recent columns, 0 being the oldest one.
+        """
+        if n is None:
+            n = self._count
+        position = 0
+        for start, stop in self._segments(n):
+            index = int(np.searchsorted(self._data[row, start:stop], value, side=side))
+            position += index
+            if index < stop - start:
+                break
+        return position
+
+    def decimate(self, row, n, max_points, start=0, stop=None):
+        """
+        Return columns that keep the shape of ``row`` among the ``n`` most recent ones,
+        using about ``max_points`` columns at most.
+
+        The minimum and maximum of the row are kept for each of a number of
+        equal blocks of columns, using a pyramid of extremes that is
+        maintained as columns are appended, so the buffer is not scanned.
+
+        Parameters
+        ----------
+        row : int
+            The row whose minimums and maximums are kept, e.g. the y-values.
+        n : int
+            The number of recent columns to consider.
+        max_points : int
+            The number of columns to aim for.
+        start : int, optional
+            The first column to consider, as a position among the ``n`` most recent ones.
+        stop : int, optional
+            One past the last column to consider. Defaults to ``n``.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape ``(rows, k)`` in chronological order.
+        """
+        n = min(max(int(n), 0), self.capacity)
+        stop = n if stop is None else min(stop, n)
+        if row not in self._pyramids:
+            self._pyramids[row] = MinMaxPyramid(self.capacity)
+        pyramid = self._pyramids[row]
+        length = max(stop - start, 1)
+        indices = []
+        offset = 0
+        for segment_start, segment_stop in self._segments(n):
+            # The part of the requested range that falls within this contiguous piece of the storage
+            first = segment_start + max(start - offset, 0)
+            last = segment_start + min(stop - offset, segment_stop - segment_start)
+            offset += segment_stop - segment_start
+            if first < last:
+                points = max(int(max_points * (last - first) / length), 2)
+                indices.append(pyramid.decimate(self._data[row], first, last, points))
+        if not indices:
+            return self._data[:, :0]
+        return self._data[:, np.concatenate(indices)]
+
+    def _segments(self, n):
+        """The contiguous (start, stop) ranges of the storage holding the n most recent columns, oldest first."""
+        start = self._head - n
+        if start >= 0:
+            return [(start, self._head)]
+        return [(start + self.capacity, self.capacity), (0, self._head)]
+
+    def extrema(self, row, n=None):
+        """
+        Return the minimum and maximum of the ``n`` most recent entries of a row.
+
+        When extrema are tracked and ``n`` is the number of valid columns,
+        the answer is read from the running summaries in constant time.
+        Otherwise the requested range is scanned.
+
+        Parameters
+        ----------
+        row : int
+            The row to summarize.
+        n : int, optional
+            The number of recent columns to consider. Defaults to all of the
+            valid columns.
+
+        Returns
+        -------
+        tuple
+            (minimum, maximum) as floats. NaN entries propagate to both, as
+            with numpy.amin and numpy.amax.
+        """
+        if n is None:
+            n = self._count
+        n = min(int(n), self.capacity)
+        if self._track_extrema and 0 < n == self._count:
+            last_nan = self._last_nan[row]
+            if last_nan is not None and last_nan >= self._appended - n:
+                return float("nan"), float("nan")
+            return self._mins[row][0][1], self._maxs[row][0][1]
+        data = self.latest(n)[row]
+        return float(np.amin(data)), float(np.amax(data))
+
+    def _reset_extrema(self):
+        rows = self.rows
+        self._appended = 0
+        self._mins = [deque() for _ in range(rows)]
+        self._maxs = [deque() for _ in range(rows)]
+        self._last_nan = [None] * rows
+
+    def _update_extrema(self, column):
+        """Push a freshly appended column into the monotonic deques."""
+        seq = self._appended
+        self._appended += 1
+        # Entries with a sequence number at or below this have been overwritten
+        expired = seq - self.capacity
+        for row, value in enumerate(column):
+            value = float(value)
+            mins = self._mins[row]
+            maxs = self._maxs[row]
+            if value != value:
+                self._last_nan[row] = seq
+            else:
+                while mins and mins[-1][1] >= value:
+                    mins.pop()
+                mins.append((seq, value))
+                while maxs and maxs[-1][1] <= value:
+                    maxs.pop()
+                maxs.append((seq, value))
+            while mins and mins[0][0] <= expired:
+                mins.popleft()
+            while maxs and maxs[0][0] <= expired:
+                maxs.popleft()
@@ -1,5 +1,5 @@
 from .base import PyDMWidget
-from qtpy.QtGui import QColor, QPolygon, QPainter, QFontMetrics
+from qtpy.QtGui import QColor, QPolygon, QFontMetrics
 from qtpy.QtWidgets import QFrame, QSizePolicy
 from qtpy.QtCore import Qt, QPoint, QSize
 from .scale import QScale, PyDMScaleIndicator
@@ -252,28 +252,45 @@ class QScaleAlarmed(QScale):
                 int(major_alarm_height),
             )
 
-    def paintEvent(self, event):
+    def alarm_regions_state(self):
         """
-        Paint events are sent to widgets that need to update themselves,
-        for instance when part of a widget is exposed because a covering
-        widget was moved.
-        Parameters
-        ----------
-        event : QPaintEvent
+        Which of the drawn alarm regions the current value is in, as they are
+        drawn with the alarm colors instead of the region colors.
         """
-        self.adjust_transformation()
-        self._painter.begin(self)
-        self._painter.translate(0, self._painter_translation_y)  # Draw vertically if needed
-        self._painter.rotate(self._painter_rotation)
-        self._painter.translate(self._painter_translation_x, 0)  # Invert appearance if needed
-        self._painter.scale(self._painter_scale_x, 1)
-
-        self._painter.translate(0, self._flip_translation_y)  # Invert scale if needed
-        self._painter.scale(1, self._flip_scale_y)
+        state = ()
+        try:
+            if not self._upper_minor_alarm == self._lower_minor_alarm == 0:
+                state += (
+                    self._lower_major_alarm < self._value <= self._lower_minor_alarm,
+                    self._upper_minor_alarm <= self._value < self._upper_major_alarm,
+                )
+            if not self._upper_major_alarm == self._lower_major_alarm == 0:
+                state += (self._value <= self._lower_major_alarm, self._value >= self._upper_major_alarm)
+        except TypeError:
+            return None
+        return state
 
-        self._painter.setRenderHint(QPainter.Antialiasing)
+    def static_layer_key(self):
+        """
+        Everything the static layer of the scale depends on, including the
+        alarm regions and whether the value is in them.
+        """
+        return super().static_layer_key() + (
+            self._lower_minor_alarm,
+            self._upper_minor_alarm,
+            self._lower_major_alarm,
+            self._upper_major_alarm,
+            QColor(self._minor_alarm_region_color).rgba(),
+            QColor(self._minor_alarm_color).rgba(),
+            QColor(self._major_alarm_region_color).rgba(),
+            QColor(self._major_alarm_color).rgba(),
+            self.alarm_regions_state(),
+        )
 
+    def draw_static_layer(self):
         """
+        Draw the background, the alarm regions and the ticks of the scale.
+
         bad metadata or user input can cause designer or pydm to crash when drawing the widget,
         hence the try except block.
         self._cannot_draw_*_flag variables are so that the errors only print once,
@@ -314,6 +331,11 @@ class QScaleAlarmed(QScale):
                 self._cannot_draw_ticks_flag = True
         else:
             self._cannot_draw_ticks_flag = False
+
+    def draw_value_layer(self):
+        """
+        Draw the indicator for the current value over the static layer.
+        """
         try:
             self.draw_indicator()
         except Exception:
@@ -323,8 +345,6 @@ class QScaleAlarmed(QScale):
         else:
             self._cannot_draw_indicator_flag = False
 
-        self._painter.end()
-
     def set_upper_minor_alarm(self, new_minor_alarm):
         """
         Set the scale upper minor alarm.
@@ -7,6 +7,8 @@ from collections import OrderedDict
 from typing import List, Optional, Union
 from pyqtgraph import DateAxisItem, ErrorBarItem, PlotCurveItem
 from pydm.utilities import remove_protocol, is_qt_designer
+from pydm.utilities.interval_set import IntervalSet
+from pydm.utilities.min_max_pyramid import MinMaxPyramid
 from pydm.widgets.channel import PyDMChannel
 from pydm.widgets.timeplot import TimePlotCurveItem
 from pydm.widgets import PyDMTimePlot
@@ -79,6 +81,18 @@ class ArchivePlotCurveItem(TimePlotCurveItem):
         self.archive_points_accumulated = 0
         self._archiveBufferSize = DEFAULT_ARCHIVE_BUFFER_SIZE
         self.archive_data_buffer = np.zeros((2, self._archiveBufferSize), order="f", dtype=float)
+        # Time ranges for which raw data is in the archive buffer, or has been requested and not yet received
+        self.archive_ranges = IntervalSet()
+        self._pending_ranges = []
+        # Every range requested by this curve and not answered yet, as other curves showing the PV get the replies too
+        self._requested_ranges = set()
+        self.archive_data_request_signal.connect(self._record_request)
+        self._archive_optimized = False
+        # Level of detail pyramid over the archive values, and the buffer it was built for
+        self._archive_lod = None
+        self._archive_lod_buffer = None
+        # Seconds of archive data that did not need to be requested again since they were already loaded
+        self.archive_seconds_saved = 0.0
         self._liveData = liveData
 
         self._show_extension_line = showExtensionLine
@@ -187,7 +201,7 @@ class ArchivePlotCurveItem(TimePlotCurveItem):
             self._liveData = False
             return
 
-        min_x = self.data_buffer[0, self._bufferSize - 1]
+        min_x = self.max_x()
         max_x = time.time()
 
         # Avoids noisy requests when first rendering the plot
@@ -222,7 +236,19 @@ class ArchivePlotCurveItem(TimePlotCurveItem):
             Additional indices may be used as well based on the type of request made to the archiver appliance.
             For example optimized data will include standard deviations, minimums, and maximums
         """
+        requested_range = getattr(data, "requested_range", None)
+        data = np.asarray(data)
+        if requested_range is not None:
+            # Replies are sent to every curve showing the PV, ignore those to requests made by other curves
+            if requested_range not in self._requested_ranges:
+                return
+            self._requested_ranges.discard(requested_range)
         archive_data_length = len(data[0])
+        is_optimized = data.shape[0] == 5  # 5 indicates optimized data was requested from the archiver
+        if not is_optimized and requested_range in self._pending_ranges:
+            self._pending_ranges.remove(requested_range)
+        if archive_data_length == 0:
+            return
         max_x = data[0][archive_data_length - 1]
 
         # Filling live buffer if data is more recent than Archive Data Buffer
@@ -233,18 +259,33 @@ class ArchivePlotCurveItem(TimePlotCurveItem):
             return
 
         if self.points_accumulated != 0:
-            while max_x > self.data_buffer[0][-self.points_accumulated]:
+            while max_x > self.min_x():
                 # Sometimes optimized queries return data past the current timestamp, this will delete those data points
                 data = np.delete(data, len(data[0]) - 1, axis=1)
                 archive_data_length -= 1
+                if archive_data_length == 0:
+                    return
                 max_x = data[0][archive_data_length - 1]
 
+        if not is_optimized and self.archive_points_accumulated and not self._archive_optimized:
+            # Raw data for a gap next to data already loaded, merge the two
+            self.insert_archive_data(data)
+            self.error_bar.hide()
+            self.data_changed.emit()
+            self.archive_data_received_signal.emit()
+            return
+
         self.archive_data_buffer[0, len(self.archive_data_buffer[0]) - archive_data_length :] = data[0]
         self.archive_data_buffer[1, len(self.archive_data_buffer[0]) - archive_data_length :] = data[1]
         self.archive_points_accumulated = archive_data_length
+        if self._archive_lod is not None:
+            self._archive_lod.invalidate()
+        self._archive_optimized = is_optimized
 
         # Error bars
-        if data.shape[0] == 5:  # 5 indicates optimized data was requested from the archiver
+        if is_optimized:
+            # The raw data that was loaded has been replaced
+            self.archive_ranges.clear()
             self.error_bar_data = data
             self.set_error_bar()
             self.error_bar.show()
@@ -288,6 +329,58 @@ class ArchivePlotCurveItem(TimePlotCurveItem):
         self.archive_data_buffer = np.insert(self.archive_data_buffer, [min_insertion_index], data[0:2], axis=1)
 
         self.archive_points_accumulated += archive_data_length - num_points_deleted
+        if self.archive_points_accumulated > self.archive_data_buffer.shape[1]:
+            # Points were dropped to make room, so the loaded ranges are no longer complete
+            self.archive_points_accumulated = self.archive_data_buffer.shape[1]
+            self.archive_ranges.clear()
+
+    def archive_gaps(self, min_x: float, max_x: float) -> List[tuple]:
+        """
+        Returns the parts of [min_x, max_x] for which raw archive data has not been loaded or requested yet.
+
+        Parameters
+        ----------
+        min_x : float
+            Timestamp of the start of the range
+        max_x : float
+            Timestamp of the end of the range
+
+        Returns
+        -------
+        list
+            The (start, end) timestamps of each missing part, oldest first.
+        """
+        gaps = self.archive_ranges.gaps(min_x, max_x)
+        self.archive_seconds_saved += (max_x - min_x) - sum(end - start for start, end in gaps)
+        return gaps
+
+    def request_archive_data(self, min_x: float, max_x: float, processing_command: str = "") -> None:
+        """
+        Requests archive data for [min_x, max_x] from the archiver appliance. Raw data requests are
+        recorded as loaded, so that the range is not requested again.
+
+        Parameters
+        ----------
+        min_x : float
+            Timestamp of the start of the range
+        max_x : float
+            Timestamp of the end of the range
+        processing_command : str, optional
+            The processing command for the archiver appliance, empty for raw data.
+        """
+        if processing_command:
+            # Processed data replaces the contents of the archive buffer once it is received
+            self.archive_ranges.clear()
+            self._pending_ranges.clear()
+        else:
+            self.archive_ranges.add(min_x, max_x)
+            self._pending_ranges.append((min_x, max_x))
+        self.archive_data_request_signal.emit(min_x, max_x, processing_command)
+
+    @Slot(float, float, str)
+    def _record_request(self, min_x: float, max_x: float, processing_command: str) -> None:
+        """Remember a range requested from the archiver appliance for this curve, to recognize its reply."""
+        self._requested_ranges.add((min_x, max_x))
 
     @Slot()
     def redrawCurve(self, min_x=None, max_x=None) -> None:
@@ -295,26 +388,18 @@ class ArchivePlotCurveItem(TimePlotCurveItem):
         Redraw the curve with any new data added since the last draw call.
         """
         if self.archive_points_accumulated == 0:
-            super().redrawCurve()
+            super().redrawCurve(min_x, max_x)
         else:
             try:
-                x = np.concatenate(
-                    (
-                        self.archive_data_buffer[0, -self.archive_points_accumulated :].astype(float),
-                        self.data_buffer[0, -self.points_accumulated :].astype(float)
-                        if self.points_accumulated > 0
-                        else np.empty(0, dtype=float),  # If there is no live data, just show the archive data only
-                    )
-                )
-
-                y = np.concatenate(
-                    (
-                        self.archive_data_buffer[1, -self.archive_points_accumulated :].astype(float),
-                        self.data_buffer[1, -self.points_accumulated :].astype(float)
-                        if self.points_accumulated > 0
-                        else np.empty(0, dtype=float),
-                    )
-                )
+                # If there is no live data, live_data() is empty and just the archive data is shown
+                if self._lod_mode:
+                    archive_data = self.archive_lod_data(min_x, max_x)
+                    live_data = self.lod_data(min_x, max_x)
+                else:
+                    archive_data = self.archive_data_buffer[:, -self.archive_points_accumulated :]
+                    live_data = self.live_data()
+                x = np.concatenate((archive_data[0].astype(float), live_data[0].astype(float)))
+                y = np.concatenate((archive_data[1].astype(float), live_data[1].astype(float)))
 
                 self.setData(y=y, x=x)
 
@@ -325,16 +410,52 @@ class ArchivePlotCurveItem(TimePlotCurveItem):
         if self._show_extension_line:
             self.set_extension_line_data()
 
+    def archive_lod_data(self, min_x: Optional[float] = None, max_x: Optional[float] = None) -> np.ndarray:
+        """
+        Returns the archive data to draw with level of detail rendering: the minimum and maximum
+        values for each horizontal pixel, over the range given by lod_window.
+
+        Parameters
+        ----------
+        min_x: float, optional
+            The minimum x-value visible on the plot.
+        max_x: float, optional
+            The maximum x-value visible on the plot.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (2, n) with the timestamps and values of the points to draw.
+        """
+        buffer = self.archive_data_buffer
+        if self._archive_lod_buffer is not buffer:
+            # The buffer was replaced rather than written to, the pyramid has to be rebuilt for it
+            self._archive_lod = MinMaxPyramid(buffer.shape[1])
+            self._archive_lod_buffer = buffer
+        start = buffer.shape[1] - self.archive_points_accumulated
+        stop = buffer.shape[1]
+        max_points = self.lod_max_points()
+        window = self.lod_window(min_x, max_x)
+        if window is not None:
+            # Keep the points just outside the window so the line reaches its edges
+            timestamps = buffer[0, start:]
+            first = start
+            start = max(first + int(np.searchsorted(timestamps, window[0])) - 1, first)
+            stop = min(first + int(np.searchsorted(timestamps, window[1], side="right")) + 1, stop)
+            # The window is three times as wide as the view
+            max_points *= 3
+        return buffer[:, self._archive_lod.decimate(buffer[1], start, stop, max_points)]
+
     def set_extension_line_data(self) -> None:
         """
         Creates a dotted line from the latest point in the buffer
         (live or archived depending on if live data is active).
         """
         if self._liveData:
-            if self.data_buffer.size == 0:
+            if self._data_ring.capacity == 0:
                 return
-            x_last = self.data_buffer[:, -1]
-            y_last = self.data_buffer[:, -1]
+            x_last = self._data_ring.latest(1)[:, -1]
+            y_last = x_last
         else:
             if self.archive_data_buffer.size == 0:
                 return
@@ -380,6 +501,10 @@ class ArchivePlotCurveItem(TimePlotCurveItem):
         """
         self.archive_points_accumulated = 0
         self.archive_data_buffer = np.zeros((2, self._archiveBufferSize), order="f", dtype=float)
+        self.archive_ranges.clear()
+        self._pending_ranges.clear()
+        self._requested_ranges.clear()
+        self._archive_optimized = False
 
     def getArchiveBufferSize(self) -> int:
         """Return the length of the archive buffer"""
@@ -465,6 +590,11 @@ class ArchivePlotCurveItem(TimePlotCurveItem):
             The new connection status of the archive channel
         """
         self.arch_connected = connected
+        if not connected:
+            # Requests that failed have to be made again
+            for min_x, max_x in self._pending_ranges:
+                self.archive_ranges.remove(min_x, max_x)
+            self._pending_ranges.clear()
         self.archive_channel_connection.emit(connected)
 
     def channels(self) -> List[PyDMChannel]:
@@ -1318,8 +1448,20 @@ class PyDMArchiverTimePlot(PyDMTimePlot):
                     else:
                         optimized_data_bins = self.optimized_data_bins
                     processing_command = "optimized_" + str(optimized_data_bins)
-                curve.archive_data_request_signal.emit(min_x, max_x - 1, processing_command)
-                req_queued |= True
+                if not isinstance(curve, ArchivePlotCurveItem):
+                    curve.archive_data_request_signal.emit(min_x, max_x - 1, processing_command)
+                    req_queued |= True
+                    continue
+                if processing_command:
+                    curve.request_archive_data(min_x, max_x - 1, processing_command)
+                    req_queued |= True
+                    continue
+                # Only request the parts of the range for which raw data is not loaded yet
+                for gap_min, gap_max in curve.archive_gaps(min_x, max_x - 1):
+                    if gap_max - gap_min < 1:
+                        continue
+                    curve.request_archive_data(gap_min, gap_max)
+                    req_queued |= True
 
         if not req_queued:
             self._archive_request_queued = False
@@ -1426,6 +1568,7 @@ class PyDMArchiverTimePlot(PyDMTimePlot):
                 yAxisName=d.get("yAxisName"),
                 useArchiveData=d.get("useArchiveData"),
                 liveData=d.get("liveData"),
+                lodMode=d.get("lodMode", False),
             )
 
     curves = Property("QStringList", getCurves, setCurves, designable=False)
@@ -1448,6 +1591,7 @@ class PyDMArchiverTimePlot(PyDMTimePlot):
         useArchiveData=True,
         liveData=True,
         showExtensionLine=None,
+        lodMode=False,
     ) -> ArchivePlotCurveItem:
         """
         Overrides timeplot addYChannel method to be able to pass the liveData flag.
@@ -1472,6 +1616,7 @@ class PyDMArchiverTimePlot(PyDMTimePlot):
             useArchiveData=useArchiveData,
             liveData=liveData,
             showExtensionLine=showExtensionLine,
+            lodMode=lodMode,
         )
         if not is_qt_designer():
             self.requestDataFromArchiver()
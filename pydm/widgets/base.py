@@ -111,7 +111,7 @@ def widget_destroyed(channels, widget):
     RulesDispatcher().unregister(widget)
 
 
-def refresh_style(widget):
+def refresh_style(widget, recursive=True):
     """
     Method that traverse the widget tree starting at `widget` and refresh the
     style for this widget and its children.
@@ -119,14 +119,19 @@ def refresh_style(widget):
     Parameters
     ----------
     widget : QWidget
+    recursive : bool, optional
+        Whether to refresh the style of the children too. Re-polishing every
+        descendant of a large widget is expensive, so pass False when only
+        the widget itself is affected.
     """
     widgets = [widget]
 
-    try:
-        widgets.extend(widget.findChildren(QWidget))
-    except Exception:
-        # If we fail it means that widget is probably destroyed
-        return
+    if recursive:
+        try:
+            widgets.extend(widget.findChildren(QWidget))
+        except Exception:
+            # If we fail it means that widget is probably destroyed
+            return
     for child_widget in widgets:
         try:
             child_widget.style().unpolish(child_widget)
@@ -809,7 +814,36 @@ class PyDMWidget(PyDMPrimitiveWidget):
             self._alarm_state = PyDMWidget.ALARM_NONE
         else:
             self._alarm_state = new_alarm_severity
-        refresh_style(self)
+        self.refresh_alarm_style()
+
+    def alarm_styled_children(self):
+        """
+        The child widgets whose style depends on the alarm properties of this
+        widget, through stylesheet selectors such as
+        ``PyDMSlider[alarmSeverity="1"] > QLabel#valueLabel``. Their style is
+        refreshed along with this widget's when the alarm severity changes.
+
+        Returns
+        -------
+        list
+        """
+        return []
+
+    def refresh_alarm_style(self):
+        """
+        Refresh the style of this widget after a change of its alarm severity.
+
+        Only this widget and its :meth:`alarm_styled_children` are
+        re-polished, so that an alarm on a container does not restyle every
+        widget it holds. Set the ``PYDM_ALARM_STYLE_RECURSIVE`` environment
+        variable to re-polish all the descendants instead.
+        """
+        if config.ALARM_STYLE_RECURSIVE:
+            refresh_style(self)
+            return
+        refresh_style(self, recursive=False)
+        for child in self.alarm_styled_children():
+            refresh_style(child, recursive=False)
 
     def enum_strings_changed(self, new_enum_strings):
         """
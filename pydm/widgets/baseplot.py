@@ -62,10 +62,16 @@ class BasePlotCurveItem(PlotDataItem):
     yAxisName: str, optional
         The name of the axis to link this curve with. Leaving it None will result in the default
         name of 'Axis 1' which may still be modified later if needed.
+    lodMode: bool, optional
+        If True, curves that support it only draw the minimum and maximum values
+        of their data for each horizontal pixel, instead of every point.
     **kargs: optional
         PlotDataItem keyword arguments, such as symbol and symbolSize.
     """
 
+    # Width in pixels assumed for level of detail rendering when the curve is not shown in a view yet
+    DEFAULT_LOD_WIDTH = 2000
+
     REDRAW_ON_X, REDRAW_ON_Y, REDRAW_ON_EITHER, REDRAW_ON_BOTH = range(4)
     symbols = OrderedDict(
         [
@@ -101,8 +107,10 @@ class BasePlotCurveItem(PlotDataItem):
         lineWidth: Optional[int] = None,
         yAxisName: Optional[str] = None,
         exists: bool = True,
+        lodMode: bool = False,
         **kws,
     ) -> None:
+        self._lod_mode = lodMode
         self._color = QColor("white")
         self._thresholdColor = QColor("white")
         self.exists = exists
@@ -387,6 +395,49 @@ class BasePlotCurveItem(PlotDataItem):
         """
         self.setSymbolSize(int(new_size))
 
+    @property
+    def lodMode(self) -> bool:
+        """
+        Returns whether level of detail rendering is enabled for the curve.
+
+        Returns
+        -------
+        bool
+        """
+        return self._lod_mode
+
+    @lodMode.setter
+    def lodMode(self, enable: bool) -> None:
+        """
+        Enable or disable level of detail rendering. When enabled, only about two
+        points per horizontal pixel, the minimum and maximum of the data falling
+        in that pixel, are drawn. Spikes remain visible, while curves with a large
+        number of points are much cheaper to draw.
+
+        Parameters
+        ----------
+        enable : bool
+            True to draw a reduced number of points, False to draw every point
+        """
+        enable = bool(enable)
+        if enable == self._lod_mode:
+            return
+        self._lod_mode = enable
+        self.redrawCurve()
+
+    def lod_max_points(self) -> int:
+        """
+        Returns the number of points to draw with level of detail rendering, two for
+        each horizontal pixel of the view showing the curve.
+
+        Returns
+        -------
+        int
+        """
+        view_box = self.getViewBox()
+        width = int(view_box.width()) if view_box is not None else 0
+        return 2 * (width if width > 0 else self.DEFAULT_LOD_WIDTH)
+
     def setBarGraphInfo(
         self,
         bar_width: Optional[float] = 1.0,
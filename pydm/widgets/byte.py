@@ -1,6 +1,6 @@
 from qtpy.QtWidgets import QWidget, QTabWidget, QGridLayout, QLabel, QStyle, QStyleOption
 from qtpy.QtGui import QColor, QPen, QFontMetrics, QPainter, QPaintEvent, QBrush
-from qtpy.QtCore import Qt, QSize, QPoint
+from qtpy.QtCore import Qt, QSize, QPoint, QRectF, QEvent
 from typing import List, Optional
 from .base import PyDMWidget, PostParentClassInitSetup
 from pydm.utilities import ACTIVE_QT_WRAPPER, QtWrapperTypes
@@ -104,6 +104,7 @@ class PyDMByteIndicator(QWidget, PyDMWidget):
         # This is kind of ridiculous, importing QTabWidget just to get a 4-item enum that's usable in Designer.
         # PyQt5 lets you define custom enums that you can use in designer with QtCore.Q_ENUMS(), doesn't exist in PyQt4.
         self._labels = []
+        self._label_texts = []
         self._show_labels = True
         self._label_position = QTabWidget.East
 
@@ -111,6 +112,13 @@ class PyDMByteIndicator(QWidget, PyDMWidget):
 
         self._indicators = []
         self._circles = False
+        # In flat painting mode the bits and labels are painted by this widget itself, from a cached
+        # layout of their rectangles, instead of by one child widget each.
+        self._flat_painting = False
+        self._flat_layout = None
+        # The bits and colors last shown, so that only the bits that changed are updated
+        self._painted_bits = 0
+        self._painted_state = None
         self.set_spacing()
         self.layout().setOriginCorner(Qt.TopLeftCorner)
 
@@ -194,6 +202,9 @@ class PyDMByteIndicator(QWidget, PyDMWidget):
                     self.layout().addWidget(indicator, 0, i)
                     # Invalid combo of orientation and label position, so
                     # we don't reset label visibility here.
+        self._flat_layout = None
+        self._painted_state = None
+        self.update()
         self.update_indicators()
 
     def clear(self) -> None:
@@ -211,6 +222,9 @@ class PyDMByteIndicator(QWidget, PyDMWidget):
     def update_indicators(self) -> None:
         """
         Update the inner bit indicators accordingly with the new value.
+
+        Only the bits that changed since the last update are repainted, and
+        nothing is done when neither the value nor the colors have changed.
         """
         if self._shift < 0:
             value = int(self.value) << abs(self._shift)
@@ -218,17 +232,110 @@ class PyDMByteIndicator(QWidget, PyDMWidget):
             value = int(self.value) >> self._shift
 
         # also display value when negative (these values are represented by bits in Two's Complement form)
+        mask = (1 << self._num_bits) - 1
+        bits = value & mask
+        state = (
+            self._connected,
+            self._alarm_state == 3,
+            self._on_color.rgba(),
+            self._off_color.rgba(),
+            self._disconnected_color.rgba(),
+            self._invalid_color.rgba(),
+        )
+        if state == self._painted_state:
+            changed = bits ^ self._painted_bits
+        else:
+            changed = mask
+        self._painted_bits = bits
+        self._painted_state = state
 
-        bits = [(value >> i) & 1 for i in range(self._num_bits)]
-        for bit, indicator in zip(bits, self._indicators):
-            if self._connected:
-                if self._alarm_state == 3:
-                    c = self._invalid_color
-                else:
-                    c = self._on_color if bit else self._off_color
+        while changed:
+            lowest = changed & -changed
+            changed ^= lowest
+            i = lowest.bit_length() - 1
+            if self._flat_painting:
+                bit_rects, _ = self.flat_layout()
+                # Include the outline, which is drawn centered on the edge of the rectangle
+                self.update(bit_rects[i].toAlignedRect().adjusted(-1, -1, 1, 1))
+            elif i < len(self._indicators):
+                self._indicators[i].setColor(self.bit_color(bits >> i & 1))
+
+    def bit_color(self, bit: int) -> QColor:
+        """
+        The color to draw a bit with, given its state and the channel state.
+
+        Parameters
+        ----------
+        bit : int
+            The state of the bit, 1 for on and 0 for off.
+
+        Returns
+        -------
+        QColor
+        """
+        if not self._connected:
+            return self._disconnected_color
+        if self._alarm_state == 3:
+            return self._invalid_color
+        return self._on_color if bit else self._off_color
+
+    def flat_layout(self) -> tuple:
+        """
+        The rectangles of the bits and labels painted in flat painting mode.
+
+        The layout follows the orientation, label position, endianness and
+        spacing properties the same way the inner widgets are laid out, and is
+        cached until the size or one of those properties changes.
+
+        Returns
+        -------
+        tuple
+            The list of rectangles for the bits, in bit order, and the list of
+            rectangles for the labels, which is empty when labels are not shown.
+        """
+        if self._flat_layout is not None:
+            return self._flat_layout
+        rect = QRectF(self.contentsRect())
+        num_bits = self._num_bits
+        indicator_spacing = 5.0 if self._circles else 0.0
+        label_spacing = 5.0
+        vertical = self._orientation == Qt.Vertical
+        if vertical:
+            show_labels = self._show_labels and self._label_position in (QTabWidget.West, QTabWidget.East)
+        else:
+            show_labels = self._show_labels and self._label_position in (QTabWidget.North, QTabWidget.South)
+        labels_first = self._label_position in (QTabWidget.West, QTabWidget.North)
+
+        label_size = 0.0
+        if show_labels:
+            fm = QFontMetrics(self.font())
+            if vertical:
+                label_size = float(max((fm.horizontalAdvance(text) for text in self._label_texts), default=0))
             else:
-                c = self._disconnected_color
-            indicator.setColor(c)
+                label_size = float(fm.height())
+        along, across = (rect.height(), rect.width()) if vertical else (rect.width(), rect.height())
+        indicator_size = max(across - label_size - (label_spacing if show_labels else 0.0), 0.0)
+        cell_size = max((along - indicator_spacing * (num_bits - 1)) / num_bits, 0.0)
+        if labels_first:
+            indicator_offset = label_size + label_spacing if show_labels else 0.0
+            label_offset = 0.0
+        else:
+            indicator_offset = 0.0
+            label_offset = indicator_size + label_spacing
+
+        bit_rects = []
+        label_rects = []
+        for i in range(num_bits):
+            slot = num_bits - 1 - i if self._big_endian else i
+            start = slot * (cell_size + indicator_spacing)
+            if vertical:
+                bit_rects.append(QRectF(rect.left() + indicator_offset, rect.top() + start, indicator_size, cell_size))
+                label_rects.append(QRectF(rect.left() + label_offset, rect.top() + start, label_size, cell_size))
+            else:
+                bit_rects.append(QRectF(rect.left() + start, rect.top() + indicator_offset, cell_size, indicator_size))
+                label_rects.append(QRectF(rect.left() + start, rect.top() + label_offset, cell_size, label_size))
+        self._flat_layout = (bit_rects, label_rects if show_labels else [])
+        return self._flat_layout
 
     def readOnColor(self) -> QColor:
         """
@@ -344,6 +451,8 @@ class PyDMByteIndicator(QWidget, PyDMWidget):
         self._show_labels = show
         for label in self._labels:
             label.setVisible(show)
+        self._flat_layout = None
+        self.update()
 
     showLabels = Property(bool, readShowLabels, setShowLabels)
 
@@ -404,6 +513,9 @@ class PyDMByteIndicator(QWidget, PyDMWidget):
         self.set_spacing()
         for indicator in self._indicators:
             indicator.circle = self._circles
+        self._flat_layout = None
+        self._painted_state = None
+        self.update()
         self.update_indicators()
 
     circles = Property(bool, readCircles, setCircles)
@@ -454,7 +566,10 @@ class PyDMByteIndicator(QWidget, PyDMWidget):
         self._num_bits = new_num_bits
         for indicator in self._indicators:
             indicator.deleteLater()
-        self._indicators = [PyDMBitIndicator(parent=self, circle=self.circles) for i in range(0, self._num_bits)]
+        if self._flat_painting:
+            self._indicators = []
+        else:
+            self._indicators = [PyDMBitIndicator(parent=self, circle=self.circles) for i in range(0, self._num_bits)]
         old_labels = self.labels
         new_labels = ["Bit {}".format(i) for i in range(0, self._num_bits)]
         for i, old_label in enumerate(old_labels):
@@ -465,6 +580,40 @@ class PyDMByteIndicator(QWidget, PyDMWidget):
 
     numBits = Property(int, readNumBits, setNumBits)
 
+    def readFlatPainting(self) -> bool:
+        """
+        Paint all bits and labels directly on the widget, instead of using
+        one inner widget for each of them.
+
+        This is much lighter for displays with many byte indicators, as the
+        bits that changed are repainted in a single pass.
+
+        Returns
+        -------
+        bool
+        """
+        return self._flat_painting
+
+    def setFlatPainting(self, flat: bool) -> None:
+        """
+        Paint all bits and labels directly on the widget, instead of using
+        one inner widget for each of them.
+
+        Parameters
+        ----------
+        flat : bool
+            If True, the bits and labels are painted by the widget itself
+        """
+        flat = bool(flat)
+        if flat == self._flat_painting:
+            return
+        self._flat_painting = flat
+        # Recreate the inner widgets, or remove them
+        self.setNumBits(self._num_bits)
+        self.updateGeometry()
+
+    flatPainting = Property(bool, readFlatPainting, setFlatPainting)
+
     def readShift(self) -> int:
         """
         Bit shift.
@@ -495,7 +644,7 @@ class PyDMByteIndicator(QWidget, PyDMWidget):
         -------
         list
         """
-        return [str(currLabel.text()) for currLabel in self._labels]
+        return list(self._label_texts)
 
     def setLabels(self, new_labels: List[str]) -> None:
         """
@@ -508,7 +657,11 @@ class PyDMByteIndicator(QWidget, PyDMWidget):
         for label in self._labels:
             label.hide()
             label.deleteLater()
-        self._labels = [QLabel(text, parent=self) for text in new_labels]
+        self._label_texts = [str(text) for text in new_labels]
+        if self._flat_painting:
+            self._labels = []
+        else:
+            self._labels = [QLabel(text, parent=self) for text in self._label_texts]
         # Have to reset showLabels to hide or show all the new labels we just made.
         self.showLabels = self._show_labels
         self.rebuild_layout()
@@ -531,7 +684,7 @@ class PyDMByteIndicator(QWidget, PyDMWidget):
         except Exception:
             pass
 
-    def paintEvent(self, _) -> None:
+    def paintEvent(self, event: QPaintEvent) -> None:
         """
         Paint events are sent to widgets that need to update themselves,
         for instance when part of a widget is exposed because a covering
@@ -541,6 +694,9 @@ class PyDMByteIndicator(QWidget, PyDMWidget):
         from the stylesheet, configures the brush, pen and calls ```draw_item```
         so the specifics can be performed for each of the drawing classes.
 
+        In flat painting mode, the bits and labels within the exposed area are
+        also painted here, with the bits of the same color drawn together.
+
         Parameters
         ----------
         event : QPaintEvent
@@ -550,6 +706,63 @@ class PyDMByteIndicator(QWidget, PyDMWidget):
         opt.initFrom(self)
         self.style().drawPrimitive(QStyle.PE_Widget, opt, painter, self)
         painter.setRenderHint(QPainter.Antialiasing)
+        if not self._flat_painting:
+            return
+
+        bit_rects, label_rects = self.flat_layout()
+        exposed = QRectF(event.rect()).adjusted(-1, -1, 1, 1)
+        rects_by_color = {}
+        for i, bit_rect in enumerate(bit_rects):
+            if bit_rect.intersects(exposed):
+                color = self.bit_color(self._painted_bits >> i & 1).rgba()
+                rects_by_color.setdefault(color, []).append(bit_rect)
+
+        painter.setPen(self._line_pen)
+        for color, rects in rects_by_color.items():
+            painter.setBrush(QBrush(QColor.fromRgba(color), Qt.SolidPattern))
+            if self._circles:
+                for rect in rects:
+                    radius = min(rect.width(), rect.height()) / 2.0 - 2.0 * max(self._line_pen.widthF(), 1.0)
+                    painter.drawEllipse(rect.center(), radius, radius)
+            else:
+                painter.drawRects(rects)
+
+        if label_rects:
+            alignment = Qt.AlignLeft if self._orientation == Qt.Vertical else Qt.AlignHCenter
+            painter.setPen(self.palette().color(self.foregroundRole()))
+            for text, label_rect in zip(self._label_texts, label_rects):
+                if label_rect.intersects(exposed):
+                    painter.drawText(label_rect, alignment | Qt.AlignVCenter, text)
+
+    def resizeEvent(self, event) -> None:
+        self._flat_layout = None
+        super().resizeEvent(event)
+
+    def changeEvent(self, event: QEvent) -> None:
+        if event.type() == QEvent.FontChange:
+            self._flat_layout = None
+            self.updateGeometry()
+        super().changeEvent(event)
+
+    def minimumSizeHint(self) -> QSize:
+        if not self._flat_painting:
+            return super().minimumSizeHint()
+        fm = QFontMetrics(self.font())
+        spacing = 5 if self._circles else 0
+        along = self._num_bits * fm.height() + (self._num_bits - 1) * spacing
+        across = fm.height()
+        if self._orientation == Qt.Vertical:
+            if self._show_labels and self._label_position in (QTabWidget.West, QTabWidget.East):
+                across += 5 + max((fm.horizontalAdvance(text) for text in self._label_texts), default=0)
+            return QSize(across, along)
+        if self._show_labels and self._label_position in (QTabWidget.North, QTabWidget.South):
+            across += 5 + fm.height()
+        return QSize(along, across)
+
+    def sizeHint(self) -> QSize:
+        if not self._flat_painting:
+            return super().sizeHint()
+        return self.minimumSizeHint()
 
     def alarm_severity_changed(self, new_alarm_severity: int) -> None:
         """
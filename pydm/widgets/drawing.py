@@ -4,11 +4,13 @@ import os
 import logging
 
 from qtpy.QtWidgets import QWidget, QStyle, QStyleOption
-from qtpy.QtGui import QColor, QPainter, QBrush, QPen, QPolygonF, QPixmap, QMovie
+from qtpy.QtGui import QColor, QPainter, QBrush, QPen, QPolygonF, QPixmap, QPixmapCache, QMovie
 from qtpy.QtCore import Qt, QPoint, QPointF, QSize, Slot, QTimer, QRectF
 from qtpy.QtDesigner import QDesignerFormWindowInterface
+from qtpy.QtSvg import QSvgRenderer
 from .base import PyDMWidget, PostParentClassInitSetup
 from pydm.utilities import is_qt_designer, find_file
+from pydm.utilities.image_cache import image_cache
 from pydm.utilities import ACTIVE_QT_WRAPPER, QtWrapperTypes
 
 if ACTIVE_QT_WRAPPER == QtWrapperTypes.PYSIDE6:
@@ -26,6 +28,14 @@ _penRuleProperties = {
     "Set Brush Color": ["brush", QBrush],
 }
 
+# Brush styles whose appearance is not described by their color and style alone
+_UNCACHEABLE_BRUSH_STYLES = (
+    Qt.LinearGradientPattern,
+    Qt.RadialGradientPattern,
+    Qt.ConicalGradientPattern,
+    Qt.TexturePattern,
+)
+
 
 def deg_to_qt(deg):
     """
@@ -70,6 +80,11 @@ class PyDMDrawing(QWidget, PyDMWidget):
     Base class to be used for all PyDM Drawing Widgets.
     This class inherits from QWidget and PyDMWidget.
 
+    The drawing is rendered once into a pixmap, which is reused until one of
+    the properties returned by ``drawing_cache_key`` changes. The pixmaps are
+    shared through ``QPixmapCache``, so identical drawings are only rendered
+    once for the whole application.
+
     Parameters
     ----------
     parent : QWidget
@@ -95,6 +110,8 @@ class PyDMDrawing(QWidget, PyDMWidget):
         self._pen.setJoinStyle(self._pen_join_style)
         self._original_pen_style = self._pen_style
         self._original_pen_color = self._pen_color
+        self._drawing_pixmap = None
+        self._drawing_pixmap_key = None
         QWidget.__init__(self, parent)
         PyDMWidget.__init__(self, init_channel=init_channel)
         self.alarmSensitiveBorder = False
@@ -129,6 +146,12 @@ class PyDMDrawing(QWidget, PyDMWidget):
         opt = QStyleOption()
         opt.initFrom(self)
         self.style().drawPrimitive(QStyle.PE_Widget, opt, painter, self)
+
+        pixmap = self.drawing_pixmap()
+        if pixmap is not None:
+            painter.drawPixmap(0, 0, pixmap)
+            return
+
         painter.setRenderHint(QPainter.Antialiasing)
 
         painter.setBrush(self._brush)
@@ -136,6 +159,70 @@ class PyDMDrawing(QWidget, PyDMWidget):
 
         self.draw_item(painter)
 
+    def drawing_cache_key(self):
+        """
+        Everything the result of ``draw_item`` depends on. Subclasses with
+        more properties affecting their drawing must add them, or return
+        None to always draw directly on the widget.
+
+        Returns
+        -------
+        tuple or None
+        """
+        if self._brush.style() in _UNCACHEABLE_BRUSH_STYLES:
+            return None
+        return (
+            type(self).__module__,
+            type(self).__qualname__,
+            self.width(),
+            self.height(),
+            self.devicePixelRatioF(),
+            self._rotation,
+            self._pen.color().rgba(),
+            self._pen.style(),
+            self._pen.widthF(),
+            self._pen.capStyle(),
+            self._pen.joinStyle(),
+            self._brush.color().rgba(),
+            self._brush.style(),
+            self._alarm_state,
+        )
+
+    def drawing_pixmap(self):
+        """
+        The drawing rendered into a pixmap, taken from ``QPixmapCache`` when
+        an identical drawing was already rendered.
+
+        Returns
+        -------
+        QPixmap or None
+            None when the drawing can not be cached.
+        """
+        key = self.drawing_cache_key()
+        if key is None or self.width() <= 0 or self.height() <= 0:
+            return None
+        key = "pydm-drawing:" + repr(key)
+        if key == self._drawing_pixmap_key:
+            return self._drawing_pixmap
+
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None or pixmap.isNull():
+            ratio = self.devicePixelRatioF()
+            pixmap = QPixmap(max(int(self.width() * ratio), 1), max(int(self.height() * ratio), 1))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setBrush(self._brush)
+            painter.setPen(self._pen)
+            self.draw_item(painter)
+            painter.end()
+            QPixmapCache.insert(key, pixmap)
+        # Kept on the widget too, so that it is not redrawn when evicted from QPixmapCache
+        self._drawing_pixmap = pixmap
+        self._drawing_pixmap_key = key
+        return pixmap
+
     def draw_item(self, painter):
         """
         The classes inheriting from PyDMDrawing must overwrite this method.
@@ -622,6 +709,18 @@ class PyDMDrawingLineBase(PyDMDrawing):
 
     flipMidPointArrow = Property(bool, readFlipMidPointArrow, setFlipMidPointArrow)
 
+    def drawing_cache_key(self):
+        key = super().drawing_cache_key()
+        if key is None:
+            return None
+        return key + (
+            self._arrow_size,
+            self._arrow_end_point_selection,
+            self._arrow_start_point_selection,
+            self._arrow_mid_point_selection,
+            self._arrow_mid_point_flipped,
+        )
+
     @staticmethod
     def _arrow_points(startpoint, endpoint, height, width) -> QPolygonF:
         """
@@ -887,6 +986,12 @@ class PyDMDrawingPolyline(PyDMDrawingLineBase):
 
     points = Property("QStringList", getPoints, setPoints, resetPoints)
 
+    def drawing_cache_key(self):
+        key = super().drawing_cache_key()
+        if key is None:
+            return None
+        return key + tuple(tuple(pt) if isinstance(pt, list) else pt for pt in self._points)
+
 
 class PyDMDrawingImage(PyDMDrawing):
     """
@@ -915,6 +1020,10 @@ class PyDMDrawingImage(PyDMDrawing):
         self._pixmap.fill(self.null_color)
         self._aspect_ratio_mode = Qt.KeepAspectRatio
         self._movie = None
+        # The file the image was loaded from, whose rasterizations are shared through the image cache
+        self._image_path = None
+        # The size of that image, as the cached rasterizations are rounded up to a few pixels larger
+        self._image_size = QSize()
         self._recursive_image_search = False
         self._file = None
         # Make sure we don't set a non-existent file
@@ -1017,8 +1126,18 @@ class PyDMDrawingImage(PyDMDrawing):
                 self._movie.stop()
                 self._movie.deleteLater()
                 self._movie = None
+            self._image_path = None
             if not abs_path.endswith(".gif"):
-                pixmap = QPixmap(abs_path)
+                image = image_cache().load(abs_path)
+                if isinstance(image, QSvgRenderer):
+                    pixmap = image_cache().rendered(abs_path, image.defaultSize())
+                else:
+                    pixmap = image
+                if pixmap is None:
+                    pixmap = QPixmap()
+                else:
+                    self._image_path = abs_path
+                    self._image_size = image.defaultSize() if isinstance(image, QSvgRenderer) else image.size()
             else:
                 self._movie = QMovie(abs_path, parent=self)
                 self._movie.setCacheMode(QMovie.CacheAll)
@@ -1033,6 +1152,7 @@ class PyDMDrawingImage(PyDMDrawing):
             # doing this in Designer as this spams the user as they are typing
             if not is_qt_designer():  # pragma: no cover
                 logger.error("Image file  %r does not exist", abs_path)
+            self._image_path = None
             pixmap = QPixmap(self.sizeHint())
             pixmap.fill(self.null_color)
         # Update the display
@@ -1043,9 +1163,10 @@ class PyDMDrawingImage(PyDMDrawing):
     filename = Property(str, readFilename, setFilename)
 
     def sizeHint(self):
-        if self._pixmap.size().isEmpty():
+        size = self._image_size if self._image_path is not None else self._pixmap.size()
+        if size.isEmpty():
             return super().sizeHint()
-        return self._pixmap.size()
+        return size
 
     def readAspectRatioMode(self) -> int | Qt.AspectRatioMode:
         """
@@ -1083,7 +1204,16 @@ class PyDMDrawingImage(PyDMDrawing):
         """
         super().draw_item(painter)
         x, y, w, h = self.get_bounds(maxsize=True, force_no_pen=True)
-        if not isinstance(self._pixmap, QMovie):
+        if self._image_path is not None and self._movie is None:
+            draw_size = self._image_size.scaled(int(w), int(h), self._aspect_ratio_mode)
+            # The rasterization of the image at this size is shared by all images of about the same size
+            pixmap = image_cache().rendered(self._image_path, draw_size, self.devicePixelRatioF())
+            if pixmap is not None:
+                x += max(w - draw_size.width(), 0) / 2
+                y += max(h - draw_size.height(), 0) / 2
+                painter.setRenderHint(QPainter.SmoothPixmapTransform)
+                painter.drawPixmap(QRectF(x, y, draw_size.width(), draw_size.height()), pixmap, QRectF(pixmap.rect()))
+        elif not isinstance(self._pixmap, QMovie):
             _scaled = self._pixmap.scaled(int(w), int(h), self._aspect_ratio_mode, Qt.SmoothTransformation)
             # Make sure the image is centered if smaller than the widget itself
             if w > _scaled.width():
@@ -1094,6 +1224,10 @@ class PyDMDrawingImage(PyDMDrawing):
                 y += (h - _scaled.height()) / 2
             painter.drawPixmap(QPointF(x, y), _scaled)
 
+    def drawing_cache_key(self):
+        # The image is already a pixmap, and changes with every frame of a movie
+        return None
+
     def movie_frame_changed(self, frame_no):
         """
         Callback executed when a new frame is available at the QMovie.
@@ -1316,6 +1450,12 @@ class PyDMDrawingArc(PyDMDrawing):
 
     spanAngle = Property(float, readSpanAngle, setSpanAngle)
 
+    def drawing_cache_key(self):
+        key = super().drawing_cache_key()
+        if key is None:
+            return None
+        return key + (self._start_angle, self._span_angle)
+
     def draw_item(self, painter):
         """
         Draws the arc after setting up the canvas with a call to
@@ -1416,6 +1556,12 @@ class PyDMDrawingPolygon(PyDMDrawing):
 
     numberOfPoints = Property(int, readNumberOfPoints, setNumberOfPoints)
 
+    def drawing_cache_key(self):
+        key = super().drawing_cache_key()
+        if key is None:
+            return None
+        return key + (self._num_points,)
+
     def _calculate_drawing_points(self, x, y, w, h):
         # (x + r*cos(theta), y + r*sin(theta))
         r = min(w, h) / 2.0
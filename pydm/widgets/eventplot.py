@@ -6,6 +6,7 @@ from qtpy.QtGui import QColor
 from qtpy.QtCore import Slot, Property, Qt
 from .baseplot import BasePlot, NoDataError, BasePlotCurveItem
 from .channel import PyDMChannel
+from pydm.utilities.ring_buffer import RingBuffer
 
 
 DEFAULT_BUFFER_SIZE = 1200
@@ -26,7 +27,7 @@ class EventPlotCurveItem(BasePlotCurveItem):
         self.bufferSizeChannel = None
         self.bufferSizeChannel_connected = False
         self._bufferSize = DEFAULT_BUFFER_SIZE
-        self.data_buffer = np.zeros((2, self._bufferSize), order="f", dtype=float)
+        self._data_ring = RingBuffer(self._bufferSize, track_extrema=True)
         self.points_accumulated = 0
         if "symbol" not in kws.keys():
             kws["symbol"] = "o"
@@ -107,16 +108,32 @@ class EventPlotCurveItem(BasePlotCurveItem):
             self.y_idx = int(self.y_idx)
         if len(new_data) <= self.x_idx or len(new_data) <= self.y_idx:
             return
-        self.data_buffer = np.roll(self.data_buffer, -1)
-        self.data_buffer[0, -1] = new_data[self.x_idx]
-        self.data_buffer[1, -1] = new_data[self.y_idx]
+        self._data_ring.append(new_data[self.x_idx], new_data[self.y_idx])
         if self.points_accumulated < self._bufferSize:
             self.points_accumulated = self.points_accumulated + 1
         self.data_changed.emit()
 
     def initialize_buffer(self):
         self.points_accumulated = 0
-        self.data_buffer = np.zeros((2, self._bufferSize), order="f", dtype=float)
+        self._data_ring = RingBuffer(self._bufferSize, track_extrema=True)
+
+    @property
+    def data_buffer(self):
+        """
+        The data of this curve as an array of shape (2, bufferSize), with the
+        x values in row 0, the y values in row 1 and the most recent point in
+        the last column. Accessing it rotates the underlying circular buffer
+        into chronological order.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return self._data_ring.linearize()
+
+    @data_buffer.setter
+    def data_buffer(self, data):
+        self._data_ring.assign(data)
 
     def getBufferSize(self):
         return int(self._bufferSize)
@@ -191,9 +208,10 @@ class EventPlotCurveItem(BasePlotCurveItem):
         Called by the curve's parent plot whenever the curve needs to be
         re-drawn with new data.
         """
+        data = self._data_ring.latest(self.points_accumulated)
         self.setData(
-            x=self.data_buffer[0, -self.points_accumulated :].astype(float),
-            y=self.data_buffer[1, -self.points_accumulated :].astype(float),
+            x=data[0].astype(float),
+            y=data[1].astype(float),
         )
 
     def limits(self):
@@ -207,9 +225,11 @@ class EventPlotCurveItem(BasePlotCurveItem):
         """
         if self.points_accumulated == 0:
             raise NoDataError("Curve has no data, cannot determine limits.")
-        x_data = self.data_buffer[0, -self.points_accumulated :]
-        y_data = self.data_buffer[1, -self.points_accumulated :]
-        return ((float(np.amin(x_data)), float(np.amax(x_data))), (float(np.amin(y_data)), float(np.amax(y_data))))
+        # The ring buffer keeps running minimums and maximums, so this does not rescan the data
+        return (
+            self._data_ring.extrema(0, self.points_accumulated),
+            self._data_ring.extrema(1, self.points_accumulated),
+        )
 
     def channels(self):
         return [self.channel]
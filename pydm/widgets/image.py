@@ -1,10 +1,14 @@
-from qtpy.QtWidgets import QActionGroup
+from qtpy.QtWidgets import QActionGroup, QApplication
 from qtpy.QtCore import Signal, Slot, QTimer, QThread
 from pyqtgraph import ImageView, PlotItem
 from pyqtgraph import ColorMap
 from pyqtgraph.graphicsItems.ViewBox.ViewBoxMenu import ViewBoxMenu
+import atexit
 import numpy as np
 import logging
+import threading
+import time
+from collections import namedtuple
 from .channel import PyDMChannel
 from .colormaps import cmaps, cmap_names, PyDMColorMap
 from .base import PyDMWidget, PostParentClassInitSetup
@@ -70,41 +74,243 @@ if ACTIVE_QT_WRAPPER == QtWrapperTypes.PYSIDE6:
         WidthFirst = 1
 
 
+# The parameters an image is prepared with, captured on the GUI thread when it is posted to the worker.
+# When a lookup table is given the image is colored by the worker, and level_percentile, if not 0, picks
+# the levels of normalized data at that percentile of the image instead of at its minimum and maximum.
+ImageFrame = namedtuple(
+    "ImageFrame",
+    [
+        "image",
+        "width",
+        "reading_order",
+        "dimension_order",
+        "normalize_data",
+        "cm_min",
+        "cm_max",
+        "lut",
+        "level_percentile",
+    ],
+    defaults=(None, 0.0),
+)
+
+# Percentile levels are computed over a subsample of the image of about this many pixels
+PERCENTILE_SAMPLES = 64 * 1024
+
+
+def sampled_levels(image, percentile):
+    """
+    Levels of an image at a percentile of its values and at its complement.
+
+    The percentiles are computed over a regular subsample of the image, which
+    is plenty to pick display levels and much cheaper than a full sort.
+
+    Parameters
+    ----------
+    image : np.ndarray
+    percentile : float
+        The lower percentile, between 0 and 50.
+
+    Returns
+    -------
+    tuple
+        The lower and upper levels.
+    """
+    step = max(1, int(np.ceil(np.sqrt(image.size / PERCENTILE_SAMPLES))))
+    sample = image[::step, ::step] if image.ndim == 2 else image[::step]
+    with np.errstate(invalid="ignore"):
+        low, high = np.nanpercentile(sample, [percentile, 100.0 - percentile])
+    return low, high
+
+
+def apply_lut(image, mini, maxi, lut):
+    """
+    Color an image with a lookup table spanning the levels mini to maxi.
+
+    Values below mini take the first color, values above maxi the last one,
+    and NaN values are transparent.
+
+    Parameters
+    ----------
+    image : np.ndarray
+    mini : float
+    maxi : float
+    lut : np.ndarray
+        The RGBA lookup table, as a (N, 4) uint8 array.
+
+    Returns
+    -------
+    np.ndarray
+        The colored image, with a trailing axis of 4 uint8 channels.
+    """
+    last = len(lut) - 1
+    scale = last / (maxi - mini) if maxi > mini else 0.0
+    indices = np.subtract(image, mini, dtype=np.float32)
+    indices *= scale
+    np.clip(indices, 0, last, out=indices)
+    if image.dtype.kind == "f":
+        nans = np.isnan(indices)
+        if nans.any():
+            # The extra entry past the end of the table is transparent
+            lut = np.concatenate([lut, np.zeros((1, lut.shape[1]), dtype=lut.dtype)])
+            indices[nans] = last + 1
+    # Round to the nearest entry
+    indices += 0.5
+    return lookup_colors(lut, indices.astype(np.intp))
+
+
+def lookup_colors(lut, indices):
+    """
+    Gather the RGBA colors of a lookup table at an array of indices.
+
+    Parameters
+    ----------
+    lut : np.ndarray
+        The RGBA lookup table, as a (N, 4) uint8 array.
+    indices : np.ndarray
+        Integer indices into the table.
+
+    Returns
+    -------
+    np.ndarray
+        The colors, with a trailing axis of 4 uint8 channels.
+    """
+    # Gathering each color as a single 32 bit word is several times faster than gathering 4 bytes
+    words = np.ascontiguousarray(lut, dtype=np.uint8).view(np.uint32).ravel()
+    colors = np.take(words, indices)
+    return colors.view(np.uint8).reshape(indices.shape + (4,))
+
+
+# Image threads still running, kept here so that they are not garbage collected before being stopped
+_running_threads = set()
+
+
+@atexit.register
+def _stop_running_threads():
+    for thread in list(_running_threads):
+        thread.stop()
+
+
 class ImageUpdateThread(QThread):
+    """
+    Long-lived thread preparing the images of a PyDMImageView for display.
+
+    Frames are handed over through a single-slot mailbox with :meth:`post`.
+    A frame posted while the previous one is still waiting replaces it, and is
+    counted as dropped, so the thread always works on the latest image and
+    never queues up work behind a slow frame. The reshape, ``process_image``
+    and level computation run on this thread, and the result is sent to the
+    GUI thread with ``updateSignal``.
+
+    When the frame carries a lookup table, the image is also colored here,
+    and the GUI thread is handed an RGBA image it can display without any
+    scaling. Images of 8 or 16 bit integers are colored with a table of the
+    colors of every possible value, which is kept as long as the levels and
+    lookup table do not change.
+
+    Parameters
+    ----------
+    image_view : PyDMImageView
+        The widget the images are prepared for.
+    """
+
     updateSignal = Signal(list)
+    STAGES = ("reshape", "process", "levels", "color")
 
     def __init__(self, image_view):
         QThread.__init__(self)
         self.image_view = image_view
+        self._mailbox_condition = threading.Condition()
+        self._mailbox = None
+        self.frames_processed = 0
+        self.frames_dropped = 0
+        # The key and the table of the colors of every value of small integer images
+        self._value_colors = (None, None)
+        # Total time spent on each stage, in seconds
+        self.stage_times = dict.fromkeys(self.STAGES, 0.0)
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.stop)
+
+    def post(self, frame):
+        """
+        Hand a new frame to the thread, replacing the one still waiting if any.
+
+        Parameters
+        ----------
+        frame : ImageFrame
+        """
+        with self._mailbox_condition:
+            if self._mailbox is not None:
+                self.frames_dropped += 1
+            self._mailbox = frame
+            self._mailbox_condition.notify()
+
+    def start(self, *args, **kwargs):
+        _running_threads.add(self)
+        QThread.start(self, *args, **kwargs)
+
+    def requestInterruption(self):
+        QThread.requestInterruption(self)
+        with self._mailbox_condition:
+            self._mailbox_condition.notify()
+
+    @Slot()
+    def stop(self):
+        """Stop the thread and wait for the frame being prepared, if any."""
+        self.requestInterruption()
+        self.wait()
+        _running_threads.discard(self)
 
     def run(self):
-        img = self.image_view.image_waveform
+        while not self.isInterruptionRequested():
+            with self._mailbox_condition:
+                while self._mailbox is None and not self.isInterruptionRequested():
+                    self._mailbox_condition.wait()
+                frame, self._mailbox = self._mailbox, None
+            if frame is None:
+                continue
+            try:
+                data = self.prepare(frame)
+            except Exception:
+                logger.exception("Unable to prepare the image for display")
+                continue
+            if data is not None:
+                logging.debug("ImageUpdateThread - Emit Update Signal")
+                self.updateSignal.emit(data)
 
-        if self.image_view._dimension_order == DimensionOrder.WidthFirst:
+    def prepare(self, frame):
+        """
+        Prepare a frame for display.
+
+        Parameters
+        ----------
+        frame : ImageFrame
+
+        Returns
+        -------
+        list or None
+            The minimum and maximum levels, the image, and whether the image
+            was colored with the lookup table of the frame, or None if the
+            frame can not be displayed.
+        """
+        start = time.perf_counter()
+        img = frame.image
+
+        if frame.dimension_order == DimensionOrder.WidthFirst:
             shape = img.shape
             # numpy reshape asks for (height, width) as it's params,
             # and if we know our 'img.shape' is ordered [width, height],
             # we must pass reshape(height, width) which is (shape[1], shape[0])
             img = img.reshape(shape[1], shape[0])
 
-        needs_redraw = self.image_view.needs_redraw
-        image_dimensions = len(img.shape)
-        width = self.image_view.imageWidth
-        reading_order = self.image_view.readingOrder
-        normalize_data = self.image_view._normalize_data
-        cm_min = self.image_view.cm_min
-        cm_max = self.image_view.cm_max
-
-        if not needs_redraw:
-            logging.debug("ImageUpdateThread - needs redraw is False. Aborting.")
-            return
-        if image_dimensions == 1:
+        width = frame.width
+        if len(img.shape) == 1:
             if width < 1:
                 # We don't have a width for this image yet, so we can't draw it
                 logging.debug("ImageUpdateThread - no width available. Aborting.")
-                return
+                return None
             try:
-                if reading_order == ReadingOrder.Clike:
+                if frame.reading_order == ReadingOrder.Clike:
                     img = img.reshape((-1, width), order="C")
                 else:
                     img = img.reshape((width, -1), order="F")
@@ -112,19 +318,61 @@ class ImageUpdateThread(QThread):
                 logger.error("Invalid width for image during reshape: %d", width)
 
         if len(img) <= 0:
-            return
+            return None
+        reshaped = time.perf_counter()
         logging.debug("ImageUpdateThread - Will Process Image")
         img = self.image_view.process_image(img)
-        if normalize_data:
+        processed = time.perf_counter()
+        if frame.normalize_data and frame.level_percentile > 0:
+            mini, maxi = sampled_levels(img, frame.level_percentile)
+        elif frame.normalize_data:
             mini = img.min()
             maxi = img.max()
         else:
-            mini = cm_min
-            maxi = cm_max
-        logging.debug("ImageUpdateThread - Emit Update Signal")
-        self.updateSignal.emit([mini, maxi, img])
-        logging.debug("ImageUpdateThread - Set Needs Redraw -> False")
-        self.image_view.needs_redraw = False
+            mini = frame.cm_min
+            maxi = frame.cm_max
+        leveled = time.perf_counter()
+        # Color images already have colors of their own, and are displayed with their levels as usual
+        prerendered = frame.lut is not None and img.ndim == 2
+        if prerendered:
+            img = self.colorize(img, mini, maxi, frame.lut)
+        colored = time.perf_counter()
+
+        self.stage_times["reshape"] += reshaped - start
+        self.stage_times["process"] += processed - reshaped
+        self.stage_times["levels"] += leveled - processed
+        self.stage_times["color"] += colored - leveled
+        self.frames_processed += 1
+        return [mini, maxi, img, prerendered]
+
+    def colorize(self, image, mini, maxi, lut):
+        """
+        Color an image with a lookup table spanning the levels mini to maxi.
+
+        Parameters
+        ----------
+        image : np.ndarray
+        mini : float
+        maxi : float
+        lut : np.ndarray
+            The RGBA lookup table, as a (N, 4) uint8 array.
+
+        Returns
+        -------
+        np.ndarray
+            The RGBA image, as a uint8 array.
+        """
+        if image.dtype.kind not in "ui" or image.dtype.itemsize > 2:
+            return apply_lut(image, mini, maxi, lut)
+        info = np.iinfo(image.dtype)
+        key = (image.dtype, mini, maxi, lut.tobytes())
+        if self._value_colors[0] != key:
+            values = np.arange(info.min, info.max + 1, dtype=image.dtype)
+            self._value_colors = (key, apply_lut(values, mini, maxi, lut))
+        table = self._value_colors[1]
+        if info.min == 0:
+            return lookup_colors(table, image)
+        return lookup_colors(table, image.astype(np.intp) - info.min)
 
 
 class PyDMImageView(ImageView, PyDMWidget):
@@ -189,6 +437,10 @@ class PyDMImageView(ImageView, PyDMWidget):
         self.image_waveform = np.zeros(0)
         self._image_width = 0
         self._normalize_data = False
+        self._normalize_percentile = 0.0
+        self._prerender_image = False
+        # RGBA lookup table of the colormap, used when the image is colored by the image thread
+        self._render_lut = None
         self._auto_downsample = True
         self._show_axes = False
 
@@ -206,7 +458,12 @@ class PyDMImageView(ImageView, PyDMWidget):
         ImageView.__init__(self, parent, view=plot_item)
         PyDMWidget.__init__(self)
         self._channels = [None, None]
+        # The long-lived thread preparing the images, started with the first one
         self.thread = None
+        self._frames_received = 0
+        self._frames_skipped = 0
+        self._frames_displayed = 0
+        self._display_time = 0.0
         self.axes = dict({"t": None, "x": 0, "y": 1, "c": None})
         self.showAxes = self._show_axes
         self.imageItem.setOpts(axisOrder="row-major")
@@ -404,6 +661,10 @@ class PyDMImageView(ImageView, PyDMWidget):
         self.getView().getViewBox().setBackgroundColor(cmap.map(0))
         lut = cmap.getLookupTable(0.0, 1.0, alpha=False)
         self.getImageItem().setLookupTable(lut)
+        self._render_lut = cmap.getLookupTable(0.0, 1.0, alpha=True)
+        if self._prerender_image and self.image_waveform.size > 0:
+            # The image on display was colored with the previous colormap
+            self.needs_redraw = True
 
     @Slot(bool)
     def image_connection_state_changed(self, conn):
@@ -438,6 +699,10 @@ class PyDMImageView(ImageView, PyDMWidget):
         if new_image is None or new_image.size == 0:
             return
         logging.debug("ImageView Received New Image - Needs Redraw -> True")
+        self._frames_received += 1
+        if self.needs_redraw:
+            # The previous image was never drawn
+            self._frames_skipped += 1
         self.image_waveform = new_image
         self.needs_redraw = True
 
@@ -454,6 +719,9 @@ class PyDMImageView(ImageView, PyDMWidget):
         if new_width is None:
             return
         self._image_width = int(new_width)
+        # A flat image received before its width can now be drawn
+        if self.image_waveform.ndim == 1 and self.image_waveform.size > 0:
+            self.needs_redraw = True
 
     def process_image(self, image):
         """
@@ -481,15 +749,56 @@ class PyDMImageView(ImageView, PyDMWidget):
         """
         Set the image data into the ImageItem, if needed.
 
-        If necessary, reshape the image to 2D first.
+        The latest image is handed to the image thread, which reshapes it to
+        2D if necessary and processes it. If the thread is still busy with a
+        previous image, only the latest one waiting is kept.
         """
-        if self.thread is not None and not self.thread.isFinished():
-            logger.warning("Image processing has taken longer than the refresh rate.")
+        if not self.needs_redraw:
             return
-        self.thread = ImageUpdateThread(self)
-        self.thread.updateSignal.connect(self.__updateDisplay)
-        logging.debug("ImageView RedrawImage Thread Launched")
-        self.thread.start()
+        self.needs_redraw = False
+        if self.thread is None:
+            self.thread = ImageUpdateThread(self)
+            self.thread.updateSignal.connect(self.__updateDisplay)
+            self.destroyed.connect(self.thread.stop)
+            logging.debug("ImageView RedrawImage Thread Launched")
+            self.thread.start()
+        self.thread.post(
+            ImageFrame(
+                self.image_waveform,
+                self.imageWidth,
+                self.readingOrder,
+                self._dimension_order,
+                self._normalize_data,
+                self.cm_min,
+                self.cm_max,
+                self._render_lut if self._prerender_image else None,
+                self._normalize_percentile,
+            )
+        )
+
+    def image_statistics(self):
+        """
+        Counts and timings of the images received and displayed.
+
+        Returns
+        -------
+        dict
+            The number of images received, dropped without being displayed
+            and displayed, and the mean time in seconds spent per image on the
+            reshape, process_image, levels and display stages.
+        """
+        thread = self.thread
+        processed = thread.frames_processed if thread is not None else 0
+        statistics = {
+            "frames_received": self._frames_received,
+            "frames_dropped": self._frames_skipped + (thread.frames_dropped if thread is not None else 0),
+            "frames_displayed": self._frames_displayed,
+        }
+        for stage in ImageUpdateThread.STAGES:
+            total = thread.stage_times[stage] if thread is not None else 0.0
+            statistics[stage + "_time"] = total / processed if processed else 0.0
+        statistics["display_time"] = self._display_time / self._frames_displayed if self._frames_displayed else 0.0
+        return statistics
 
     def toggleRedraw(self) -> bool:
         """
@@ -507,10 +816,19 @@ class PyDMImageView(ImageView, PyDMWidget):
     @Slot(list)
     def __updateDisplay(self, data):
         logging.debug("ImageView Update Display with new image")
+        start = time.perf_counter()
         mini, maxi = data[0], data[1]
-        img = data[2]
-        self.getImageItem().setLevels([mini, maxi])
-        self.getImageItem().setImage(img, autoLevels=False, autoDownsample=self.autoDownsample)
+        img, prerendered = data[2], data[3]
+        if prerendered:
+            # Already colored by the image thread, so displayed as is. Downsampling would turn it back into
+            # floating point data needing levels, while Qt scales the colored image cheaply when drawing it.
+            self.getImageItem().setLevels(None, update=False)
+            self.getImageItem().setImage(img, autoLevels=False, autoDownsample=False)
+        else:
+            self.getImageItem().setLevels([mini, maxi])
+            self.getImageItem().setImage(img, autoLevels=False, autoDownsample=self.autoDownsample)
+        self._display_time += time.perf_counter() - start
+        self._frames_displayed += 1
 
     def readAutoDownsample(self) -> bool:
         """
@@ -586,6 +904,68 @@ class PyDMImageView(ImageView, PyDMWidget):
 
     normalizeData = Property(bool, readNormalizeData, setNormalizeData)
 
+    def readNormalizePercentile(self) -> float:
+        """
+        Percentile of the data used as the lower level of normalized colors.
+
+        When 0, normalized colors span the minimum and maximum of the data.
+        Otherwise they span this percentile and its complement, computed
+        over a subsample of the image, so that a few outlier pixels do not
+        wash out the rest of the image.
+
+        Returns
+        -------
+        float
+        """
+        return self._normalize_percentile
+
+    def setNormalizePercentile(self, new_percentile) -> None:
+        """
+        Set the percentile of the data used as the lower level of normalized colors.
+
+        Parameters
+        ----------
+        new_percentile: float
+            Between 0 and 50.
+        """
+        self._normalize_percentile = min(max(float(new_percentile), 0.0), 50.0)
+
+    normalizePercentile = Property(float, readNormalizePercentile, setNormalizePercentile)
+
+    def readPrerenderImage(self) -> bool:
+        """
+        Return True if images are colored by the image thread.
+
+        Returns
+        -------
+        bool
+        """
+        return self._prerender_image
+
+    @Slot(bool)
+    def setPrerenderImage(self, new_value) -> None:
+        """
+        Define if images are colored by the image thread.
+
+        By default the GUI thread scales the image to the colormap levels and
+        applies the colormap when it draws it. When this is set, the image
+        thread does both, and the GUI thread is handed an RGBA image it can
+        draw as is. This keeps the GUI responsive with large images at high
+        rates. Images colored this way are not downsampled, regardless of
+        :attr:`autoDownsample`. Images which already have color channels are
+        displayed as usual.
+
+        Parameters
+        ----------
+        new_value: bool
+        """
+        if self._prerender_image != new_value:
+            self._prerender_image = new_value
+            if self.image_waveform.size > 0:
+                self.needs_redraw = True
+
+    prerenderImage = Property(bool, readPrerenderImage, setPrerenderImage)
+
     def readReadingOrder(self) -> ReadingOrder:
         """
         Return the reading order of the :attr:`imageChannel` array.
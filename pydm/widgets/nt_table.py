@@ -168,6 +168,274 @@ class PythonTableModel(QtCore.QAbstractTableModel):
         self.layoutChanged.emit()
 
 
+def as_column(values) -> np.ndarray:
+    """
+    Converts the values of an NTTable column into a one dimensional numpy array.
+
+    Cells holding sequences themselves are kept as objects.
+
+    Parameters
+    ----------
+    values : iterable
+
+    Returns
+    -------
+    np.ndarray
+    """
+    try:
+        column = np.asarray(values)
+    except ValueError:
+        column = None
+    if column is not None and column.ndim == 1:
+        return column
+    if column is not None and column.ndim == 0:
+        raise TypeError("NTTable value items must be iterables.")
+    cells = np.empty(len(values), dtype=object)
+    for i, cell in enumerate(values):
+        cells[i] = cell
+    return cells
+
+
+class NumpyTableModel(QtCore.QAbstractTableModel):
+    """
+    Table model storing the table as one numpy array per column.
+
+    Cells are only formatted when the view asks for them. When new columns
+    are set, the rows are compared with the previous ones and only the runs of
+    changed rows are reported, with the rows added or removed at the end
+    inserted or removed instead of resetting the whole model. Sorting keeps
+    the columns in place and sorts a permutation of the row indices instead.
+
+    Parameters
+    ----------
+    column_names : list
+        The names displayed in the horizontal header.
+    columns : list, optional
+        The values of each column.
+    parent : QObject, optional
+        The parent of the model, passed to the edit method.
+    edit_method : callable, optional
+        Called with the parent, row, column and new value of an edited cell.
+        The row is the position of the row in the columns, not in the view.
+        Returns True if the edit was accepted.
+    can_edit_method : callable, optional
+        Called with the value of a cell, returns True if it can be edited.
+    """
+
+    def __init__(self, column_names, columns=None, parent=None, edit_method=None, can_edit_method=None):
+        super().__init__(parent)
+        self.parent = parent
+        self._column_names = list(column_names)
+        self._columns = []
+        self._row_count = 0
+        # Position in the columns of the row displayed at each row of the view, None when not sorted
+        self._order = None
+        self._sort_column = -1
+        self._sort_order = QtCore.Qt.AscendingOrder
+        self.edit_method = edit_method
+        self.can_edit_method = can_edit_method
+        if columns is not None:
+            self.set_columns(columns)
+
+    @property
+    def columns(self):
+        return self._columns
+
+    def set_columns(self, columns) -> None:
+        """
+        Set the values of the table, reporting only the rows that changed.
+
+        Parameters
+        ----------
+        columns : list
+            The values of each column, the table has as many rows as its shortest column.
+        """
+        new_columns = [as_column(column) for column in columns]
+        new_row_count = min((len(column) for column in new_columns), default=0)
+        new_columns = [column[:new_row_count] for column in new_columns]
+        old_columns, old_row_count = self._columns, self._row_count
+        if len(new_columns) != len(old_columns) or (self._order is not None and new_row_count != old_row_count):
+            self.beginResetModel()
+            self._columns, self._row_count = new_columns, new_row_count
+            self._order = self._sorted_order()
+            self.endResetModel()
+            return
+
+        common = min(old_row_count, new_row_count)
+        changed = np.zeros(common, dtype=bool)
+        for old_column, new_column in zip(old_columns, new_columns):
+            changed |= self._changed_cells(old_column[:common], new_column[:common])
+
+        if new_row_count > old_row_count:
+            self.beginInsertRows(QtCore.QModelIndex(), old_row_count, new_row_count - 1)
+            self._columns, self._row_count = new_columns, new_row_count
+            self.endInsertRows()
+        elif new_row_count < old_row_count:
+            self.beginRemoveRows(QtCore.QModelIndex(), new_row_count, old_row_count - 1)
+            self._columns, self._row_count = new_columns, new_row_count
+            self.endRemoveRows()
+        else:
+            self._columns = new_columns
+
+        changed_rows = np.flatnonzero(changed)
+        if self._order is not None:
+            old_order = self._order
+            new_order = self._sorted_order()
+            if not np.array_equal(old_order, new_order):
+                self._change_order(new_order)
+            changed_rows = np.sort(self._view_rows()[changed_rows])
+        self._emit_data_changed(changed_rows)
+
+    @staticmethod
+    def _changed_cells(old_column, new_column) -> np.ndarray:
+        """Returns the mask of the cells that differ between two columns of the same length."""
+        old_kind, new_kind = old_column.dtype.kind, new_column.dtype.kind
+        if old_kind != new_kind and not (old_kind in "biufc" and new_kind in "biufc"):
+            return np.ones(len(new_column), dtype=bool)
+        try:
+            changed = np.asarray(old_column != new_column, dtype=bool)
+        except (TypeError, ValueError):
+            return np.ones(len(new_column), dtype=bool)
+        if changed.shape != (len(new_column),):
+            # Cells holding sequences are not compared element by element
+            return np.ones(len(new_column), dtype=bool)
+        if old_kind in "fc" and new_kind in "fc":
+            changed &= ~(np.isnan(old_column) & np.isnan(new_column))
+        return changed
+
+    def _emit_data_changed(self, view_rows) -> None:
+        """Emits dataChanged once for each run of consecutive rows of the view."""
+        if len(view_rows) == 0:
+            return
+        breaks = np.flatnonzero(np.diff(view_rows) > 1)
+        first_rows = view_rows[np.concatenate(([0], breaks + 1))]
+        last_rows = view_rows[np.concatenate((breaks, [len(view_rows) - 1]))]
+        last_column = self.columnCount() - 1
+        for first_row, last_row in zip(first_rows, last_rows):
+            self.dataChanged.emit(self.index(int(first_row), 0), self.index(int(last_row), last_column))
+
+    def _sorted_order(self):
+        """Returns the permutation of the rows sorting the table on the sort column, or None when not sorted."""
+        if not 0 <= self._sort_column < len(self._columns):
+            return None
+        column = self._columns[self._sort_column]
+        try:
+            order = np.argsort(column, kind="stable")
+        except TypeError:
+            # Columns of mixed types are sorted on their text
+            order = np.argsort(column.astype(str), kind="stable")
+        if self._sort_order == QtCore.Qt.DescendingOrder:
+            order = order[::-1]
+        return order
+
+    def _view_rows(self) -> np.ndarray:
+        """Returns the row of the view displaying each row of the columns."""
+        if self._order is None:
+            return np.arange(self._row_count)
+        view_rows = np.empty(self._row_count, dtype=int)
+        view_rows[self._order] = np.arange(self._row_count)
+        return view_rows
+
+    def _change_order(self, new_order) -> None:
+        """Changes the permutation of the rows, moving the persistent indexes (like the selection) with them."""
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()
+        old_rows = [self.data_row(index.row()) for index in old_indexes]
+        self._order = new_order
+        view_rows = self._view_rows()
+        new_indexes = [self.index(int(view_rows[row]), index.column()) for row, index in zip(old_rows, old_indexes)]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+
+    def data_row(self, row: int) -> int:
+        """
+        The position in the columns of a row of the view.
+
+        Parameters
+        ----------
+        row : int
+
+        Returns
+        -------
+        int
+        """
+        if self._order is None:
+            return row
+        return int(self._order[row])
+
+    # QAbstractItemModel Implementation
+    def clear(self):
+        self.set_columns([[] for _ in self._column_names])
+
+    def flags(self, index):
+        f = QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsEnabled
+        if self.edit_method is not None:
+            editable = True
+            if self.can_edit_method is not None:
+                editable = self.can_edit_method(self._columns[index.column()][self.data_row(index.row())])
+            if editable:
+                f = f | QtCore.Qt.ItemIsEditable
+        return f
+
+    def rowCount(self, parent=None):
+        if parent is not None and parent.isValid():
+            return 0
+        return self._row_count
+
+    def columnCount(self, parent=None):
+        return len(self._column_names)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if index.row() >= self.rowCount():
+            return None
+        if index.column() >= self.columnCount():
+            return None
+        if role == QtCore.Qt.DisplayRole:
+            if index.column() >= len(self._columns):
+                return ""
+            return str(self._columns[index.column()][self.data_row(index.row())])
+        else:
+            return None
+
+    def setData(self, index, value, role=QtCore.Qt.EditRole):
+        if self.edit_method is None:
+            return False
+        if role != QtCore.Qt.EditRole:
+            return False
+        if not index.isValid():
+            return False
+        if index.row() >= self.rowCount():
+            return False
+        if index.column() >= self.columnCount():
+            return False
+
+        success = self.edit_method(self.parent, self.data_row(index.row()), index.column(), value)
+
+        if success:
+            self.dataChanged.emit(index, index)
+        return success
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role != QtCore.Qt.DisplayRole:
+            return super().headerData(section, orientation, role)
+        if orientation == QtCore.Qt.Horizontal and section < self.columnCount():
+            return str(self._column_names[section])
+        elif orientation == QtCore.Qt.Vertical and section < self.rowCount():
+            return self.data_row(section)
+
+    def sort(self, col, order=QtCore.Qt.AscendingOrder):
+        self._sort_column = col
+        self._sort_order = order
+        new_order = self._sorted_order()
+        if new_order is None and self._order is None:
+            return
+        self._change_order(new_order)
+
+    # End QAbstractItemModel implementation.
+
+
 class PyDMNTTable(QtWidgets.QWidget, PyDMWritableWidget):
     """
     The PyDMNTTable is a table widget used to display PVA NTTable data.
@@ -256,9 +524,10 @@ class PyDMNTTable(QtWidgets.QWidget, PyDMWritableWidget):
             labels = list(labels)
 
         try:
-            values = list(zip(*[v for k, v in data.items() if k != "labels"]))
+            values = [as_column(v) for k, v in data.items() if k != "labels"]
         except TypeError:
             logger.exception("NTTable value items must be iterables.")
+            return
 
         self._table_values = values
 
@@ -269,10 +538,11 @@ class PyDMNTTable(QtWidgets.QWidget, PyDMWritableWidget):
                 self.edit_method = None
 
             self._table_labels = labels
-            self._model = PythonTableModel(labels, initial_list=values, parent=self, edit_method=self.edit_method)
+            self._model = NumpyTableModel(labels, columns=values, parent=self, edit_method=self.edit_method)
             self._table.setModel(self._model)
         else:
-            self._model.list = values
+            # Only the rows that changed are updated in the view
+            self._model.set_columns(values)
 
     def send_table(self, row, column, value):
         """
@@ -1,6 +1,7 @@
 import json
 import logging
-import functools
+import threading
+import time
 import weakref
 
 from qtpy.QtCore import Qt, QThread, QMutex, Signal, Slot
@@ -11,9 +12,21 @@ from .channel import PyDMChannel
 
 import numpy as np
 import math
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
+# Names available to every rule expression besides ``ch``. Built once, and copied for each evaluation.
+RULE_BASE_ENV = MappingProxyType(
+    dict(
+        {k: v for k, v in math.__dict__.items() if k[0] != "_"},
+        np=np,
+        QColor=QColor,
+        QBrush=QBrush,
+        __builtins__=__builtins__,
+    )
+)
+
 
 def unregister_widget_rules(widget):
     """
@@ -95,6 +108,17 @@ class RulesDispatcher(object):
         """
         self.rules_engine.register(widget, rules)
 
+    def rule_statistics(self):
+        """
+        Evaluation counts and timings of the rules registered with the
+        RulesEngine thread. See :meth:`RulesEngine.rule_statistics`.
+
+        Returns
+        -------
+        list
+        """
+        return self.rules_engine.rule_statistics()
+
     def unregister(self, widget):
         """
         Unregister widget rules with the RulesEngine thread.
@@ -110,30 +134,147 @@ class RulesDispatcher(object):
         else:
             self.rules_engine.unregister(weakref.ref(widget))
 
-    def dispatch(self, payload):
+    def dispatch(self, payloads):
         """
-        Callback invoked when the RulesEngine evaluate a rule and send new value
-        to the widget. This dispatcher is a bridge between the Thread and the
+        Callback invoked when the RulesEngine evaluate rules and send new values
+        to the widgets. This dispatcher is a bridge between the Thread and the
         widgets.
 
+        All the payloads are applied in one pass, with the updates of each
+        widget suppressed until its properties are all set. When there are
+        several payloads for the same property of a widget, only the last one
+        is applied.
+
         Parameters
         ----------
-        payload : dict
-            The payload data including the widget for method invoking.
+        payloads : list
+            The payload data including the widget for method invoking, one
+            dictionary per rule result. A single dictionary is also accepted.
         """
-        try:
-            widget = payload.pop("widget")
-            if isinstance(widget, weakref.ref):
-                widget_ref = widget
-                widget = widget()
-            if widget is None:  # Widget is dead... lets unregister the ref
+        if isinstance(payloads, dict):
+            payloads = [payloads]
+
+        latest = dict()
+        for payload in payloads:
+            try:
+                latest[(payload.get("widget"), payload.get("property"))] = payload
+            except TypeError:
+                # The widget is dead and its weakref can not be hashed anymore
+                continue
+        by_widget = dict()
+        for (widget, _), payload in latest.items():
+            by_widget.setdefault(widget, []).append(payload)
+
+        for widget_ref, widget_payloads in by_widget.items():
+            widget = widget_ref() if isinstance(widget_ref, weakref.ref) else widget_ref
+            if widget is None and isinstance(widget_ref, weakref.ref):
+                # Widget is dead... lets unregister the ref
                 self.rules_engine.unregister(widget_ref)
-            else:
-                widget.rule_evaluated(payload)
+                continue
+            self._apply(widget, widget_payloads)
+
+    def _apply(self, widget, payloads):
+        """Apply the rule results of a widget with its updates suppressed."""
+        suppress = isinstance(widget, QWidget)
+        try:
+            if suppress:
+                updates_enabled = widget.updatesEnabled()
+                widget.setUpdatesEnabled(False)
         except RuntimeError:
             logger.debug("Widget reference was gone but not yet for Python.")
-        except Exception:
-            logger.exception("Error at RulesDispatcher.")
+            return
+        try:
+            for payload in payloads:
+                try:
+                    payload.pop("widget")
+                    widget.rule_evaluated(payload)
+                except RuntimeError:
+                    logger.debug("Widget reference was gone but not yet for Python.")
+                except Exception:
+                    logger.exception("Error at RulesDispatcher.")
+        finally:
+            if suppress:
+                try:
+                    widget.setUpdatesEnabled(updates_enabled)
+                except RuntimeError:
+                    pass
+
+
+class RuleChannel(object):
+    """
+    Subscription to a channel shared by every rule that uses its address.
+
+    A single PyDMChannel is connected per address, and the connection state,
+    values and enum strings it receives are forwarded to the RulesEngine
+    callbacks of each interested rule.
+
+    Parameters
+    ----------
+    engine : RulesEngine
+        The engine the updates are forwarded to.
+    address : str
+        The address of the channel.
+    """
+
+    def __init__(self, engine, address):
+        self.engine = engine
+        self.address = address
+        # (widget_ref, rule index, channel index) of every interested rule, to whether it triggers the rule
+        self.listeners = dict()
+        self.connected = False
+        self.enums = None
+        self.has_value = False
+        self.value = None
+        self.channel = PyDMChannel(
+            address,
+            connection_slot=self.connection_changed,
+            value_slot=self.value_changed,
+            enum_strings_slot=self.enums_changed,
+        )
+
+    def add_listener(self, widget_ref, index, ch_index, trigger):
+        """
+        Forward the updates of the channel to a rule, starting with what the
+        channel already received.
+
+        Parameters
+        ----------
+        widget_ref : weakref
+            A weakref to the widget owner of the rule.
+        index : int
+            The index of the rule.
+        ch_index : int
+            The channel index on the list for this rule.
+        trigger : bool
+            Whether or not this channel should trigger a calculation of the
+            expression
+        """
+        self.listeners[(widget_ref, index, ch_index)] = trigger
+        if self.connected:
+            self.engine.callback_conn(widget_ref, index, ch_index, True)
+        if self.enums is not None:
+            self.engine.callback_enum(widget_ref, index, ch_index, self.enums)
+        if self.has_value:
+            self.engine.callback_value(widget_ref, index, ch_index, trigger, self.value)
+
+    def remove_listener(self, widget_ref, index, ch_index):
+        self.listeners.pop((widget_ref, index, ch_index), None)
+
+    def connection_changed(self, value):
+        self.connected = value
+        for widget_ref, index, ch_index in list(self.listeners):
+            self.engine.callback_conn(widget_ref, index, ch_index, value)
+
+    def value_changed(self, value):
+        self.has_value = True
+        self.value = value
+        for (widget_ref, index, ch_index), trigger in list(self.listeners.items()):
+            self.engine.callback_value(widget_ref, index, ch_index, trigger, value)
+
+    def enums_changed(self, enums):
+        self.enums = enums
+        for widget_ref, index, ch_index in list(self.listeners):
+            self.engine.callback_enum(widget_ref, index, ch_index, enums)
 
 
 class RulesEngine(QThread):
@@ -141,13 +282,19 @@ class RulesEngine(QThread):
     RulesEngine inherits from QThread and is responsible evaluating the rules
     for all the widgets in the application.
 
+    Channel callbacks queue the rules they trigger, and the thread sleeps
+    until there is a rule to evaluate, so rules that do not change cost
+    nothing.
+
     Signals
     -------
-    rule_signal : dict
-        Emitted when a new value for the property is calculated by the engine.
+    rule_signal : list
+        Emitted with the new values for the properties calculated by the
+        engine, one dictionary per rule. The results of all the rules evaluated
+        in one pass are emitted together.
     """
 
-    rule_signal = Signal(dict)
+    rule_signal = Signal(list)
     disconnect_request = Signal(object, bool)  # channel, destroying
 
     def __init__(self):
@@ -156,8 +303,21 @@ class RulesEngine(QThread):
         self.app.aboutToQuit.connect(self.requestInterruption)
         self.map_lock = QMutex()
         self.widget_map = dict()
+        # RuleChannel of every address used by the registered rules
+        self.channel_map = dict()
+        # Rules waiting to be evaluated as (widget_ref, rule index) keys, in the order they were triggered.
+        # A rule triggered again before being evaluated is only evaluated once.
+        self._queue_condition = threading.Condition()
+        self._dirty = dict()
+        # Rules triggered before their minimum interval elapsed, with the time they can be evaluated again
+        self._deferred = dict()
         self.disconnect_request.connect(self._on_disconnect_request, Qt.QueuedConnection)
 
+    def requestInterruption(self):
+        QThread.requestInterruption(self)
+        with self._queue_condition:
+            self._queue_condition.notify()
+
     def widget_destroyed(self, ref):
         self.unregister(ref)
 
@@ -181,18 +341,15 @@ class RulesEngine(QThread):
             item["enums"] = [None] * len(channels_list)
             item["conn"] = [False] * len(channels_list)
             item["channels"] = []
-
-            for ch_idx, ch in enumerate(channels_list):
-                conn_cb = functools.partial(self.callback_conn, widget_ref, idx, ch_idx)
-                value_cb = functools.partial(self.callback_value, widget_ref, idx, ch_idx, ch["trigger"])
-                enums_cb = functools.partial(self.callback_enum, widget_ref, idx, ch_idx)
-                c = PyDMChannel(
-                    ch["channel"],
-                    connection_slot=conn_cb,
-                    value_slot=value_cb,
-                    enum_strings_slot=enums_cb,
-                )
-                item["channels"].append(c)
+            item["code"] = self.compile_expression(rule)
+            item["evaluations"] = 0
+            item["errors"] = 0
+            item["eval_time"] = 0.0
+            item["min_interval"] = float(rule.get("min_interval", 0) or 0)
+            item["last_eval"] = None
+
+            for ch in channels_list:
+                item["channels"].append(ch["channel"])
             rules_db.append(item)
 
             if initial_val and not is_qt_designer():
@@ -200,9 +357,72 @@ class RulesEngine(QThread):
 
         if rules_db:
             self.widget_map[widget_ref] = rules_db
-            for rule in rules_db:
-                for ch in rule["channels"]:
-                    ch.connect()
+            new_channels = []
+            for idx, rule in enumerate(rules_db):
+                for ch_idx, (address, ch) in enumerate(zip(rule["channels"], rule["rule"]["channels"])):
+                    rule_channel = self.channel_map.get(address)
+                    if rule_channel is None:
+                        rule_channel = RuleChannel(self, address)
+                        self.channel_map[address] = rule_channel
+                        new_channels.append(rule_channel)
+                    rule_channel.add_listener(widget_ref, idx, ch_idx, ch["trigger"])
+            for rule_channel in new_channels:
+                rule_channel.channel.connect()
+
+    @staticmethod
+    def compile_expression(rule):
+        """
+        Compile the expression of a rule so that it is parsed only once.
+
+        Parameters
+        ----------
+        rule : dict
+            The definition of the rule.
+
+        Returns
+        -------
+        code or None
+            The compiled expression, or None if it is not valid Python.
+        """
+        expression = rule.get("expression", "")
+        name = rule.get("name")
+        try:
+            return compile(expression, f"<rule {name}>", "eval")
+        except (SyntaxError, ValueError, TypeError):
+            logger.exception(
+                f"Error while compiling Rule with name: {name} and type: {rule.get('property')} "
+                f"and expression: {expression}"
+            )
+            return None
+
+    def rule_statistics(self):
+        """
+        Evaluation counts and timings of every registered rule.
+
+        Returns
+        -------
+        list
+            One dictionary per rule with the widget, the rule name, property
+            and expression, the number of evaluations and of failed
+            evaluations, and the total and mean evaluation time in seconds.
+        """
+        statistics = []
+        for widget_ref, rules in self.widget_map.copy().items():
+            for rule in rules:
+                evaluations = rule["evaluations"]
+                statistics.append(
+                    {
+                        "widget": widget_ref(),
+                        "name": rule["rule"].get("name"),
+                        "property": rule["rule"].get("property"),
+                        "expression": rule["rule"].get("expression"),
+                        "evaluations": evaluations,
+                        "errors": rule["errors"],
+                        "total_time": rule["eval_time"],
+                        "mean_time": rule["eval_time"] / evaluations if evaluations else 0.0,
+                    }
+                )
+        return statistics
 
     @Slot(object, bool)
     def _on_disconnect_request(self, channel, destroying):
@@ -222,10 +442,16 @@ class RulesEngine(QThread):
         if not w_data:
             return
 
-        for rule in w_data:
-            for ch in rule["channels"]:
-                destroying = widget_ref() is None
-                self.disconnect_request.emit(ch, destroying)
+        for idx, rule in enumerate(w_data):
+            for ch_idx, address in enumerate(rule["channels"]):
+                rule_channel = self.channel_map.get(address)
+                if rule_channel is None:
+                    continue
+                rule_channel.remove_listener(widget_ref, idx, ch_idx)
+                if not rule_channel.listeners:
+                    # The last rule using this address is gone
+                    del self.channel_map[address]
+                    self.disconnect_request.emit(rule_channel.channel, False)
 
         del w_data
 
@@ -233,13 +459,65 @@ class RulesEngine(QThread):
         if is_qt_designer():
             return
 
-        while not self.isInterruptionRequested():
-            w_map = self.widget_map.copy()
-            for widget_ref, rules in w_map.items():
-                for idx, rule in enumerate(rules):
-                    if rule["calculate"]:
-                        self.calculate_expression(widget_ref, idx, rule)
-            self.msleep(33)  # 30Hz
+        while True:
+            with self._queue_condition:
+                while not self._dirty and not self.isInterruptionRequested():
+                    timeout = None
+                    if self._deferred:
+                        timeout = max(min(self._deferred.values()) - time.monotonic(), 0)
+                    self._queue_condition.wait(timeout)
+                    self._release_deferred()
+                if self.isInterruptionRequested():
+                    return
+                # Other rules may keep the queue busy, so deferred rules are also released here
+                self._release_deferred()
+                dirty, self._dirty = self._dirty, dict()
+
+            # Only the last result for each widget property is kept
+            results = dict()
+            for widget_ref, idx in dirty:
+                try:
+                    rule = self.widget_map[widget_ref][idx]
+                except (KeyError, IndexError, TypeError):
+                    # The widget was unregistered after the rule was triggered
+                    continue
+                if not rule["calculate"]:
+                    continue
+                now = time.monotonic()
+                if rule["min_interval"] and rule["last_eval"] is not None:
+                    due = rule["last_eval"] + rule["min_interval"]
+                    if now < due:
+                        with self._queue_condition:
+                            self._deferred[(widget_ref, idx)] = due
+                        continue
+                rule["last_eval"] = now
+                self.calculate_expression(widget_ref, idx, rule, results)
+            if results:
+                self.rule_signal.emit(list(results.values()))
+
+    def _release_deferred(self):
+        """Queue the deferred rules whose minimum interval has elapsed. Must be called with the queue lock held."""
+        now = time.monotonic()
+        for key, due in list(self._deferred.items()):
+            if due <= now:
+                del self._deferred[key]
+                self._dirty[key] = None
+
+    def schedule(self, widget_ref, index):
+        """
+        Flag a rule for evaluation and wake up the engine thread.
+
+        Parameters
+        ----------
+        widget_ref : weakref
+            A weakref to the widget owner of the rule.
+        index : int
+            The index of the rule to evaluate.
+        """
+        self.widget_map[widget_ref][index]["calculate"] = True
+        with self._queue_condition:
+            self._dirty[(widget_ref, index)] = None
+            self._queue_condition.notify()
 
     def callback_enum(self, widget_ref, index, ch_index, enums):
         """
@@ -272,7 +550,7 @@ class RulesEngine(QThread):
             if not all(w_map[index]["conn"]):
                 self.warn_unconnected_channels(widget_ref, index)
                 return
-            w_map[index]["calculate"] = True
+            self.schedule(widget_ref, index)
         except (KeyError, IndexError):
             pass
 
@@ -305,7 +583,7 @@ class RulesEngine(QThread):
                 if not all(w_map[index]["conn"]):
                     self.warn_unconnected_channels(widget_ref, index)
                     return
-                w_map[index]["calculate"] = True
+                self.schedule(widget_ref, index)
         except (KeyError, IndexError):
             pass
 
@@ -340,11 +618,23 @@ class RulesEngine(QThread):
             self.widget_map[widget_ref][index]["rule"]["name"],
         )
 
-    def calculate_expression(self, widget_ref, idx, rule):
+    def calculate_expression(self, widget_ref, idx, rule, results=None):
         """
         Evaluate the expression defined by the rule and emit the `rule_signal`
         with the new value.
 
+        Parameters
+        ----------
+        widget_ref : weakref
+            A weakref to the widget owner of the rule.
+        idx : int
+            The index of the rule being processed.
+        rule : dict
+            The rule being processed.
+        results : dict, optional
+            When given, the payload with the new value is stored in it, keyed
+            by widget and property, instead of being emitted.
+
         .. warning
 
             This method mutates the input rule in-place
@@ -354,6 +644,10 @@ class RulesEngine(QThread):
         None
         """
         rule["calculate"] = False
+        code = rule["code"]
+        if code is None:
+            # The expression could not be compiled, which was reported at registration
+            return
 
         vals = rule["values"]
         enums = rule["enums"]
@@ -369,19 +663,30 @@ class RulesEngine(QThread):
                     pass
             calc_vals.append(v)
 
-        eval_env = {"np": np, "ch": calc_vals, "QColor": QColor, "QBrush": QBrush}
-        eval_env.update({k: v for k, v in math.__dict__.items() if k[0] != "_"})
+        # ch has to be a global rather than a local for comprehensions in the expression to see it
+        eval_env = dict(RULE_BASE_ENV)
+        eval_env["ch"] = calc_vals
 
         expression = rule["rule"]["expression"]
         name = rule["rule"]["name"]
         prop = rule["rule"]["property"]
+        rule["evaluations"] += 1
+        start = time.perf_counter()
         try:
-            val = eval(expression, eval_env)
-            self.emit_value(widget_ref, name, prop, val)
+            val = eval(code, eval_env)
         except Exception:
+            rule["eval_time"] += time.perf_counter() - start
+            rule["errors"] += 1
             logger.exception(
                 f"Error while evaluating Rule with name: {name} and type: {prop} and expression: {expression}"
             )
+            return
+        rule["eval_time"] += time.perf_counter() - start
+        if results is None:
+            self.emit_value(widget_ref, name, prop, val)
+        else:
+            results.pop((widget_ref, prop), None)
+            results[(widget_ref, prop)] = self.make_payload(widget_ref, name, prop, val)
 
     def emit_value(self, widget_ref, name, prop, val):
         """
@@ -398,5 +703,9 @@ class RulesEngine(QThread):
         val : object
             The value to emit
         """
-        payload = {"widget": widget_ref, "name": name, "property": prop, "value": val}
-        self.rule_signal.emit(payload)
+        self.rule_signal.emit([self.make_payload(widget_ref, name, prop, val)])
+
+    @staticmethod
+    def make_payload(widget_ref, name, prop, val):
+        """Build the payload sent to the RulesDispatcher for a new value of a property."""
+        return {"widget": widget_ref, "name": name, "property": prop, "value": val}
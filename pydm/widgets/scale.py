@@ -1,7 +1,7 @@
 from .base import PyDMWidget, TextFormatter, PostParentClassInitSetup
-from qtpy.QtGui import QColor, QPolygon, QPen, QPainter, QPaintEvent
+from qtpy.QtGui import QColor, QPolygon, QPen, QPainter, QPaintEvent, QPixmap
 from qtpy.QtWidgets import QFrame, QVBoxLayout, QHBoxLayout, QLabel, QSizePolicy, QWidget, QGridLayout
-from qtpy.QtCore import Qt, QPoint
+from qtpy.QtCore import Qt, QPoint, QTimer, QElapsedTimer
 from typing import Optional
 from pydm.utilities import ACTIVE_QT_WRAPPER, QtWrapperTypes
 
@@ -10,6 +10,9 @@ if ACTIVE_QT_WRAPPER == QtWrapperTypes.PYSIDE6:
 else:
     from PyQt5.QtCore import pyqtProperty as Property
 
+# Maximum number of times per second a scale is repainted for new values
+DEFAULT_MAX_FRAME_RATE = 30
+
 
 class QScale(QFrame):
     """
@@ -17,6 +20,11 @@ class QScale(QFrame):
     Configurable features include indicator type (bar/pointer), scale tick
     marks and orientation (horizontal/vertical).
 
+    New values are painted at most ``maxFrameRate`` times per second, and the
+    parts of the scale that do not depend on the value (background, ticks) are
+    kept in a pixmap that is only redrawn when they change, so each new value
+    only costs drawing the indicator.
+
     Parameters
     ----------
     parent : QWidget
@@ -62,6 +70,15 @@ class QScale(QFrame):
         self._origin_at_zero = False
         self._origin_position = 0
 
+        self._static_layer = None
+        self._static_layer_key = None
+        self._max_frame_rate = DEFAULT_MAX_FRAME_RATE
+        # Time since the last paint, to delay the next one when values come in faster than the frame rate
+        self._frame_clock = QElapsedTimer()
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.timeout.connect(self.update)
+
         self.set_position()
 
     def adjust_transformation(self) -> None:
@@ -178,18 +195,11 @@ class QScale(QFrame):
         bg_height = int(self._bg_size_rate * self._widget_height)
         self._painter.drawRect(0, 0, bg_width, bg_height)
 
-    def paintEvent(self, event: QPaintEvent) -> None:
+    def transform_painter(self) -> None:
         """
-        Paint events are sent to widgets that need to update themselves,
-        for instance when part of a widget is exposed because a covering
-        widget was moved.
-
-        Parameters
-        ----------
-        event : QPaintEvent
+        Set up the painter transformations for the orientation, flipping and
+        appearance inversion of the scale.
         """
-        self.adjust_transformation()
-        self._painter.begin(self)
         self._painter.translate(0, self._painter_translation_y)  # Draw vertically if needed
         self._painter.rotate(self._painter_rotation)
         self._painter.translate(self._painter_translation_x, 0)  # Invert appearance if needed
@@ -200,12 +210,101 @@ class QScale(QFrame):
 
         self._painter.setRenderHint(QPainter.Antialiasing)
 
+    def static_layer_key(self) -> tuple:
+        """
+        Everything the static layer of the scale depends on. The cached layer
+        is redrawn whenever this changes.
+        """
+        return (
+            self.width(),
+            self.height(),
+            self.devicePixelRatioF(),
+            self._orientation,
+            self._inverted_appearance,
+            self._flip_scale,
+            self._scale_height,
+            self._lower_limit,
+            self._upper_limit,
+            QColor(self._bg_color).rgba(),
+            self._bg_size_rate,
+            self._show_ticks,
+            self._num_divisions,
+            QColor(self._tick_color).rgba(),
+            self._tick_width,
+            self._tick_size_rate,
+        )
+
+    def draw_static_layer(self) -> None:
+        """
+        Draw the parts of the scale that do not depend on the current value.
+        """
         self.draw_background()
         self.draw_ticks()
+
+    def draw_value_layer(self) -> None:
+        """
+        Draw the parts of the scale that depend on the current value, over the static layer.
+        """
         self.draw_indicator()
 
+    def static_layer(self) -> QPixmap:
+        """
+        The static layer of the scale, redrawn only when one of the
+        properties it depends on has changed.
+        """
+        key = self.static_layer_key()
+        if self._static_layer is None or key != self._static_layer_key:
+            ratio = self.devicePixelRatioF()
+            pixmap = QPixmap(max(int(self.width() * ratio), 1), max(int(self.height() * ratio), 1))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.transparent)
+            self._painter.begin(pixmap)
+            self.transform_painter()
+            self.draw_static_layer()
+            self._painter.end()
+            self._static_layer = pixmap
+            self._static_layer_key = key
+        return self._static_layer
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        """
+        Paint events are sent to widgets that need to update themselves,
+        for instance when part of a widget is exposed because a covering
+        widget was moved.
+
+        Parameters
+        ----------
+        event : QPaintEvent
+        """
+        self._frame_clock.start()
+        self.adjust_transformation()
+        static_layer = self.static_layer()
+        self._painter.begin(self)
+        self._painter.drawPixmap(0, 0, static_layer)
+        self.transform_painter()
+        self.draw_value_layer()
         self._painter.end()
 
+    def schedule_update(self) -> None:
+        """
+        Schedule a repaint of the scale, delayed to keep under the maximum
+        frame rate. Requests made while one is pending are merged into it.
+        """
+        if self._update_timer.isActive():
+            return
+        interval = 1000 / self._max_frame_rate if self._max_frame_rate > 0 else 0
+        elapsed = self._frame_clock.elapsed() if self._frame_clock.isValid() else interval
+        if elapsed >= interval:
+            self.update()
+        else:
+            self._update_timer.start(int(interval - elapsed))
+
+    def get_max_frame_rate(self) -> float:
+        return self._max_frame_rate
+
+    def set_max_frame_rate(self, rate: float) -> None:
+        self._max_frame_rate = max(float(rate), 0)
+
     def calculate_position_for_value(self, value: float) -> int:
         """
         Calculate the position (pixel) in which the pointer should be drawn for a given value.
@@ -243,7 +342,7 @@ class QScale(QFrame):
         Update the position and the drawing of indicator.
         """
         self.set_position()
-        self.repaint()
+        self.schedule_update()
 
     def set_value(self, value: float) -> None:
         """
@@ -1096,3 +1195,29 @@ class PyDMScaleIndicator(QFrame, TextFormatter, PyDMWidget):
         self.update_labels()
 
     userUpperLimit = Property(float, readUserUpperLimit, setUserUpperLimit)
+
+    def readMaxFrameRate(self) -> float:
+        """
+        The maximum number of times per second the scale is repainted for new
+        values. Values received faster than this are shown together in the
+        next frame. 0 repaints for every value.
+
+        Returns
+        -------
+        float
+        """
+        return self.scale_indicator.get_max_frame_rate()
+
+    def setMaxFrameRate(self, rate: float) -> None:
+        """
+        The maximum number of times per second the scale is repainted for new
+        values. Values received faster than this are shown together in the
+        next frame. 0 repaints for every value.
+
+        Parameters
+        ----------
+        rate : float
+        """
+        self.scale_indicator.set_max_frame_rate(rate)
+
+    maxFrameRate = Property(float, readMaxFrameRate, setMaxFrameRate)
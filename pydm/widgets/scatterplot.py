@@ -1,12 +1,12 @@
 import json
 import itertools
 from collections import OrderedDict
-import numpy as np
 from qtpy.QtGui import QColor
 from qtpy.QtCore import Slot, Property, Qt
 from .baseplot import BasePlot, NoDataError, BasePlotCurveItem
 from .channel import PyDMChannel
 from pydm.utilities import remove_protocol
+from pydm.utilities.ring_buffer import RingBuffer
 
 
 DEFAULT_BUFFER_SIZE = 1200
@@ -35,7 +35,7 @@ class ScatterPlotCurveItem(BasePlotCurveItem):
         self.bufferSizeChannel = None
         self.bufferSizeChannel_connected = False
         self._bufferSize = DEFAULT_BUFFER_SIZE
-        self.data_buffer = np.zeros((2, self._bufferSize), order="f", dtype=float)
+        self._data_ring = RingBuffer(self._bufferSize, track_extrema=True)
         self.points_accumulated = 0
         self.latest_x_value = None
         self.latest_y_value = None
@@ -199,9 +199,7 @@ class ScatterPlotCurveItem(BasePlotCurveItem):
             if self.needs_new_y or self.needs_new_x:
                 return
         # If you get this far, we are OK to add the latest data to the buffer.
-        self.data_buffer = np.roll(self.data_buffer, -1)
-        self.data_buffer[0, -1] = self.latest_x_value
-        self.data_buffer[1, -1] = self.latest_y_value
+        self._data_ring.append(self.latest_x_value, self.latest_y_value)
         if self.points_accumulated < self._bufferSize:
             self.points_accumulated = self.points_accumulated + 1
         self.needs_new_x = True
@@ -210,7 +208,25 @@ class ScatterPlotCurveItem(BasePlotCurveItem):
 
     def initialize_buffer(self):
         self.points_accumulated = 0
-        self.data_buffer = np.zeros((2, self._bufferSize), order="f", dtype=float)
+        self._data_ring = RingBuffer(self._bufferSize, track_extrema=True)
+
+    @property
+    def data_buffer(self):
+        """
+        The data of this curve as an array of shape (2, bufferSize), with the
+        x values in row 0, the y values in row 1 and the most recent point in
+        the last column. Accessing it rotates the underlying circular buffer
+        into chronological order.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return self._data_ring.linearize()
+
+    @data_buffer.setter
+    def data_buffer(self, data):
+        self._data_ring.assign(data)
 
     def getBufferSize(self):
         return int(self._bufferSize)
@@ -285,9 +301,10 @@ class ScatterPlotCurveItem(BasePlotCurveItem):
         Called by the curve's parent plot whenever the curve needs to be
         re-drawn with new data.
         """
+        data = self._data_ring.latest(self.points_accumulated)
         self.setData(
-            x=self.data_buffer[0, -self.points_accumulated :].astype(float),
-            y=self.data_buffer[1, -self.points_accumulated :].astype(float),
+            x=data[0].astype(float),
+            y=data[1].astype(float),
         )
 
     def limits(self):
@@ -301,9 +318,11 @@ class ScatterPlotCurveItem(BasePlotCurveItem):
         """
         if self.points_accumulated == 0:
             raise NoDataError("Curve has no data, cannot determine limits.")
-        x_data = self.data_buffer[0, -self.points_accumulated :]
-        y_data = self.data_buffer[1, -self.points_accumulated :]
-        return ((float(np.amin(x_data)), float(np.amax(x_data))), (float(np.amin(y_data)), float(np.amax(y_data))))
+        # The ring buffer keeps running minimums and maximums, so this does not rescan the data
+        return (
+            self._data_ring.extrema(0, self.points_accumulated),
+            self._data_ring.extrema(1, self.points_accumulated),
+        )
 
     def channels(self):
         return [self.y_channel, self.x_channel]
@@ -788,6 +788,18 @@ class PyDMSlider(QFrame, TextFormatter, PyDMWritableWidget):
         super().connection_changed(connected)
         self.set_enable_state()
 
+    def alarm_styled_children(self):
+        """
+        The value label is colored by the alarm severity of the slider in the
+        default stylesheet.
+
+        Returns
+        -------
+        list
+        """
+        value_label = getattr(self, "value_label", None)
+        return [value_label] if value_label is not None else []
+
     def write_access_changed(self, new_write_access):
         """
         Callback invoked when the Channel has new write access value.
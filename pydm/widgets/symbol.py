@@ -2,10 +2,11 @@ import os
 import json
 import logging
 from qtpy.QtWidgets import QApplication, QWidget, QStyle, QStyleOption
-from qtpy.QtGui import QPainter, QPixmap
-from qtpy.QtCore import Qt, QSize, QSizeF, QRectF, qInstallMessageHandler
+from qtpy.QtGui import QPainter
+from qtpy.QtCore import Qt, QSize, QSizeF, QRectF
 from qtpy.QtSvg import QSvgRenderer
 from pydm.utilities import find_file
+from pydm.utilities.image_cache import image_cache
 from .base import PyDMWidget, PostParentClassInitSetup
 from pydm.utilities import ACTIVE_QT_WRAPPER, QtWrapperTypes
 
@@ -40,7 +41,11 @@ class PyDMSymbol(QWidget, PyDMWidget):
         self.app = QApplication.instance()
         self._current_key = 0
         self._state_images_string = ""
-        self._state_images = {}  # Keyed on state values (ints), values are (filename, qpixmap or qsvgrenderer) tuples.
+        # Keyed on state values (ints), values are (filename, qpixmap or qsvgrenderer, file path) tuples.
+        # The images are shared with every other widget showing the same file.
+        self._state_images = {}
+        # The animated SVG renderers this widget repaints on, which are also shared with other widgets
+        self._animated_images = []
         self._aspect_ratio_mode = Qt.KeepAspectRatio
         self._sizeHint = self.minimumSizeHint()
         self._painter = QPainter()
@@ -99,11 +104,15 @@ class PyDMSymbol(QWidget, PyDMWidget):
         new_files : str
         """
         self._state_images_string = str(new_files)
+        for image in self._animated_images:
+            image.repaintNeeded.disconnect(self.update)
+        self._animated_images = []
         try:
             new_file_dict = json.loads(self._state_images_string)
         except Exception:
             self._state_images = {}
             return
+        self._state_images = {}
         self._sizeHint = QSize(0, 0)
         parent_display = self.find_parent_display()
         base_path = None
@@ -112,30 +121,19 @@ class PyDMSymbol(QWidget, PyDMWidget):
 
         for state, filename in new_file_dict.items():
             file_path = find_file(filename, base_path=base_path)
-            # First, lets try SVG.  We have to try SVG first, otherwise
-            # QPixmap will happily load the SVG and turn it into a raster image.
-            # Really annoying: We have to try to load the file as SVG,
-            # and we expect it will fail often (because many images aren't SVG).
-            # Qt prints a warning message to stdout any time SVG loading fails.
-            # So we have to temporarily silence Qt warning messages here.
-            qInstallMessageHandler(self.qt_message_handler)
-            svg = QSvgRenderer()
-            svg.repaintNeeded.connect(self.update)
-            if file_path is not None and svg.load(file_path):
-                self._state_images[int(state)] = (filename, svg)
-                self._sizeHint = self._sizeHint.expandedTo(svg.defaultSize())
-                qInstallMessageHandler(None)
-                continue
-            qInstallMessageHandler(None)
-            # SVG didn't work, lets try QPixmap
-            image = QPixmap(file_path) if file_path is not None else QPixmap()
-            if not image.isNull():
-                self._state_images[int(state)] = (filename, image)
+            image = image_cache().load(file_path) if file_path is not None else None
+            if isinstance(image, QSvgRenderer):
+                # Animated SVGs are rendered directly on every frame instead of from a cached rasterization
+                if image.animated() and image not in self._animated_images:
+                    image.repaintNeeded.connect(self.update)
+                    self._animated_images.append(image)
+                self._sizeHint = self._sizeHint.expandedTo(image.defaultSize())
+            elif image is not None:
                 self._sizeHint = self._sizeHint.expandedTo(image.size())
-                continue
-            # If we get this far, the file specified could not be loaded at all.
-            logger.error("Could not load image: {}".format(filename))
-            self._state_images[int(state)] = (filename, None)
+            else:
+                # If we get this far, the file specified could not be loaded at all.
+                logger.error("Could not load image: {}".format(filename))
+            self._state_images[int(state)] = (filename, image, file_path)
 
     imageFiles = Property(str, readImageFiles, setImageFiles)
 
@@ -232,29 +230,22 @@ class PyDMSymbol(QWidget, PyDMWidget):
         if self._current_key is None:
             self._painter.end()
             return
-        image_to_draw = self._state_images.get(self._current_key, (None, None))[1]
+        _, image_to_draw, file_path = self._state_images.get(self._current_key, (None, None, None))
         if image_to_draw is None:
             self._painter.end()
             return
-        if isinstance(image_to_draw, QPixmap):
-            w = float(image_to_draw.width())
-            h = float(image_to_draw.height())
-            if self._aspect_ratio_mode == Qt.IgnoreAspectRatio:
-                scale = (event.rect().width() / w, event.rect().height() / h)
-            elif self._aspect_ratio_mode == Qt.KeepAspectRatio:
-                sf = min(event.rect().width() / w, event.rect().height() / h)
-                scale = (sf, sf)
-            elif self._aspect_ratio_mode == Qt.KeepAspectRatioByExpanding:
-                sf = max(event.rect().width() / w, event.rect().height() / h)
-                scale = (sf, sf)
-            self._painter.scale(scale[0], scale[1])
-            self._painter.drawPixmap(event.rect().x(), event.rect().y(), image_to_draw)
-        elif isinstance(image_to_draw, QSvgRenderer):
+        if isinstance(image_to_draw, QSvgRenderer):
             draw_size = QSizeF(image_to_draw.defaultSize())
-            draw_size.scale(QSizeF(event.rect().size()), self._aspect_ratio_mode)
-            image_to_draw.render(self._painter, QRectF(0.0, 0.0, draw_size.width(), draw_size.height()))
+        else:
+            draw_size = QSizeF(image_to_draw.size())
+        draw_size.scale(QSizeF(self.rect().size()), self._aspect_ratio_mode)
+        target = QRectF(0.0, 0.0, draw_size.width(), draw_size.height())
+        if isinstance(image_to_draw, QSvgRenderer) and image_to_draw.animated():
+            image_to_draw.render(self._painter, target)
+        else:
+            # Draw the rasterization of the image at this size, shared by all symbols of about the same size
+            pixmap = image_cache().rendered(file_path, draw_size.toSize(), self.devicePixelRatioF())
+            if pixmap is not None:
+                self._painter.setRenderHint(QPainter.SmoothPixmapTransform)
+                self._painter.drawPixmap(target, pixmap, QRectF(pixmap.rect()))
         self._painter.end()
-
-    def qt_message_handler(self, msg_type, *args):
-        # Intentionally suppress all qt messages.  Make sure not to leave this handler installed.
-        pass
@@ -9,6 +9,7 @@ from qtpy.QtCore import Signal, Slot, QTimer
 from .baseplot import BasePlot, BasePlotCurveItem
 from .channel import PyDMChannel
 from pydm.utilities import remove_protocol, ACTIVE_QT_WRAPPER, QtWrapperTypes
+from pydm.utilities.ring_buffer import RingBuffer
 from datetime import datetime
 from pydm.utilities import ACTIVE_QT_WRAPPER, QtWrapperTypes
 
@@ -119,7 +120,7 @@ class TimePlotCurveItem(BasePlotCurveItem):
         self._min_y_value = None
         self._max_y_value = None
 
-        self.data_buffer = np.zeros((2, self._bufferSize), order="f", dtype=float)
+        self._data_ring = RingBuffer(self._bufferSize)
         self.connected = False
         self.points_accumulated = 0
         self.latest_value = None
@@ -135,6 +136,7 @@ class TimePlotCurveItem(BasePlotCurveItem):
     def to_dict(self):
         dic_ = OrderedDict([("channel", self.address), ("plot_style", self.plot_style)])
         dic_.update(super().to_dict())
+        dic_["lodMode"] = self.lodMode
         return dic_
 
     @property
@@ -169,6 +171,26 @@ class TimePlotCurveItem(BasePlotCurveItem):
             self.initialize_buffer()
             self.redrawCurve()
 
+    @property
+    def data_buffer(self):
+        """
+        The live data of this curve as an array of shape (2, bufferSize).
+
+        Row 0 holds the timestamps and row 1 the values, with the most recent
+        point in the last column. Samples are stored in a circular buffer, so
+        accessing this property rotates the storage into chronological order
+        first; hot paths should use the curve's own accessors instead.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return self._data_ring.linearize()
+
+    @data_buffer.setter
+    def data_buffer(self, data):
+        self._data_ring.assign(data)
+
     @property
     def plotByTimeStamps(self):
         return self._plot_by_timestamps
@@ -272,11 +294,9 @@ class TimePlotCurveItem(BasePlotCurveItem):
         self.update_min_max_y_values(new_value)
 
         if self._update_mode == PyDMTimePlot.OnValueChange:
-            self.data_buffer = np.roll(self.data_buffer, -1)
             # The first array row is to record timestamps, when a new value arrives.
-            self.data_buffer[0, self._bufferSize - 1] = time.time()
             # The second array row is to record the actual values.
-            self.data_buffer[1, self._bufferSize - 1] = new_value
+            self._data_ring.append(time.time(), new_value)
 
             if self.points_accumulated < self._bufferSize:
                 self.points_accumulated += 1
@@ -293,9 +313,7 @@ class TimePlotCurveItem(BasePlotCurveItem):
         """
         if self._update_mode != PyDMTimePlot.AtFixedRate:
             return
-        self.data_buffer = np.roll(self.data_buffer, -1)
-        self.data_buffer[0, self._bufferSize - 1] = time.time()
-        self.data_buffer[1, self._bufferSize - 1] = self.latest_value
+        self._data_ring.append(time.time(), self.latest_value)
         if self.points_accumulated < self._bufferSize:
             self.points_accumulated = self.points_accumulated + 1
         self.data_changed.emit()
@@ -325,8 +343,8 @@ class TimePlotCurveItem(BasePlotCurveItem):
 
         # If you don't specify dtype=float, you don't have enough
         # resolution for the timestamp data.
-        self.data_buffer = np.zeros((2, self._bufferSize), order="f", dtype=float)
-        self.data_buffer[0].fill(time.time())
+        self._data_ring = RingBuffer(self._bufferSize)
+        self._data_ring.fill(0, time.time())
 
     def getBufferSize(self):
         return int(self._bufferSize)
@@ -357,20 +375,23 @@ class TimePlotCurveItem(BasePlotCurveItem):
         live_data_length = len(data[0])
         min_x = data[0][0]
         max_x = data[0][live_data_length - 1]
+        # Searching and splicing need the samples in chronological order, so rotate the ring buffer once
+        buffer = self._data_ring.linearize()
         # Get the indices between which we want to insert the data
-        min_insertion_index = np.searchsorted(self.data_buffer[0], min_x)
-        max_insertion_index = np.searchsorted(self.data_buffer[0], max_x)
+        min_insertion_index = np.searchsorted(buffer[0], min_x)
+        max_insertion_index = np.searchsorted(buffer[0], max_x)
         # Delete any non-raw data between the indices so we don't have multiple data points for the same timestamp
-        self.data_buffer = np.delete(self.data_buffer, slice(min_insertion_index, max_insertion_index), axis=1)
+        buffer = np.delete(buffer, slice(min_insertion_index, max_insertion_index), axis=1)
         num_points_deleted = max_insertion_index - min_insertion_index
         delta_points = live_data_length - num_points_deleted
         if live_data_length > num_points_deleted:
             # If the insertion will overflow the data buffer, need to delete the oldest points
-            self.data_buffer = np.delete(self.data_buffer, slice(0, delta_points), axis=1)
+            buffer = np.delete(buffer, slice(0, delta_points), axis=1)
         else:
-            self.data_buffer = np.insert(self.data_buffer, [0], np.zeros((2, delta_points)), axis=1)
-        min_insertion_index = np.searchsorted(self.data_buffer[0], min_x)
-        self.data_buffer = np.insert(self.data_buffer, [min_insertion_index], data[0:2], axis=1)
+            buffer = np.insert(buffer, [0], np.zeros((2, delta_points)), axis=1)
+        min_insertion_index = np.searchsorted(buffer[0], min_x)
+        buffer = np.insert(buffer, [min_insertion_index], data[0:2], axis=1)
+        self._data_ring.assign(buffer)
 
         self.points_accumulated += live_data_length - num_points_deleted
 
@@ -393,8 +414,12 @@ class TimePlotCurveItem(BasePlotCurveItem):
             The maximum timestamp to render when plotting as a bar graph.
         """
         try:
-            x = self.data_buffer[0, -self.points_accumulated :].astype(float)
-            y = self.data_buffer[1, -self.points_accumulated :].astype(float)
+            if self._lod_mode and (self.plot_style is None or self.plot_style == "Line"):
+                data = self.lod_data(min_x, max_x)
+            else:
+                data = self.live_data()
+            x = data[0].astype(float)
+            y = data[1].astype(float)
 
             if not self._plot_by_timestamps:
                 x -= time.time()
@@ -412,6 +437,61 @@ class TimePlotCurveItem(BasePlotCurveItem):
             # Solve an issue with pyqtgraph and initial downsampling
             pass
 
+    def lod_window(self, min_x: Optional[float] = None, max_x: Optional[float] = None):
+        """
+        Returns the range of timestamps to draw with level of detail rendering. This is the visible
+        range, extended by its width on each side so that panning does not reveal an empty plot
+        before the next redraw.
+
+        Parameters
+        ----------
+        min_x: float, optional
+            The minimum x-value visible on the plot.
+        max_x: float, optional
+            The maximum x-value visible on the plot.
+
+        Returns
+        -------
+        tuple or None
+            The (minimum, maximum) timestamps, or None to draw all of the data.
+        """
+        if min_x is None or max_x is None or max_x <= min_x:
+            return None
+        if not self._plot_by_timestamps:
+            # The x-axis shows the time relative to now
+            now = time.time()
+            min_x += now
+            max_x += now
+        span = max_x - min_x
+        return min_x - span, max_x + span
+
+    def lod_data(self, min_x: Optional[float] = None, max_x: Optional[float] = None) -> np.ndarray:
+        """
+        Returns the live data to draw with level of detail rendering: the minimum and maximum
+        values for each horizontal pixel, over the range given by lod_window.
+
+        Parameters
+        ----------
+        min_x: float, optional
+            The minimum x-value visible on the plot.
+        max_x: float, optional
+            The maximum x-value visible on the plot.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (2, n) with the timestamps and values of the points to draw.
+        """
+        count = self.points_accumulated
+        window = self.lod_window(min_x, max_x)
+        if window is None:
+            return self._data_ring.decimate(1, count, self.lod_max_points())
+        # Keep the points just outside the window so the line reaches its edges
+        start = max(self._data_ring.searchsorted(0, window[0], count) - 1, 0)
+        stop = min(self._data_ring.searchsorted(0, window[1], count, side="right") + 1, count)
+        # The window is three times as wide as the view
+        return self._data_ring.decimate(1, count, 3 * self.lod_max_points(), start, stop)
+
     def _setBarGraphItem(self, x, y):
         """Set the plots points to render as bars. No need to call this directly as it will automatically
         be handled by redrawCurve()"""
@@ -451,7 +531,7 @@ class TimePlotCurveItem(BasePlotCurveItem):
         float
             The timestamp of the most recent data point recorded into the data buffer.
         """
-        return self.data_buffer[0, -self.points_accumulated]
+        return self._data_ring.item(0, -self.points_accumulated)
 
     def max_x(self):
         """
@@ -463,7 +543,22 @@ class TimePlotCurveItem(BasePlotCurveItem):
         float
             The timestamp of the most recent data point recorded into the data buffer.
         """
-        return self.data_buffer[0, -1]
+        return self._data_ring.item(0, -1)
+
+    def live_data(self):
+        """
+        Provide the accumulated points of the data buffer in chronological order.
+
+        Unlike data_buffer, this does not rotate the underlying circular
+        buffer, and only copies data when the points wrap around its end.
+
+        Returns
+        -------
+        np.ndarray
+            An array of shape (2, points_accumulated) with timestamps in row 0
+            and values in row 1.
+        """
+        return self._data_ring.latest(self.points_accumulated)
 
     def channels(self):
         return [self.channel]
@@ -831,6 +926,7 @@ class PyDMTimePlot(BasePlot):
                 lowerThreshold=d.get("lowerThreshold"),
                 thresholdColor=thresholdColor,
                 yAxisName=d.get("yAxisName"),
+                lodMode=d.get("lodMode", False),
             )
 
     curves = Property("QStringList", getCurves, setCurves, designable=False)
@@ -1,6 +1,6 @@
-from qtpy.QtWidgets import QTableWidget, QTableWidgetItem, QApplication
+from qtpy.QtWidgets import QTableView, QApplication
 from qtpy.QtGui import QCursor
-from qtpy.QtCore import Slot, Qt, QEvent
+from qtpy.QtCore import Slot, Qt, QEvent, QAbstractTableModel, QModelIndex
 import numpy as np
 from .base import PyDMWritableWidget, PostParentClassInitSetup
 from pydm.utilities import ACTIVE_QT_WRAPPER, QtWrapperTypes
@@ -11,14 +11,150 @@ else:
     from PyQt5.QtCore import pyqtProperty as Property
 
 
-class PyDMWaveformTable(QTableWidget, PyDMWritableWidget):
+class WaveformTableModel(QAbstractTableModel):
     """
-    A QTableWidget with support for Channels and more from PyDM.
+    Table model presenting the elements of a waveform in a number of columns.
+
+    The model holds the waveform as a numpy array and only formats the cells
+    the view asks for, which are the visible ones. When a new waveform of the
+    same length arrives, only the rows with changed elements are reported.
+
+    Parameters
+    ----------
+    parent : QObject, optional
+        The parent object of the model.
+    edit_method : callable, optional
+        Called with the row, column and new text of a cell edited in the view.
+        Returns True if the edit was accepted.
+    """
+
+    def __init__(self, parent=None, edit_method=None):
+        super().__init__(parent)
+        self._waveform = np.zeros(0)
+        self._column_count = 1
+        self._column_headers = []
+        self._row_headers = []
+        self._flags = Qt.ItemIsSelectable | Qt.ItemIsEditable | Qt.ItemIsEnabled
+        self.edit_method = edit_method
+
+    @property
+    def waveform(self):
+        return self._waveform
+
+    def set_waveform(self, new_waveform) -> None:
+        """
+        Set the waveform displayed by the model.
+
+        Parameters
+        ----------
+        new_waveform : np.ndarray
+        """
+        new_waveform = np.array(new_waveform, copy=True).ravel()
+        old_waveform = self._waveform
+        if len(new_waveform) != len(old_waveform) or new_waveform.dtype != old_waveform.dtype:
+            self.beginResetModel()
+            self._waveform = new_waveform
+            self.endResetModel()
+            return
+        changed = new_waveform != old_waveform
+        if new_waveform.dtype.kind in "fc":
+            changed &= ~(np.isnan(new_waveform) & np.isnan(old_waveform))
+        self._waveform = new_waveform
+        changed_rows = np.unique(np.flatnonzero(changed) // self._column_count)
+        if len(changed_rows) == 0:
+            return
+        # Report each run of consecutive changed rows with a single signal
+        breaks = np.flatnonzero(np.diff(changed_rows) > 1)
+        first_rows = changed_rows[np.concatenate(([0], breaks + 1))]
+        last_rows = changed_rows[np.concatenate((breaks, [len(changed_rows) - 1]))]
+        last_column = self._column_count - 1
+        for first_row, last_row in zip(first_rows, last_rows):
+            self.dataChanged.emit(self.index(int(first_row), 0), self.index(int(last_row), last_column))
+
+    def set_column_count(self, column_count: int) -> None:
+        """
+        Set the number of columns the waveform is laid out in.
+
+        Parameters
+        ----------
+        column_count : int
+        """
+        column_count = max(int(column_count), 1)
+        if column_count != self._column_count:
+            self.beginResetModel()
+            self._column_count = column_count
+            self.endResetModel()
+
+    def set_column_headers(self, headers) -> None:
+        self._column_headers = list(headers)
+        self.headerDataChanged.emit(Qt.Horizontal, 0, self._column_count - 1)
+
+    def set_row_headers(self, headers) -> None:
+        self._row_headers = list(headers)
+        if self.rowCount() > 0:
+            self.headerDataChanged.emit(Qt.Vertical, 0, self.rowCount() - 1)
+
+    def set_flags(self, flags) -> None:
+        self._flags = flags
+
+    # QAbstractItemModel Implementation
+    def rowCount(self, parent=None):
+        if parent is not None and parent.isValid():
+            return 0
+        return -(-len(self._waveform) // self._column_count)
+
+    def columnCount(self, parent=None):
+        if parent is not None and parent.isValid():
+            return 0
+        return self._column_count
+
+    def flags(self, index):
+        if not index.isValid() or self.element_index(index) >= len(self._waveform):
+            return Qt.NoItemFlags
+        return self._flags
+
+    def element_index(self, index: QModelIndex) -> int:
+        """The position in the waveform of the element shown by a cell."""
+        return index.row() * self._column_count + index.column()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        element = self.element_index(index)
+        if element >= len(self._waveform):
+            return None
+        return str(self._waveform[element])
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if self.edit_method is None or role != Qt.EditRole or not index.isValid():
+            return False
+        if self.element_index(index) >= len(self._waveform):
+            return False
+        return bool(self.edit_method(index.row(), index.column(), str(value)))
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return super().headerData(section, orientation, role)
+        headers = self._column_headers if orientation == Qt.Horizontal else self._row_headers
+        if section < len(headers):
+            return str(headers[section])
+        # Sections without a label are numbered, the same way as a QTableWidget
+        return str(section + 1)
+
+    # End QAbstractItemModel implementation.
+
+
+class PyDMWaveformTable(QTableView, PyDMWritableWidget):
+    """
+    A QTableView with support for Channels and more from PyDM.
 
     Values of the array are displayed in the selected number of columns.
     The number of rows is determined by the size of the waveform.
     It is possible to define the labels of each row and column.
 
+    The cells are not widgets or items, only the visible ones are formatted
+    from the waveform, and a new waveform only repaints the rows that changed.
+
     Parameters
     ----------
     parent : QWidget
@@ -28,15 +164,15 @@ class PyDMWaveformTable(QTableWidget, PyDMWritableWidget):
     """
 
     def __init__(self, parent=None, init_channel=None):
-        QTableWidget.__init__(self, parent)
+        QTableView.__init__(self, parent)
         PyDMWritableWidget.__init__(self, init_channel=init_channel)
         self._columnHeaders = ["Value"]
         self._rowHeaders = []
         self._itemsFlags = Qt.ItemIsSelectable | Qt.ItemIsEditable | Qt.ItemIsEnabled
         self.waveform = None
-        self._valueBeingSet = False
-        self.setColumnCount(1)
-        self.cellChanged.connect(self.send_waveform)
+        self._model = WaveformTableModel(parent=self, edit_method=self.send_waveform)
+        self._model.set_column_headers(self._columnHeaders)
+        self.setModel(self._model)
         # Execute setup calls that must be done here in the widget class's __init__,
         # and after it's parent __init__ calls have completed.
         # (so we can avoid pyside6 throwing an error, see func def for more info)
@@ -57,24 +193,11 @@ class PyDMWaveformTable(QTableWidget, PyDMWritableWidget):
             The new waveform value from the channel.
         """
         PyDMWritableWidget.value_changed(self, new_waveform)
-        self._valueBeingSet = True
         self.waveform = new_waveform
-        col_count = self.columnCount()
-        len_wave = len(new_waveform)
-        row_count = len_wave // col_count + (1 if len_wave % col_count else 0)
-        self.setRowCount(row_count)
-        for ind, element in enumerate(new_waveform):
-            i, j = ind // col_count, ind % col_count
-            value_cell = QTableWidgetItem(str(element))
-            value_cell.setFlags(self._itemsFlags)
-            self.setItem(i, j, value_cell)
+        self._model.set_waveform(new_waveform)
 
-        self.setVerticalHeaderLabels(self._rowHeaders)
-        self.setHorizontalHeaderLabels(self._columnHeaders)
-        self._valueBeingSet = False
-
-    @Slot(int, int)
-    def send_waveform(self, row, column):
+    @Slot(int, int, str)
+    def send_waveform(self, row, column, text):
         """Update Channel value when cell value is changed.
 
         Parameters
@@ -83,15 +206,27 @@ class PyDMWaveformTable(QTableWidget, PyDMWritableWidget):
             Row of the changed cell.
         column : int
             Column of the changed cell.
+        text : str
+            The new value of the cell.
+
+        Returns
+        -------
+        bool
+            True if the new value was sent to the channel.
         """
-        if self._valueBeingSet:
-            return
-        item = self.item(row, column)
-        if item and self.subtype:
-            new_val = self.subtype(item.text())
-            ind = row * self.columnCount() + column
-            self.waveform[ind] = new_val
-            self.send_value_signal[np.ndarray].emit(self.waveform)
+        if self.waveform is None or not self.subtype:
+            return False
+        ind = row * self.columnCount() + column
+        if ind >= len(self.waveform):
+            return False
+        try:
+            new_val = self.subtype(text)
+        except (TypeError, ValueError):
+            return False
+        self.waveform[ind] = new_val
+        self._model.set_waveform(self.waveform)
+        self.send_value_signal[np.ndarray].emit(self.waveform)
+        return True
 
     def check_enable_state(self):
         """
@@ -106,11 +241,11 @@ class PyDMWaveformTable(QTableWidget, PyDMWritableWidget):
             self._itemsFlags = Qt.ItemIsSelectable | Qt.ItemIsEnabled
         else:
             self._itemsFlags = Qt.ItemIsSelectable
-        for col in range(0, self.columnCount()):
-            for row in range(0, self.rowCount()):
-                item = self.item(row, col)
-                if item is not None:
-                    item.setFlags(self._itemsFlags)
+        # Checks if _model attribute exists because the base class can call this method
+        # before the object constructor is complete
+        if hasattr(self, "_model"):
+            self._model.set_flags(self._itemsFlags)
+            self.viewport().update()
 
     def eventFilter(self, obj, event):
         status = self._connected
@@ -120,6 +255,52 @@ class PyDMWaveformTable(QTableWidget, PyDMWritableWidget):
             QApplication.setOverrideCursor(QCursor(Qt.ForbiddenCursor))
         return False
 
+    def columnCount(self) -> int:
+        """The number of columns the waveform is displayed in."""
+        return self._model.columnCount()
+
+    def setColumnCount(self, columns: int) -> None:
+        """
+        Set the number of columns the waveform is displayed in.
+
+        Parameters
+        ----------
+        columns : int
+        """
+        self._model.set_column_count(columns)
+
+    def rowCount(self) -> int:
+        """The number of rows needed to display the waveform."""
+        return self._model.rowCount()
+
+    def setHorizontalHeaderLabels(self, labels) -> None:
+        self._model.set_column_headers(labels)
+
+    def setVerticalHeaderLabels(self, labels) -> None:
+        self._model.set_row_headers(labels)
+
+    def readNumberOfColumns(self) -> int:
+        """
+        The number of columns the waveform is displayed in.
+
+        Returns
+        -------
+        int
+        """
+        return self.columnCount()
+
+    def setNumberOfColumns(self, columns: int) -> None:
+        """
+        The number of columns the waveform is displayed in.
+
+        Parameters
+        ----------
+        columns : int
+        """
+        self.setColumnCount(columns)
+
+    numberOfColumns = Property(int, readNumberOfColumns, setNumberOfColumns)
+
     def readColumnHeaderLabels(self) -> list[str]:
         """
         Return the list of labels for the columns of the Table.